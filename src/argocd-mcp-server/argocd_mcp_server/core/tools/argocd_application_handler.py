@@ -1,42 +1,54 @@
-from typing import List, Optional, Dict, Any, Union
+import aiohttp
+import orjson
+import os
 from argocd_mcp_server.models.application import (
+    ApplicationDestination,
+    ApplicationMetadata,
     ApplicationModel,
+    ApplicationSource,
+    ApplicationSpec,
+    ApplicationStatus,
     CreateApplicationRequest,
     CreateApplicationResponse,
-    UpdateApplicationRequest,
-    UpdateApplicationResponse,
     DeleteApplicationRequest,
     DeleteApplicationResponse,
-    ApplicationMetadata,
-    ApplicationSpec,
-    ApplicationSource,
-    ApplicationDestination,
-    SyncPolicy,
-    SyncPolicyAutomated,
-    ApplicationMetadata,
-    ApplicationSpec,
-    ApplicationSource,
-    ApplicationDestination,
-    SyncPolicy,
-    ApplicationStatus,
-    SyncApplicationResponse,
-    SyncApplicationRequest,
     GetApplicationRequest,
     GetApplicationResponse,
+    SyncApplicationRequest,
+    SyncApplicationResponse,
+    SyncPolicy,
+    SyncPolicyAutomated,
+    UpdateApplicationRequest,
+    UpdateApplicationResponse,
+    freeze_str_map,
 )
+from argocd_mcp_server.models.encoding import encode
 from argocd_mcp_server.utils.argocd_api_helper import (
+    STATUS_MESSAGES,
+    SharedSession,
+    argocd_api_delete,
     argocd_api_get,
     argocd_api_post,
-    argocd_api_put,
-    argocd_api_delete,
     argocd_api_post_sync,
+    argocd_api_put,
 )
+from argocd_mcp_server.utils.cache import ResponseCache
+from argocd_mcp_server.utils.logger import (
+    log_debug,
+    log_error,
+    log_info,
+    log_success,
+    log_tool_execution,
+)
+from argocd_mcp_server.utils.request_context import (
+    bind_request_context,
+    current_request_id,
+    current_user,
+)
+from mcp.server.fastmcp import Context
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 
-from argocd_mcp_server.utils.logger import log_tool_execution, log_success, log_error, log_info
-import os
-import requests
-import json
-from pydantic import Field
 
 class ArgoCDApplicationHandler:
     """
@@ -50,6 +62,8 @@ class ArgoCDApplicationHandler:
         server_url: Optional[str] = None,
         allow_write: bool = False,
         bypass_tls: bool = False,
+        shared_session: Optional[SharedSession] = None,
+        shared_cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the ArgoCD application handler.
@@ -60,29 +74,37 @@ class ArgoCDApplicationHandler:
             server_url (str, optional): ArgoCD server URL. If not provided, will be fetched from ARGOCD_SERVER_URL env var
             allow_write (bool): Whether to allow write operations (default: False)
             bypass_tls (bool): Whether to bypass TLS verification
+            shared_session (SharedSession, optional): Pooled session shared with other handlers.
+                If not provided, the handler opens and closes its own
+            shared_cache (ResponseCache, optional): The resource handler's listing cache,
+                cleared after every successful write so reads don't serve pre-write data
         """
         self.mcp = mcp
         self.token = token or os.environ.get("ARGOCD_TOKEN")
-        self.server_url = server_url or os.environ.get("ARGOCD_SERVER_URL")
+        # Normalized once so helpers can append API paths without re-checking slashes
+        self.server_url = (server_url or os.environ.get("ARGOCD_SERVER_URL") or "").rstrip("/")
         self.allow_write = allow_write
         self.bypass_tls = bypass_tls
+        # Pooled HTTP session, created lazily on the running event loop; only
+        # closed by this handler when it is not shared with others
+        self._owns_session = shared_session is None
+        self._shared_session = shared_session or SharedSession(bypass_tls)
+        self._cache = shared_cache
         
         if not self.token:
             raise ValueError("ArgoCD API token is required. Please provide it or set ARGOCD_TOKEN environment variable.")
         if not self.server_url:
             raise ValueError("ArgoCD server URL is required. Please provide it or set ARGOCD_SERVER_URL environment variable.")
         
-        # Log environment variables for debugging
-        log_info(
-            "ArgoCD environment variables:",
-            tool="argocd_application_handler",
-            request_id=self.request_id,
-            user=self.user,
-            server_url=self.server_url,
-            token_length=len(self.token) if self.token else 0,
-            token_prefix=self.token[:10] + "..." if self.token and len(self.token) > 10 else None,
-            allow_write=allow_write
-        )
+        # Log the effective configuration only when explicitly requested
+        if os.environ.get("ARGOCD_DEBUG_INIT"):
+            log_info(
+                "ArgoCD environment variables:",
+                tool="argocd_application_handler",
+                server_url=self.server_url,
+                token_length=len(self.token) if self.token else 0,
+                allow_write=allow_write
+            )
 
         # Register tools with MCP
         self._register_tools()
@@ -91,6 +113,24 @@ class ArgoCDApplicationHandler:
         """Register all ArgoCD application tools with MCP."""
         self.mcp.tool(name="manage_argocd_application")(self.manage_application)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session shared by all ArgoCD API calls of this handler."""
+        return self._shared_session.get()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session unless it is shared. Called on MCP server shutdown."""
+        if self._owns_session:
+            await self._shared_session.close()
+
+    async def __aenter__(self) -> "ArgoCDApplicationHandler":
+        """Open the pooled HTTP session up front."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the pooled HTTP session."""
+        await self.close()
+
     def _check_write_permission(self, operation: str) -> None:
         """
         Check if write operations are allowed.
@@ -120,28 +160,20 @@ class ArgoCDApplicationHandler:
             Dict[str, Any]: Error response with appropriate status and message
         """
         error_msg = str(e)
-        if isinstance(e, requests.HTTPError):
-            status_code = e.response.status_code
-            try:
-                error_details = e.response.json()
-                error_msg = error_details.get("message", error_msg)
-            except:
-                pass
+        message = None
+        if isinstance(e, aiohttp.ClientResponseError):
+            status_code = e.status
+            error_msg = e.message or error_msg
+            template = STATUS_MESSAGES.get(status_code)
+            if template:
+                message = template.format(app=resource)
         elif isinstance(e, PermissionError):
             status_code = 403
-        elif error_msg.lower() == "success":
-            # Don't treat success messages as errors
-            return {
-                "isError": False,
-                "message": "Operation completed successfully",
-                "status_code": 200,
-                "resource": resource,
-            }
         else:
             status_code = 500
 
         log_error(
-            f"{operation} failed: {error_msg}",
+            "{tool} failed: {error}",
             tool=operation,
             request_id=self.request_id,
             user=self.user,
@@ -151,20 +183,25 @@ class ArgoCDApplicationHandler:
 
         return {
             "isError": True,
-            "message": error_msg,
+            "message": message or error_msg,
             "status_code": status_code,
             "resource": resource,
         }
 
+    def _invalidate_reads(self) -> None:
+        """Drop cached resource reads after a write changed the application."""
+        if self._cache is not None:
+            self._cache.clear()
+
     @property
     def request_id(self) -> str:
-        """Get the current request ID from MCP instance."""
-        return getattr(self.mcp, 'request_id', 'unknown')
+        """Get the ID of the MCP request served by the current task."""
+        return current_request_id()
 
     @property
     def user(self) -> str:
-        """Get the current user from MCP instance."""
-        return getattr(self.mcp, 'user', 'unknown')
+        """Get the client of the MCP request served by the current task."""
+        return current_user()
 
     def _map_application_data(self, data: Dict[str, Any]) -> ApplicationModel:
         """
@@ -176,6 +213,8 @@ class ArgoCDApplicationHandler:
         Returns:
             ApplicationModel: Mapped application model
         """
+        # ArgoCD already returns well-formed objects, so the models are built
+        # without re-running field validation
         try:
             metadata = data.get("metadata", {})
             spec = data.get("spec", {})
@@ -183,7 +222,7 @@ class ArgoCDApplicationHandler:
             
             # Map source data
             source_data = spec.get("source", {})
-            source = ApplicationSource(
+            source = ApplicationSource.model_construct(
                 repo_url=source_data.get("repoURL", ""),
                 path=source_data.get("path", ""),
                 target_revision=source_data.get("targetRevision", "HEAD")
@@ -191,7 +230,7 @@ class ArgoCDApplicationHandler:
 
             # Map destination data
             dest_data = spec.get("destination", {})
-            destination = ApplicationDestination(
+            destination = ApplicationDestination.model_construct(
                 server=dest_data.get("server", ""),
                 namespace=dest_data.get("namespace", "")
             )
@@ -200,29 +239,29 @@ class ArgoCDApplicationHandler:
             sync_policy_data = spec.get("syncPolicy", {})
             sync_policy = None
             if sync_policy_data.get("automated"):
-                sync_policy = SyncPolicy(
-                    automated=SyncPolicyAutomated(
+                sync_policy = SyncPolicy.model_construct(
+                    automated=SyncPolicyAutomated.model_construct(
                         prune=sync_policy_data["automated"].get("prune", True),
                         self_heal=sync_policy_data["automated"].get("selfHeal", True)
                     )
                 )
 
             # Create the application model
-            return ApplicationModel(
-                metadata=ApplicationMetadata(
+            return ApplicationModel.model_construct(
+                metadata=ApplicationMetadata.model_construct(
                     name=metadata.get("name"),
                     namespace=metadata.get("namespace", "argocd"),
                     project=metadata.get("project", "default"),
-                    labels=metadata.get("labels", {}),
-                    annotations=metadata.get("annotations", {})
+                    labels=freeze_str_map(metadata.get("labels", {})),
+                    annotations=freeze_str_map(metadata.get("annotations", {}))
                 ),
-                spec=ApplicationSpec(
+                spec=ApplicationSpec.model_construct(
                     source=source,
                     destination=destination,
                     project=spec.get("project", "default"),
                     sync_policy=sync_policy
                 ),
-                status=ApplicationStatus(
+                status=ApplicationStatus.model_construct(
                     sync_status=status.get("sync", {}).get("status"),
                     health_status=status.get("health", {}).get("status"),
                     conditions=status.get("conditions", [])
@@ -241,7 +280,9 @@ class ArgoCDApplicationHandler:
     def safe_json_dumps(self, obj: Any) -> str:
         """Safely convert an object to JSON string, handling recursive structures."""
         try:
-            return json.dumps(obj, default=str)
+            if isinstance(obj, BaseModel):
+                return encode(obj).decode()
+            return orjson.dumps(obj, default=str).decode()
         except Exception:
             return str(obj)
 
@@ -309,6 +350,7 @@ class ArgoCDApplicationHandler:
             "argocd",
             description="Application namespace (optional, defaults to argocd)"
         ),
+        ctx: Context = None,
     ) -> Any:
         """Manage ArgoCD applications with various operations.
 
@@ -357,10 +399,12 @@ class ArgoCDApplicationHandler:
             prune_propagation_policy (str, optional): Prune propagation policy
             finalizer (bool, optional): Set deletion finalizer
             namespace (str, optional): Application namespace
+            ctx (Context, optional): Request context injected by FastMCP
 
         Returns:
             Response object specific to the operation
         """
+        bind_request_context(ctx)
         try:
             # Check write permissions for write operations
             self._check_write_permission(operation)
@@ -411,29 +455,34 @@ class ArgoCDApplicationHandler:
                     )
                 )
 
-                request = CreateApplicationRequest(
+                # FastMCP has already validated the tool arguments and the application
+                # model above is validated, so the request wrapper skips re-validation
+                request = CreateApplicationRequest.model_construct(
                     application=application_model
                 )
 
                 # Log the request details
-                log_info(f"Creating application with name: {name}")
-                log_info(f"Project: {project}")
-                log_info(f"Repository URL: {repo_url}")
-                log_info(f"Path: {path}")
-                log_info(f"Destination Server: {destination_server}")
+                log_info("Creating application with name: {name}", name=name)
+                log_info("Project: {project}", project=project)
+                log_info("Repository URL: {repo_url}", repo_url=repo_url)
+                log_info("Path: {path}", path=path)
+                log_info("Destination Server: {destination_server}", destination_server=destination_server)
                 if destination_namespace:
-                    log_info(f"Destination Namespace: {destination_namespace}")
+                    log_info("Destination Namespace: {destination_namespace}", destination_namespace=destination_namespace)
                 
-                # Log the full model dump
-                model_dump = request.application.model_dump(exclude_none=True)
-                log_info(f"Full request payload: {json.dumps(model_dump, indent=2)}")
+                # Payloads are only rendered if the record is emitted
+                log_debug(
+                    "Full request payload",
+                    tool="create_application",
+                    payload=lambda: request.application.model_dump(exclude_none=True),
+                )
 
                 log_tool_execution(
                     "Executing create_application",
                     tool="create_application",
                     request_id=self.request_id,
                     user=self.user,
-                    params=model_dump,
+                    params=lambda: request.application.model_dump(exclude_none=True),
                 )
 
                 # Convert the request to the format expected by ArgoCD API
@@ -465,21 +514,28 @@ class ArgoCDApplicationHandler:
                     api_data["spec"]["syncPolicy"] = {
                         "automated": sync_policy_config.automated.model_dump() if sync_policy_config.automated else None,
                         "syncOptions": sync_policy_config.sync_options,
-                        "prunePropagationPolicy": sync_policy_config.prune_propagation_policy,
+                        "prunePropagationPolicy": (
+                            sync_policy_config.prune_propagation_policy.wire
+                            if sync_policy_config.prune_propagation_policy is not None else None
+                        ),
                         "finalizer": sync_policy_config.finalizer
                     }
 
-                log_info(f"API request payload: {json.dumps(api_data, indent=2)}")
+                # Encode the payload once and hand the bytes straight to the HTTP layer
+                body = orjson.dumps(api_data)
+                log_debug("API request payload", tool="create_application", payload=body.decode)
 
                 data = await argocd_api_post(
                     path="/api/v1/applications",
                     token=self.token,
                     server_url=self.server_url,
-                    data=api_data,
-                    bypass_tls=self.bypass_tls
+                    body=body,
+                    bypass_tls=self.bypass_tls,
+                    session=await self._get_session()
                 )
+                self._invalidate_reads()
 
-                return CreateApplicationResponse.success(
+                return CreateApplicationResponse.ok(
                     application=request.application,
                     message=f"Application {name} created successfully"
                 )
@@ -530,7 +586,7 @@ class ArgoCDApplicationHandler:
                     )
                 )
 
-                request = UpdateApplicationRequest(
+                request = UpdateApplicationRequest.model_construct(
                     application=application_model
                 )
 
@@ -539,7 +595,7 @@ class ArgoCDApplicationHandler:
                     tool="update_application",
                     request_id=self.request_id,
                     user=self.user,
-                    params=request.model_dump(exclude_none=True),
+                    params=lambda: request.model_dump(exclude_none=True),
                 )
 
                 # Convert the request to the format expected by ArgoCD API
@@ -571,7 +627,10 @@ class ArgoCDApplicationHandler:
                     api_data["spec"]["syncPolicy"] = {
                         "automated": sync_policy_config.automated.model_dump() if sync_policy_config.automated else None,
                         "syncOptions": sync_policy_config.sync_options,
-                        "prunePropagationPolicy": sync_policy_config.prune_propagation_policy,
+                        "prunePropagationPolicy": (
+                            sync_policy_config.prune_propagation_policy.wire
+                            if sync_policy_config.prune_propagation_policy is not None else None
+                        ),
                         "finalizer": sync_policy_config.finalizer
                     }
 
@@ -579,8 +638,9 @@ class ArgoCDApplicationHandler:
                     f"/api/v1/applications/{name}",
                     self.token,
                     self.server_url,
-                    api_data,
-                    bypass_tls=self.bypass_tls
+                    body=orjson.dumps(api_data),
+                    bypass_tls=self.bypass_tls,
+                    session=await self._get_session()
                 )
 
                 if data is None:
@@ -589,17 +649,19 @@ class ArgoCDApplicationHandler:
                         status_code=404,
                         resource=name
                     )
+                self._invalidate_reads()
 
                 app_model = self._map_application_data(data)
 
                 log_success(
-                    f"update_application succeeded for {name}",
+                    "{tool} succeeded for {resource}",
                     tool="update_application",
                     request_id=self.request_id,
                     user=self.user,
-                    result=app_model.model_dump(),
+                    resource=name,
+                    result=app_model.model_dump,
                 )
-                return UpdateApplicationResponse.success(
+                return UpdateApplicationResponse.ok(
                     application=app_model,
                     message="Application updated successfully."
                 )
@@ -611,7 +673,7 @@ class ArgoCDApplicationHandler:
                         status_code=400
                     )
 
-                request = DeleteApplicationRequest(
+                request = DeleteApplicationRequest.model_construct(
                     name=name,
                     namespace=namespace
                 )
@@ -621,26 +683,27 @@ class ArgoCDApplicationHandler:
                     tool="delete_application",
                     request_id=self.request_id,
                     user=self.user,
-                    params=request.model_dump(),
+                    params=request.model_dump,
                 )
 
                 data = await argocd_api_delete(
                     f"/api/v1/applications/{name}",
                     self.token,
                     self.server_url,
-                    bypass_tls=self.bypass_tls
-                    
+                    bypass_tls=self.bypass_tls,
+                    session=await self._get_session()
                 )
+                self._invalidate_reads()
 
                 log_success(
-                    f"delete_application succeeded for {name}",
+                    "{tool} succeeded for {resource}",
                     tool="delete_application",
                     request_id=self.request_id,
                     user=self.user,
                     resource=name,
                     result=data
                 )
-                return DeleteApplicationResponse.success(
+                return DeleteApplicationResponse.ok(
                     message="Application deleted successfully."
                 )
 
@@ -651,7 +714,7 @@ class ArgoCDApplicationHandler:
                         status_code=400
                     )
 
-                request = SyncApplicationRequest(
+                request = SyncApplicationRequest.model_construct(
                     name=name,
                     namespace=namespace
                 )
@@ -661,7 +724,7 @@ class ArgoCDApplicationHandler:
                     tool="sync_application",
                     request_id=self.request_id,
                     user=self.user,
-                    params=request.model_dump(),
+                    params=request.model_dump,
                 )
 
                 data = await argocd_api_post_sync(
@@ -669,18 +732,20 @@ class ArgoCDApplicationHandler:
                     self.token,
                     self.server_url,
                     data={},  # Empty dict for default sync behavior
-                    bypass_tls=self.bypass_tls
+                    bypass_tls=self.bypass_tls,
+                    session=await self._get_session()
                 )
+                self._invalidate_reads()
 
                 log_success(
-                    f"sync_application succeeded for {name}",
+                    "{tool} succeeded for {resource}",
                     tool="sync_application",
                     request_id=self.request_id,
                     user=self.user,
                     resource=name,
                     result=data
                 )
-                return SyncApplicationResponse.success(
+                return SyncApplicationResponse.ok(
                     message="Application Synced Successfully."
                 )
 
@@ -692,7 +757,7 @@ class ArgoCDApplicationHandler:
                         status_code=400
                     )
 
-                request = GetApplicationRequest(
+                request = GetApplicationRequest.model_construct(
                     name=name
                 )
 
@@ -701,14 +766,15 @@ class ArgoCDApplicationHandler:
                     tool="get_application",
                     request_id=self.request_id,
                     user=self.user,
-                    params=request.model_dump(),
+                    params=request.model_dump,
                 )
 
                 data = await argocd_api_get(
                     f"/api/v1/applications/{name}",
                     self.token,
                     self.server_url,
-                    bypass_tls=self.bypass_tls
+                    bypass_tls=self.bypass_tls,
+                    session=await self._get_session()
                 )
 
                 if data is None:
@@ -718,17 +784,17 @@ class ArgoCDApplicationHandler:
                         resource=name
                     )
 
-                # app_model = self._map_application_data(data)
+                app_model = self._map_application_data(data)
 
                 log_success(
-                    f"get_application succeeded for {name}",
+                    "{tool} succeeded for {resource}",
                     tool="get_application",
                     request_id=self.request_id,
                     user=self.user,
                     resource=name,
                     result=data
                 )
-                return GetApplicationResponse.success(
+                return GetApplicationResponse.ok(
                     application=app_model,
                     message="Application Retrieved Successfully."
                 )
@@ -1,40 +1,205 @@
-from typing import List, Optional, Dict, Any, Union
-from argocd_mcp_server.utils.logger import log_tool_execution, log_success, log_error, log_info
+import aiohttp
+import asyncio
+import functools
+import os
+import time
+from argocd_mcp_server.models.resource import (
+    GetApplicationBundleRequest,
+    GetApplicationManifestRequest,
+    GetManagedResourcesRequest,
+    GetResourceActionsRequest,
+    GetResourceEventsBulkRequest,
+    GetResourceEventsRequest,
+    GetResourceOverviewRequest,
+    GetResourceTreeRequest,
+    GetWorkloadLogsRequest,
+    RunResourceActionRequest,
+)
 from argocd_mcp_server.utils.argocd_api_helper import (
-    argocd_api_get_resource_tree,
+    POOL_LIMIT_PER_HOST,
+    STATUS_MESSAGES,
+    SharedSession,
+    argocd_api_get_application_manifest,
+    argocd_api_get_application_parameters,
     argocd_api_get_managed_resources,
-    argocd_api_get_workload_logs,
-    argocd_api_get_resource_events,
     argocd_api_get_resource_actions,
+    argocd_api_get_resource_events,
+    argocd_api_get_resource_tree,
+    argocd_api_get_workload_logs,
     argocd_api_run_resource_action,
-    argocd_api_get_application_manifest,
-    argocd_api_get_application_parameters
 )
-from argocd_mcp_server.models.resource import (
-    GetResourceTreeRequest,
-    GetManagedResourcesRequest,
-    GetWorkloadLogsRequest,
-    GetResourceEventsRequest,
-    GetResourceActionsRequest,
-    GetResourceTreeResponse,
-    ResourceNode,
-    GetManagedResourcesResponse,
-    GetWorkloadLogsResponse,
-    GetResourceEventsResponse,
-    GetResourceActionsResponse,
-    RunResourceActionResponse,
-    RunResourceActionRequest
-
+from argocd_mcp_server.utils.cache import LISTING_CACHE_TTL, ResponseCache
+from argocd_mcp_server.utils.flow_control import (
+    AdaptiveLimiter,
+    CircuitOpenError,
+    SingleFlight,
+    get_rate_limiter,
 )
-import os
-from pydantic import Field, ConfigDict
-import requests
+from argocd_mcp_server.utils.logger import log_debug, log_error, log_info, preview
+from argocd_mcp_server.utils.request_context import (
+    bind_request_context,
+    current_request_id,
+    current_user,
+)
+from dataclasses import dataclass
+from mcp.server.fastmcp import Context
+from pydantic import BaseModel, Field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+
+@dataclass(slots=True, frozen=True)
+class _OperationSpec:
+    """How manage_resource builds the request for an operation and which handler serves it."""
+    request_cls: Type[BaseModel]
+    required: Tuple[str, ...]
+    handler: str
+    write: bool = False
+    # Composite operations fan out to other operations, each admitted through _dispatch,
+    # so they must not hold an admission slot of their own
+    composite: bool = False
+
+
+# Resource type reported by every resource operation response
+_APP = "application"
+
+
+def _ok(message: str, data: Any) -> Dict[str, Any]:
+    """Build a successful resource operation response."""
+    return {"success": True, "message": message, "data": data, "status_code": 200, "resource": _APP}
+
+
+def _fail(message: str, status_code: int = 500) -> Dict[str, Any]:
+    """Build a failed resource operation response."""
+    return {"success": False, "message": message, "status_code": status_code, "resource": _APP}
+
+
+# Validation failures are constant per missing field, so each is built once and
+# returned as-is; callers treat responses as read-only
+_ERR_REQUIRED = {
+    name: _fail(f"{name.replace('_', ' ').capitalize()} is required", 400)
+    for name in ("application_name", "resource_name", "resource_kind", "action_name")
+}
+
+
+def _frozen(value: Any) -> Any:
+    """Make a tool argument hashable so it can be part of a coalescing key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _frozen(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+def _resource_id(application_name: str, resource_name: Optional[str] = None) -> str:
+    """Identify a resource as "application/resource", or just the application when no resource is given."""
+    if not resource_name:
+        return application_name
+    return application_name + "/" + resource_name
+
+
+@dataclass(slots=True, frozen=True)
+class _ApiCall:
+    """How a resource method calls its ArgoCD API helper and reports the outcome."""
+    api: Callable[..., Awaitable[Any]]
+    args: Tuple[str, ...]
+    kwargs: Tuple[str, ...]
+    required: Tuple[str, ...]
+    subject: str
+    verb: str = "get"
+    action: str = "Getting"
+    done: str = "retrieved"
+    cached: bool = False
+    mutates: bool = False
+
+
+# API helper, request fields and log wording per resource method. Fields in
+# args are passed positionally after server_url and token, kwargs by keyword.
+_RESOURCE_FIELDS = ("application_name", "resource_name", "resource_kind")
+_API_CALLS = {
+    "get_resource_tree": _ApiCall(
+        argocd_api_get_resource_tree, ("application_name",), (), ("application_name",),
+        "resource tree", cached=True,
+    ),
+    "get_managed_resources": _ApiCall(
+        argocd_api_get_managed_resources, ("application_name",), (), ("application_name",),
+        "managed resources", cached=True,
+    ),
+    "get_workload_logs": _ApiCall(
+        argocd_api_get_workload_logs, _RESOURCE_FIELDS,
+        ("namespace", "tail_lines", "container", "since_seconds", "since_time", "follow"),
+        _RESOURCE_FIELDS, "workload logs",
+    ),
+    "get_resource_events": _ApiCall(
+        argocd_api_get_resource_events, _RESOURCE_FIELDS, ("namespace",), _RESOURCE_FIELDS,
+        "resource events",
+    ),
+    "get_resource_actions": _ApiCall(
+        argocd_api_get_resource_actions, _RESOURCE_FIELDS, ("namespace",), _RESOURCE_FIELDS,
+        "resource actions",
+    ),
+    "run_resource_action": _ApiCall(
+        argocd_api_run_resource_action, _RESOURCE_FIELDS + ("action_name",), ("params", "namespace"),
+        _RESOURCE_FIELDS + ("action_name",), "resource action",
+        verb="run", action="Running", done="executed", mutates=True,
+    ),
+    "get_application_manifest": _ApiCall(
+        argocd_api_get_application_manifest, ("application_name",), ("revision",), ("application_name",),
+        "application manifest", cached=True,
+    ),
+    "get_application_parameters": _ApiCall(
+        argocd_api_get_application_parameters, ("application_name",), (), ("application_name",),
+        "application parameters", cached=True,
+    ),
+}
+
+# Success message per resource method, formatted with the application name
+_SUCCESS_MSGS = {
+    name: f"{call.subject.capitalize()} {call.done} successfully for application {{app}}"
+    for name, call in _API_CALLS.items()
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _msg(method: str, app: str) -> str:
+    """Success message for a resource method, memoized per application since polling clients repeat it."""
+    return _SUCCESS_MSGS[method].format(app=app)
+
 
 class ArgoCDResourceHandler:
     """
     Handler class for ArgoCD resource operations.
     Provides a unified interface for managing ArgoCD resources.
     """
+    # Request model, required tool arguments and handler method per operation
+    _OPERATION_SPECS = {
+        "get_resource_tree": _OperationSpec(GetResourceTreeRequest, (), "get_resource_tree"),
+        "get_managed_resources": _OperationSpec(GetManagedResourcesRequest, (), "get_managed_resources"),
+        "get_workload_logs": _OperationSpec(GetWorkloadLogsRequest, ("resource_name",), "get_workload_logs"),
+        "get_resource_events": _OperationSpec(
+            GetResourceEventsRequest, ("resource_name", "resource_kind"), "get_resource_events"
+        ),
+        "get_resource_actions": _OperationSpec(
+            GetResourceActionsRequest, ("resource_name", "resource_kind"), "get_resource_actions"
+        ),
+        "get_resource_overview": _OperationSpec(
+            GetResourceOverviewRequest, ("resource_name", "resource_kind"), "get_resource_overview", composite=True
+        ),
+        "get_resource_events_bulk": _OperationSpec(
+            GetResourceEventsBulkRequest, (), "get_resource_events_bulk", composite=True
+        ),
+        "run_resource_action": _OperationSpec(
+            RunResourceActionRequest, ("resource_name", "resource_kind", "action_name"), "run_resource_action", write=True
+        ),
+        "get_application_manifest": _OperationSpec(
+            GetApplicationManifestRequest, ("revision",), "get_application_manifest"
+        ),
+        "get_application_parameters": _OperationSpec(GetResourceTreeRequest, (), "get_application_parameters"),
+        "get_application_bundle": _OperationSpec(
+            GetApplicationBundleRequest, (), "get_application_bundle", composite=True
+        ),
+    }
+    _VALID_OPS = frozenset(_OPERATION_SPECS)
+
     def __init__(
         self,
         mcp,
@@ -42,6 +207,8 @@ class ArgoCDResourceHandler:
         server_url: Optional[str] = None,
         allow_write: bool = False,
         bypass_tls: bool = False,
+        shared_session: Optional[SharedSession] = None,
+        shared_cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the ArgoCD Resource handler.
@@ -52,30 +219,63 @@ class ArgoCDResourceHandler:
             server_url (str, optional): ArgoCD server URL. If not provided, will be fetched from ARGOCD_SERVER_URL env var
             allow_write (bool): Whether to allow write operations (default: False)
             bypass_tls (bool): Whether to bypass TLS verification (default: False)
+            shared_session (SharedSession, optional): Pooled session shared with other handlers.
+                If not provided, the handler opens and closes its own
+            shared_cache (ResponseCache, optional): Listing cache shared with the application
+                handler, which clears it after writes. If not provided, the handler keeps its own
         """
         self.mcp = mcp
         self.token = token or os.environ.get("ARGOCD_TOKEN")
-        self.server_url = server_url or os.environ.get("ARGOCD_SERVER_URL")
+        # Normalized once so helpers can append API paths without re-checking slashes
+        self.server_url = (server_url or os.environ.get("ARGOCD_SERVER_URL") or "").rstrip("/")
         self.allow_write = allow_write
         self.bypass_tls = bypass_tls
+        # Pooled HTTP session, created lazily on the running event loop; only
+        # closed by this handler when it is not shared with others
+        self._owns_session = shared_session is None
+        self._shared_session = shared_session or SharedSession(bypass_tls)
+        # Concurrent sub-requests of fan-out operations, capped at the pool's per-host connections
+        # so they never queue for one; the semaphore binds to the running loop on first use
+        self.bulk_concurrency = min(int(os.environ.get("ARGOCD_BULK_CONCURRENCY", "20")), POOL_LIMIT_PER_HOST)
+        self._bulk_slots = asyncio.Semaphore(self.bulk_concurrency)
+        # Caps the number of in-flight ArgoCD calls issued by this handler; the
+        # limit backs off on 429/5xx responses and recovers while latency is healthy
+        self.max_concurrency = int(os.environ.get("ARGOCD_MAX_CONCURRENCY", "8"))
+        self._limiter = AdaptiveLimiter(
+            max_limit=self.max_concurrency,
+            min_limit=int(os.environ.get("ARGOCD_MIN_CONCURRENCY", "1")),
+            latency_target=float(os.environ.get("ARGOCD_LATENCY_TARGET", "2.0")),
+        )
+        # Caps requests per second against the ArgoCD host, independent of concurrency
+        self.max_qps = float(os.environ.get("ARGOCD_MAX_QPS", "20"))
+        # Slow-changing listings are served from cache and revalidated with ETags
+        self._cache = shared_cache if shared_cache is not None else ResponseCache(ttl=LISTING_CACHE_TTL)
+        # Identical concurrent reads share one ArgoCD round trip
+        self._inflight = SingleFlight()
+        # Every response on the session, whichever handler issued it, feeds the limiter
+        self._shared_session.add_trace_config(self._limiter.trace_config())
 
         if not self.token:
             raise ValueError("ArgoCD API token is required. Please provide it or set ARGOCD_TOKEN environment variable.")
         if not self.server_url:
             raise ValueError("ArgoCD server URL is required. Please provide it or set ARGOCD_SERVER_URL environment variable.")
+        self._throttle = get_rate_limiter(self.server_url, self.max_qps)
         
-        # Log environment variables for debugging
-        log_info(
-            "ArgoCD environment variables:",
-            tool="argocd_resource_handler",
-            request_id=self.request_id,
-            user=self.user,
-            server_url=self.server_url,
-            token_length=len(self.token) if self.token else 0,
-            token_prefix=self.token[:10] + "..." if self.token and len(self.token) > 10 else None,
-            allow_write=allow_write,
-            bypass_tls=bypass_tls
-        )
+        # Log the effective configuration only when explicitly requested
+        if os.environ.get("ARGOCD_DEBUG_INIT"):
+            log_info(
+                "ArgoCD environment variables:",
+                tool="argocd_resource_handler",
+                server_url=self.server_url,
+                token_length=len(self.token) if self.token else 0,
+                allow_write=allow_write,
+                bypass_tls=bypass_tls
+            )
+
+        # Bind handler methods once instead of rebuilding the dispatch table per call
+        self._operation_map = {
+            name: getattr(self, spec.handler) for name, spec in self._OPERATION_SPECS.items()
+        }
 
         # Register tools with MCP
         self._register_tools()
@@ -84,15 +284,33 @@ class ArgoCDResourceHandler:
         """Register all ArgoCD resource tools with MCP."""
         self.mcp.tool(name="manage_argocd_resource")(self.manage_resource)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session shared by all ArgoCD API calls of this handler."""
+        return self._shared_session.get()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session unless it is shared. Called on MCP server shutdown."""
+        if self._owns_session:
+            await self._shared_session.close()
+
+    async def __aenter__(self) -> "ArgoCDResourceHandler":
+        """Open the pooled HTTP session up front."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the pooled HTTP session."""
+        await self.close()
+
     @property
     def request_id(self) -> str:
-        """Get the current request ID from MCP instance."""
-        return getattr(self.mcp, 'request_id', 'unknown')
+        """Get the ID of the MCP request served by the current task."""
+        return current_request_id()
 
     @property
     def user(self) -> str:
-        """Get the current user from MCP instance."""
-        return getattr(self.mcp, 'user', 'unknown')
+        """Get the client of the MCP request served by the current task."""
+        return current_user()
 
     def _check_write_permission(self, operation: str) -> None:
         """
@@ -110,7 +328,6 @@ class ArgoCDResourceHandler:
                 f"Write operation '{operation}' is not allowed. Set allow_write=True to enable write operations."
             )
 
-
     def _handle_api_error(self, e: Exception, operation: str, resource: str = None) -> Dict[str, Any]:
         """
         Handle API errors consistently across all operations.
@@ -124,20 +341,22 @@ class ArgoCDResourceHandler:
             Dict[str, Any]: Error response with appropriate status and message
         """
         error_msg = str(e)
-        if isinstance(e, requests.HTTPError):
-            status_code = e.response.status_code
-            try:
-                error_details = e.response.json()
-                error_msg = error_details.get("message", error_msg)
-            except:
-                pass
+        message = None
+        if isinstance(e, aiohttp.ClientResponseError):
+            status_code = e.status
+            error_msg = e.message or error_msg
+            template = STATUS_MESSAGES.get(status_code)
+            if template:
+                message = template.format(app=resource)
         elif isinstance(e, PermissionError):
             status_code = 403
+        elif isinstance(e, CircuitOpenError):
+            status_code = 503
         else:
             status_code = 500
 
         log_error(
-            f"{operation} failed: {error_msg}",
+            "{tool} failed: {error}",
             tool=operation,
             request_id=self.request_id,
             user=self.user,
@@ -146,10 +365,15 @@ class ArgoCDResourceHandler:
         )
 
         return {
+            "success": False,
             "isError": True,
-            "message": error_msg,
+            "message": message or f"{operation} failed: {error_msg}",
             "status_code": status_code,
             "resource": resource,
+            "error_details": {
+                "type": type(e).__name__,
+                "message": error_msg,
+            },
         }
 
     async def manage_resource(
@@ -162,9 +386,12 @@ class ArgoCDResourceHandler:
             - get_workload_logs: Get workload logs
             - get_resource_events: Get resource events
             - get_resource_actions: Get resource actions
+            - get_resource_overview: Get resource events and actions in one call
+            - get_resource_events_bulk: Get events for every resource in the application
             - run_resource_action: Run resource action
             - get_application_manifest: Get application manifest
-            - get_application_parameters: Get application parameters""",
+            - get_application_parameters: Get application parameters
+            - get_application_bundle: Get resource tree, managed resources, manifest and parameters in one call""",
         ),
         application_name: str = Field(
             ...,
@@ -176,11 +403,11 @@ class ArgoCDResourceHandler:
         ),
         resource_kind: Optional[str] = Field(
             None,
-            description="Kind of the resource (e.g., Pod, Deployment). Required for get_resource_events, get_resource_actions, and run_resource_action.",
+            description="Kind of the resource (e.g., Pod, Deployment). Required for get_resource_events, get_resource_actions, get_resource_overview, and run_resource_action. Filters the resources of get_resource_events_bulk.",
         ),
         namespace: Optional[str] = Field(
             None,
-            description="Namespace of the resource. Optional for all operations.",
+            description="Namespace of the resource. Optional for all operations; filters the resources of get_resource_events_bulk.",
         ),
         uid: Optional[str] = Field(
             None,
@@ -208,7 +435,7 @@ class ArgoCDResourceHandler:
         ),
         revision: Optional[str] = Field(
             None,
-            description="Revision to get manifest for. Only used for get_application_manifest operation.",
+            description="Revision to get manifest for. Only used for get_application_manifest and get_application_bundle operations.",
         ),
         action_name: Optional[str] = Field(
             None,
@@ -218,6 +445,7 @@ class ArgoCDResourceHandler:
             None,
             description="Parameters for the action. Only used for run_resource_action operation.",
         ),
+        ctx: Context = None,
     ) -> Any:
         """Manage ArgoCD application resources with various operations.
 
@@ -242,17 +470,23 @@ class ArgoCDResourceHandler:
         - **get_workload_logs**: Retrieve logs from application workloads
         - **get_resource_events**: Get events related to a specific resource
         - **get_resource_actions**: List available actions for a resource
+        - **get_resource_overview**: Get events and available actions for a resource in one call
+        - **get_resource_events_bulk**: Get events for every resource in the application tree concurrently
         - **run_resource_action**: Execute an action on a resource
         - **get_application_manifest**: Retrieve application manifest
         - **get_application_parameters**: Get application parameters
+        - **get_application_bundle**: Get the resource tree, managed resources, manifest and parameters in one call
 
         ## Usage Tips
         - Use get_resource_tree to understand application structure
         - For logs, specify container name if pod has multiple containers
         - Use since_seconds/since_time to limit log history
         - Check resource events for troubleshooting
+        - Prefer get_resource_overview when you need both events and actions for a resource
+        - Use get_resource_events_bulk with resource_kind to troubleshoot many resources at once
         - Verify available actions before running them
         - Use revision parameter to get specific manifest versions
+        - Prefer get_application_bundle when you need the full picture of an application
         - Set allow_write=True for run_resource_action operations
         - Set bypass_tls=True when using self-signed certificates
 
@@ -278,6 +512,7 @@ class ArgoCDResourceHandler:
             revision (str, optional): Revision for manifest
             action_name (str, optional): Name of action to run
             action_params (dict, optional): Parameters for action
+            ctx (Context, optional): Request context injected by FastMCP
 
         Returns:
             Response object specific to the operation:
@@ -286,9 +521,12 @@ class ArgoCDResourceHandler:
             - GetWorkloadLogsResponse for get_workload_logs
             - GetResourceEventsResponse for get_resource_events
             - GetResourceActionsResponse for get_resource_actions
+            - Dict with events and actions for get_resource_overview
+            - Dict with one events result per resource for get_resource_events_bulk
             - RunResourceActionResponse for run_resource_action
             - Dict with manifest data for get_application_manifest
             - Dict with parameters data for get_application_parameters
+            - Dict with tree, managed, manifest and params for get_application_bundle
 
         Raises:
             PermissionError: If write operations are attempted without allow_write=True
@@ -328,194 +566,187 @@ class ArgoCDResourceHandler:
                     revision="v2"
                 )
         """
+        bind_request_context(ctx)
+        rid, usr = self.request_id, self.user
         try:
+            if operation not in self._VALID_OPS:
+                raise ValueError(f"Invalid operation: {operation}")
+
             # Check write permissions for write operations
             self._check_write_permission(operation)
 
-            operation_map = {
-                "get_resource_tree": self.get_resource_tree,
-                "get_managed_resources": self.get_managed_resources,
-                "get_workload_logs": self.get_workload_logs,
-                "get_resource_events": self.get_resource_events,
-                "get_resource_actions": self.get_resource_actions,
-                "run_resource_action": self.run_resource_action,
-                "get_application_manifest": self.get_application_manifest,
-                "get_application_parameters": self.get_application_parameters,
+            spec = self._OPERATION_SPECS[operation]
+
+            args = {
+                "application_name": application_name,
+                "resource_name": resource_name,
+                "resource_kind": resource_kind,
+                "namespace": namespace,
+                "uid": uid,
+                "tail_lines": tail_lines,
+                "container": container,
+                "since_seconds": since_seconds,
+                "since_time": since_time,
+                "follow": follow,
+                "revision": revision,
+                "action_name": action_name,
+                "params": action_params,
             }
+            missing = [name for name in spec.required if not args[name]]
+            if missing:
+                raise ValueError(f"Missing required parameters for {operation} operation: {', '.join(missing)}")
+            # FastMCP has already validated the tool arguments against the signature, so skip
+            # re-validation. Unset arguments fall back to model defaults; undeclared fields are dropped
+            fields = {key: value for key, value in args.items() if value is not None}
+            request = spec.request_cls.model_construct(**fields)
+
+            if spec.composite:
+                run = functools.partial(self._operation_map[operation], request)
+            else:
+                run = functools.partial(self._dispatch, operation, request, rid, usr)
+            if spec.write:
+                return await run()
+            # Concurrent identical reads join the call already in flight. The key only holds the
+            # fields the request model declares, so arguments it drops don't split the key
+            key = (operation, tuple(
+                (name, _frozen(fields[name])) for name in spec.request_cls.model_fields if name in fields
+            ))
+            return await self._inflight.do(key, run)
 
-            if operation not in operation_map:
-                raise ValueError(f"Invalid operation: {operation}")
+        except Exception as e:
+            return self._handle_api_error(e, operation, _resource_id(application_name, resource_name))
 
-            # Create appropriate request object based on operation
-            if operation == "get_resource_tree":
-                request = GetResourceTreeRequest(application_name=application_name)
-            elif operation == "get_managed_resources":
-                request = GetManagedResourcesRequest(application_name=application_name)
-            elif operation == "get_workload_logs":
-                if not resource_name:
-                    raise ValueError("resource_name is required for get_workload_logs operation")
-                # If resource_kind is not provided, assume it's a Pod
-                if not resource_kind:
-                    resource_kind = "Pod"
-                request = GetWorkloadLogsRequest(
-                    application_name=application_name,
-                    resource_name=resource_name,
-                    resource_kind=resource_kind,
-                    tail_lines=tail_lines,
-                    container=container,
-                    since_seconds=since_seconds,
-                    since_time=since_time,
-                    follow=follow,
-                )
-            elif operation == "get_resource_events":
-                if not resource_name or not resource_kind:
-                    raise ValueError("resource_name and resource_kind are required for get_resource_events operation")
-                request = GetResourceEventsRequest(
-                    application_name=application_name,
-                    resource_name=resource_name,
-                    resource_kind=resource_kind,
-                    namespace=namespace,
-                    uid=uid,
-                )
-            elif operation == "get_resource_actions":
-                if not resource_name or not resource_kind:
-                    raise ValueError("resource_name and resource_kind are required for get_resource_actions operation")
-                request = GetResourceActionsRequest(
-                    application_name=application_name,
-                    resource_name=resource_name,
-                    resource_kind=resource_kind,
-                    namespace=namespace,
-                    uid=uid,
-                )
-            elif operation == "run_resource_action":
-                if not resource_name or not resource_kind or not action_name:
-                    raise ValueError("resource_name, resource_kind, and action_name are required for run_resource_action operation")
-                request = RunResourceActionRequest(
-                    application_name=application_name,
-                    resource_name=resource_name,
-                    resource_kind=resource_kind,
-                    action_name=action_name,
-                    params=action_params,
-                    namespace=namespace,
-                    uid=uid,
-                )
-            elif operation == "get_application_manifest":
-                if not revision:
-                    raise ValueError("revision is required for get_application_manifest operation")
-                request = GetResourceTreeRequest(application_name=application_name)
-            elif operation == "get_application_parameters":
-                request = GetResourceTreeRequest(application_name=application_name)
+    async def _dispatch(self, operation: str, request: BaseModel, rid: str, usr: str) -> Dict[str, Any]:
+        """
+        Run an operation once rate limiting and concurrency admission allow it.
+        
+        Args:
+            operation (str): The operation to run
+            request (BaseModel): The operation's request model
+            rid (str): Request ID for logging
+            usr (str): User for logging
+            
+        Returns:
+            Dict[str, Any]: The operation result
+        """
+        # Wait for an admission slot so bursts don't overwhelm the ArgoCD API server
+        wait_started = time.perf_counter()
+        async with self._throttle, self._limiter.slot():
+            queue_wait_ms = (time.perf_counter() - wait_started) * 1000
+            log_info(
+                "Admitted {tool} after {queue_wait_ms} ms in queue",
+                tool=operation,
+                request_id=rid,
+                user=usr,
+                queue_wait_ms=round(queue_wait_ms, 1),
+                concurrency_limit=self._limiter.limit,
+            )
+            return await self._operation_map[operation](request)
 
-            return await operation_map[operation](request)
+    async def _dispatch_each(self, calls: List[Tuple[str, BaseModel]]) -> List[Dict[str, Any]]:
+        """
+        Run several operations concurrently, each admitted through _dispatch on its own.
+        
+        Args:
+            calls (List[Tuple[str, BaseModel]]): (operation, request) pairs
+            
+        Returns:
+            List[Dict[str, Any]]: One result per call, in order; a call that could not be
+                admitted is reported like any other failed operation
+        """
+        rid, usr = self.request_id, self.user
 
-        except Exception as e:
-            return self._handle_api_error(e, operation, f"{application_name}/{resource_name}")
+        async def _one(operation: str, request: BaseModel) -> Dict[str, Any]:
+            async with self._bulk_slots:
+                return await self._dispatch(operation, request, rid, usr)
 
-    async def get_resource_tree(
-        self,
-        request: GetResourceTreeRequest,
-    ) -> Dict[str, Any]:
+        results = await asyncio.gather(
+            *(_one(operation, request) for operation, request in calls), return_exceptions=True
+        )
+        return [
+            self._handle_api_error(
+                result, operation, _resource_id(request.application_name, getattr(request, "resource_name", None))
+            ) if isinstance(result, Exception) else result
+            for (operation, request), result in zip(calls, results)
+        ]
+
+    async def _execute(self, method: str, request: BaseModel) -> Dict[str, Any]:
         """
-        Get the resource tree for an application.
+        Validate a request, call the ArgoCD API helper registered for the method and shape the response.
         
         Args:
-            request (GetResourceTreeRequest): The request containing the application name
+            method (str): Name of the resource method, a key of _API_CALLS
+            request (BaseModel): The request model for the method
             
         Returns:
-            Dict[str, Any]: The raw API response
+            Dict[str, Any]: The raw API response wrapped in the standard response fields
         """
+        call = _API_CALLS[method]
+        rid, usr = self.request_id, self.user
+        # Read the request fields once; pydantic keeps them in the instance dict
+        fields = vars(request)
+        app = fields.get("application_name")
         try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
+            for name in call.required:
+                if not fields.get(name):
+                    return _ERR_REQUIRED[name]
+
             log_info(
-                f"Getting resource tree for application: {request.application_name}",
-                tool="get_resource_tree",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name
-                }
+                "{action} {subject} for application: {resource}",
+                tool=method,
+                resource=app,
+                request_id=rid,
+                user=usr,
+                action=call.action,
+                subject=call.subject,
+                params=request.model_dump
             )
 
-            response = await argocd_api_get_resource_tree(
+            kwargs = {name: fields.get(name) for name in call.kwargs}
+            if call.cached:
+                kwargs["cache"] = self._cache
+            response = await call.api(
                 self.server_url,
                 self.token,
-                request.application_name,
-                bypass_tls=self.bypass_tls
+                *(fields[name] for name in call.args),
+                bypass_tls=self.bypass_tls,
+                session=await self._get_session(),
+                **kwargs
             )
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_resource_tree",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
+            if call.mutates:
+                # Cached reads may describe resources the call just changed
+                self._cache.clear()
+
+            log_debug(
+                "Raw API response for application {resource}:",
+                tool=method,
+                resource=app,
+                request_id=rid,
+                user=usr,
+                response=preview(response)
             )
 
             if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource tree for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Resource tree retrieved successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
+                return _fail(f"Failed to {call.verb} {call.subject} for application {app}")
 
+            return _ok(_msg(method, app), response)
         except Exception as e:
-            error_msg = str(e)
-            log_error(
-                f"Error in get_resource_tree: {error_msg}",
-                tool="get_resource_tree",
-                request_id=self.request_id,
-                user=self.user,
-                error=error_msg,
-                resource=request.application_name
-            )
+            return self._handle_api_error(e, method, app)
+
+    async def get_resource_tree(
+        self,
+        request: GetResourceTreeRequest,
+    ) -> Dict[str, Any]:
+        """
+        Get the resource tree for an application.
+        
+        Args:
+            request (GetResourceTreeRequest): The request containing the application name
             
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource tree: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+        Returns:
+            Dict[str, Any]: The raw API response
+        """
+        return await self._execute("get_resource_tree", request)
 
     async def get_managed_resources(
         self,
@@ -530,89 +761,7 @@ class ArgoCDResourceHandler:
         Returns:
             Dict[str, Any]: The raw API response
         """
-        try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
-            log_info(
-                f"Getting managed resources for application: {request.application_name}",
-                tool="get_managed_resources",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name
-                }
-            )
-
-            response = await argocd_api_get_managed_resources(
-                self.server_url,
-                self.token,
-                request.application_name,
-                bypass_tls=self.bypass_tls
-            )
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_managed_resources",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
-            )
-
-            if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get managed resources for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Managed resources retrieved successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
-
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get managed resources: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+        return await self._execute("get_managed_resources", request)
 
     async def get_workload_logs(
         self,
@@ -627,153 +776,7 @@ class ArgoCDResourceHandler:
         Returns:
             Dict[str, Any]: The raw API response
         """
-        try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_name:
-                return {
-                    "success": False,
-                    "message": "Resource name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_kind:
-                return {
-                    "success": False,
-                    "message": "Resource kind is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
-            log_info(
-                f"Getting workload logs for application: {request.application_name}",
-                tool="get_workload_logs",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name,
-                    "resource_name": request.resource_name,
-                    "resource_kind": request.resource_kind,
-                    "namespace": request.namespace,
-                    "tail_lines": request.tail_lines
-                }
-            )
-
-            try:
-                response = await argocd_api_get_workload_logs(
-                    self.server_url,
-                    self.token,
-                    request.application_name,
-                    request.resource_name,
-                    request.resource_kind,
-                    request.namespace,
-                    request.tail_lines,
-                    self.bypass_tls
-                )
-            except Exception as api_error:
-                error_msg = str(api_error)
-                log_error(
-                    f"API call failed: {error_msg}",
-                    tool="get_workload_logs",
-                    request_id=self.request_id,
-                    user=self.user,
-                    error=error_msg,
-                    resource=f"{request.application_name}/{request.resource_name}"
-                )
-                return {
-                    "success": False,
-                    "message": f"API call failed: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application",
-                    "error_details": {
-                        "type": type(api_error).__name__,
-                        "message": error_msg
-                    }
-                }
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_workload_logs",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
-            )
-
-            if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get workload logs for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application",
-                    "error_details": {
-                        "message": "API returned None response"
-                    }
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Workload logs retrieved successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
-
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application",
-                    "error_details": {
-                        "type": type(e).__name__,
-                        "message": error_msg
-                    }
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application",
-                    "error_details": {
-                        "type": type(e).__name__,
-                        "message": error_msg
-                    }
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application",
-                    "error_details": {
-                        "type": type(e).__name__,
-                        "message": error_msg
-                    }
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get workload logs: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application",
-                    "error_details": {
-                        "type": type(e).__name__,
-                        "message": error_msg
-                    }
-                }
+        return await self._execute("get_workload_logs", request)
 
     async def get_resource_events(
         self,
@@ -788,111 +791,7 @@ class ArgoCDResourceHandler:
         Returns:
             Dict[str, Any]: The raw API response
         """
-        try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_name:
-                return {
-                    "success": False,
-                    "message": "Resource name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_kind:
-                return {
-                    "success": False,
-                    "message": "Resource kind is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
-            log_info(
-                f"Getting resource events for application: {request.application_name}",
-                tool="get_resource_events",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name,
-                    "resource_name": request.resource_name,
-                    "resource_kind": request.resource_kind,
-                    "namespace": request.namespace
-                }
-            )
-
-            response = await argocd_api_get_resource_events(
-                self.server_url,
-                self.token,
-                request.application_name,
-                request.resource_name,
-                request.resource_kind,
-                request.namespace,
-                self.bypass_tls
-            )
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_resource_events",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
-            )
-
-            if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource events for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Resource events retrieved successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
-
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource events: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+        return await self._execute("get_resource_events", request)
 
     async def get_resource_actions(
         self,
@@ -907,111 +806,75 @@ class ArgoCDResourceHandler:
         Returns:
             Dict[str, Any]: The raw API response
         """
-        try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_name:
-                return {
-                    "success": False,
-                    "message": "Resource name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_kind:
-                return {
-                    "success": False,
-                    "message": "Resource kind is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
-            log_info(
-                f"Getting resource actions for application: {request.application_name}",
-                tool="get_resource_actions",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name,
-                    "resource_name": request.resource_name,
-                    "resource_kind": request.resource_kind,
-                    "namespace": request.namespace
-                }
-            )
-
-            response = await argocd_api_get_resource_actions(
-                self.server_url,
-                self.token,
-                request.application_name,
-                request.resource_name,
-                request.resource_kind,
-                request.namespace,
-                self.bypass_tls
-            )
+        return await self._execute("get_resource_actions", request)
 
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_resource_actions",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
-            )
-
-            if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource actions for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Resource actions retrieved successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
+    async def get_resource_overview(
+        self,
+        request: GetResourceOverviewRequest,
+    ) -> Dict[str, Any]:
+        """
+        Get the events and available actions for a resource concurrently.
+        
+        Args:
+            request (GetResourceOverviewRequest): The request containing the application name and resource details
+            
+        Returns:
+            Dict[str, Any]: The events and actions results, each shaped like its single-operation response
+        """
+        fields = request.model_dump()
+        events, actions = await self._dispatch_each([
+            ("get_resource_events", GetResourceEventsRequest.model_construct(**fields)),
+            ("get_resource_actions", GetResourceActionsRequest.model_construct(**fields)),
+        ])
+        return {
+            "success": events.get("success", False) and actions.get("success", False),
+            "message": f"Resource overview retrieved for {_resource_id(request.application_name, request.resource_name)}",
+            "status_code": max(events.get("status_code", 500), actions.get("status_code", 500)),
+            "resource": _APP,
+            "data": {"events": events, "actions": actions},
+        }
 
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get resource actions: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+    async def get_resource_events_bulk(
+        self,
+        request: GetResourceEventsBulkRequest,
+    ) -> Dict[str, Any]:
+        """
+        Get the events for every resource in an application's tree concurrently.
+        
+        Args:
+            request (GetResourceEventsBulkRequest): The request containing the application name and
+                optional kind and namespace filters
+            
+        Returns:
+            Dict[str, Any]: One entry per resource with its kind, name, namespace and events result
+        """
+        app = request.application_name
+        tree, = await self._dispatch_each([
+            ("get_resource_tree", GetResourceTreeRequest.model_construct(application_name=app)),
+        ])
+        if not tree.get("success"):
+            return tree
+        nodes = [
+            node for node in (tree["data"].get("nodes") or [])
+            if (not request.resource_kind or node.get("kind") == request.resource_kind)
+            and (not request.namespace or node.get("namespace") == request.namespace)
+        ]
+        results = await self._dispatch_each([
+            ("get_resource_events", GetResourceEventsRequest.model_construct(
+                application_name=app,
+                resource_name=node.get("name"),
+                resource_kind=node.get("kind"),
+                namespace=node.get("namespace"),
+            ))
+            for node in nodes
+        ])
+        return _ok(
+            f"Resource events retrieved for {len(nodes)} resources of application {app}",
+            [
+                {"kind": node.get("kind"), "name": node.get("name"), "namespace": node.get("namespace"), "events": result}
+                for node, result in zip(nodes, results)
+            ],
+        )
 
     async def run_resource_action(
         self,
@@ -1026,238 +889,49 @@ class ArgoCDResourceHandler:
         Returns:
             Dict[str, Any]: The raw API response
         """
-        try:
-            if not request.application_name:
-                return {
-                    "success": False,
-                    "message": "Application name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_name:
-                return {
-                    "success": False,
-                    "message": "Resource name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.resource_kind:
-                return {
-                    "success": False,
-                    "message": "Resource kind is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            if not request.action_name:
-                return {
-                    "success": False,
-                    "message": "Action name is required",
-                    "status_code": 400,
-                    "resource": "application"
-                }
-
-            # Log the request details
-            log_info(
-                f"Running resource action for application: {request.application_name}",
-                tool="run_resource_action",
-                request_id=self.request_id,
-                user=self.user,
-                params={
-                    "application_name": request.application_name,
-                    "resource_name": request.resource_name,
-                    "resource_kind": request.resource_kind,
-                    "action_name": request.action_name,
-                    "params": request.params,
-                    "namespace": request.namespace
-                }
-            )
-
-            response = await argocd_api_run_resource_action(
-                self.server_url,
-                self.token,
-                request.application_name,
-                request.resource_name,
-                request.resource_kind,
-                request.action_name,
-                request.params,
-                request.namespace,
-                self.bypass_tls
-            )
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="run_resource_action",
-                request_id=self.request_id,
-                user=self.user,
-                response=response
-            )
-
-            if response is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to run resource action for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Resource action executed successfully for application {request.application_name}",
-                "data": response,
-                "status_code": 200,
-                "resource": "application"
-            }
-
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to run resource action: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+        return await self._execute("run_resource_action", request)
 
     async def get_application_manifest(
         self,
-        request: GetResourceTreeRequest,
+        request: GetApplicationManifestRequest,
     ) -> Dict[str, Any]:
         """Get the application manifest for an ArgoCD application."""
-        log_tool_execution(
-            "Executing get_application_manifest",
-            tool="get_application_manifest",
-            request_id=self.request_id,
-            user=self.user,
-            params=request.model_dump(),
-        )
-
-        try:
-            data = await argocd_api_get_application_manifest(
-                request.application_name,
-                self.token,
-                self.server_url,
-                request.revision,
-                bypass_tls=self.bypass_tls
-            )
-
-            # Log the raw response
-            log_info(
-                f"Raw API response for application {request.application_name}:",
-                tool="get_application_manifest",
-                request_id=self.request_id,
-                user=self.user,
-                response=data
-            )
-
-            if data is None:
-                return {
-                    "success": False,
-                    "message": f"Failed to get application manifest for application {request.application_name}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
-
-            # Return the raw response
-            return {
-                "success": True,
-                "message": f"Application manifest retrieved successfully for application {request.application_name}",
-                "data": data,
-                "status_code": 200,
-                "resource": "application"
-            }
-
-        except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Application {request.application_name} not found",
-                    "status_code": 404,
-                    "resource": "application"
-                }
-            elif "403" in error_msg:
-                return {
-                    "success": False,
-                    "message": f"Access forbidden: permission denied for application {request.application_name}",
-                    "status_code": 403,
-                    "resource": "application"
-                }
-            elif "401" in error_msg:
-                return {
-                    "success": False,
-                    "message": "Authentication failed: invalid token",
-                    "status_code": 401,
-                    "resource": "application"
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": f"Failed to get application manifest: {error_msg}",
-                    "status_code": 500,
-                    "resource": "application"
-                }
+        return await self._execute("get_application_manifest", request)
 
     async def get_application_parameters(
         self,
         request: GetResourceTreeRequest,
     ) -> Dict[str, Any]:
         """Get the application parameters for an ArgoCD application."""
-        log_tool_execution(
-            "Executing get_application_parameters",
-            tool="get_application_parameters",
-            request_id=self.request_id,
-            user=self.user,
-            params=request.model_dump(),
-        )
+        return await self._execute("get_application_parameters", request)
 
-        try:
-            data = await argocd_api_get_application_parameters(
-                request.application_name,
-                self.token,
-                self.server_url,
-                bypass_tls=self.bypass_tls
-            )
-            log_success(
-                f"get_application_parameters succeeded for {request.application_name}",
-                tool="get_application_parameters",
-                request_id=self.request_id,
-                user=self.user,
-                resource=request.application_name,
-            )
-            return {"parameters": data}
-        except Exception as e:
-            log_error(
-                f"get_application_parameters failed: {str(e)}",
-                tool="get_application_parameters",
-                request_id=self.request_id,
-                user=self.user,
-                error=str(e),
-                resource=request.application_name,
-            )
-            raise RuntimeError(f"Failed to get application parameters: {str(e)}") 
\ No newline at end of file
+    async def get_application_bundle(
+        self,
+        request: GetApplicationBundleRequest,
+    ) -> Dict[str, Any]:
+        """
+        Get an application's resource tree, managed resources, manifest and parameters concurrently.
+        
+        Args:
+            request (GetApplicationBundleRequest): The request containing the application name and manifest revision
+            
+        Returns:
+            Dict[str, Any]: The four results, each shaped like its single-operation response
+        """
+        app = request.application_name
+        parts = ("tree", "managed", "manifest", "params")
+        results = await self._dispatch_each([
+            ("get_resource_tree", GetResourceTreeRequest.model_construct(application_name=app)),
+            ("get_managed_resources", GetManagedResourcesRequest.model_construct(application_name=app)),
+            ("get_application_manifest", GetApplicationManifestRequest.model_construct(
+                application_name=app, revision=request.revision
+            )),
+            ("get_application_parameters", GetResourceTreeRequest.model_construct(application_name=app)),
+        ])
+        return {
+            "success": all(result.get("success", False) for result in results),
+            "message": f"Application bundle retrieved for {app}",
+            "status_code": max(result.get("status_code", 500) for result in results),
+            "resource": _APP,
+            "data": dict(zip(parts, results)),
+        }
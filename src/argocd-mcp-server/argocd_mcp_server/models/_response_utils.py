@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+R = TypeVar("R", bound=BaseModel)
+
+
+@lru_cache(maxsize=256)
+def make_error(cls: Type[R], message: str, status_code: int = 500, resource: str = "application") -> R:
+    """
+    Build the error response for a response model.
+
+    Payload fields keep their defaults. Responses are memoized per
+    (class, message, status code, resource), since most error messages come
+    from a small fixed set; callers must treat them as read-only.
+
+    Args:
+        cls (Type[BaseModel]): The response model
+        message (str): Error message
+        status_code (int): HTTP status code to report
+        resource (str): Resource the error refers to
+
+    Returns:
+        BaseModel: The error response
+    """
+    return cls.model_construct(
+        success=False,
+        message=message,
+        status_code=status_code,
+        resource=resource
+    )
@@ -1,39 +1,72 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any, Literal
+from enum import IntEnum
+from functools import lru_cache
+from pydantic import BaseModel, Field, ConfigDict, BeforeValidator, PlainSerializer
+from argocd_mcp_server.models._response_utils import make_error
+from typing import List, Optional, Dict, Any, Tuple
+from typing_extensions import Annotated
+
+# Shared by every model so identical configs are not rebuilt per class. Core
+# schemas are built on first validation rather than at import, so models a
+# session never touches cost nothing at startup
+# from_attributes is left off: every model is built from dicts or keyword arguments
+_BASE_CFG = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
+
+def freeze_str_map(value: Any) -> Any:
+    """Store a str -> str map as sorted (key, value) pairs so it is hashable."""
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+# Hashable str -> str map (labels, annotations) usable as a cache key; serialized back to a dict
+FrozenStrMap = Annotated[
+    Tuple[Tuple[str, str], ...],
+    BeforeValidator(freeze_str_map),
+    PlainSerializer(dict, return_type=Dict[str, str]),
+]
+
+
+class PrunePolicy(IntEnum):
+    """Prune propagation policy. ArgoCD expects the lowercase name on the wire."""
+    FOREGROUND = 0
+    BACKGROUND = 1
+    ORPHAN = 2
+
+    @property
+    def wire(self) -> str:
+        """The lowercase name sent to ArgoCD."""
+        return self.name.lower()
+
+
+_PRUNE_POLICIES = {policy.wire: policy for policy in PrunePolicy}
+
+
+def _parse_prune_policy(value: Any) -> Any:
+    """Map the wire name of a prune policy to its enum member."""
+    if isinstance(value, str):
+        return _PRUNE_POLICIES.get(value, value)
+    return value
+
+
+# Validated as an integer enum, serialized by wire name
+PrunePolicyField = Annotated[
+    PrunePolicy,
+    BeforeValidator(_parse_prune_policy),
+    PlainSerializer(lambda policy: policy.wire, return_type=str),
+]
 
 
 class ApplicationMetadata(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "name": "guestbook",
-                "namespace": "argocd",
-                "project": "default",
-                "labels": {"app": "guestbook"},
-                "annotations": {"description": "Guestbook application"}
-            }
-        }
-    )
+    model_config = _BASE_CFG
     name: str = Field(..., description="Name of the application (required)")
     namespace: str = Field("argocd", description="Namespace of the application (optional, defaults to argocd)")
     project: str = Field(..., description="Project of the application (required)")
-    labels: Optional[Dict[str, str]] = Field(None, description="Labels for the application")
-    annotations: Optional[Dict[str, str]] = Field(None, description="Annotations for the application")
+    labels: Optional[FrozenStrMap] = Field(None, description="Labels for the application")
+    annotations: Optional[FrozenStrMap] = Field(None, description="Annotations for the application")
 
 class ApplicationSource(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "repo_url": "https://github.com/argoproj/argocd-example-apps",
-                "path": "guestbook",
-                "target_revision": "HEAD"
-            }
-        }
-    )
+    model_config = _BASE_CFG
     repo_url: str = Field(..., description="Repository URL (required)")
     path: str = Field(..., description="Path in the repository (required)")
     target_revision: str = Field("HEAD", description="Target revision (optional, defaults to HEAD)")
@@ -45,16 +78,7 @@ class ApplicationSource(BaseModel):
     jsonnet: Optional[Dict[str, Any]] = None
 
 class ApplicationDestination(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "server": "https://kubernetes.default.svc",
-                "namespace": "default"
-            }
-        }
-    )
+    model_config = _BASE_CFG
     server: str = Field(..., description="Destination server URL (required)")
     namespace: Optional[str] = Field(None, description="Destination namespace (optional)")
     name: Optional[str] = Field(None, description="Destination name (optional)")
@@ -84,46 +108,33 @@ class SyncPolicy(BaseModel):
         None,
         description="List of sync options (e.g., skip schema validation, prune last, etc.)"
     )
-    prune_propagation_policy: Optional[Literal["foreground", "background", "orphan"]] = Field(
-        "foreground",
+    prune_propagation_policy: Optional[PrunePolicyField] = Field(
+        PrunePolicy.FOREGROUND,
         description="Prune propagation policy (foreground, background, or orphan)"
     )
     finalizer: Optional[bool] = Field(
         False,
         description="Whether to set deletion finalizer"
     )
-    retry: Optional[Dict[str, Any]] = Field(
+    retry: Optional[dict] = Field(
         None,
         description="Retry configuration for sync operations"
     )
-    hooks: Optional[List[Dict[str, Any]]] = None
+    hooks: Optional[list] = None
 
 class SyncStrategy(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "hook": {
-                    "force": True
-                }
-            }
-        }
-    )
-    apply: Optional[Dict[str, Any]] = None
-    hook: Optional[Dict[str, Any]] = None
+    model_config = _BASE_CFG
+    apply: Optional[dict] = None
+    hook: Optional[dict] = None
 
 
 class SyncOperation(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
-    initiated_by: Optional[Dict[str, str]] = None
+    model_config = _BASE_CFG
+    initiated_by: Optional[FrozenStrMap] = None
     info: Optional[List[Dict[str, str]]] = None
     sync_strategy: Optional[SyncStrategy] = None
     resources: Optional[List[Dict[str, str]]] = None
-    source: Optional[Dict[str, Any]] = None
+    source: Optional[dict] = None
     manifests: Optional[List[str]] = None
     dry_run: Optional[bool] = False
     prune: Optional[bool] = False
@@ -132,10 +143,7 @@ class SyncOperation(BaseModel):
 
 
 class ApplicationSpec(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     source: ApplicationSource = Field(..., description="Source configuration (required)")
     destination: ApplicationDestination = Field(..., description="Destination configuration (required)")
     project: str = Field(..., description="Project name (required)")
@@ -143,65 +151,77 @@ class ApplicationSpec(BaseModel):
         None,
         description="Sync policy configuration (optional)"
     )
-    operation: Optional[Dict[str, Any]] = None
+    operation: Optional[dict] = None
 
 
 class ApplicationStatus(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     sync_status: Optional[str] = None
     health_status: Optional[str] = None
-    operation_state: Optional[Dict[str, Any]] = None
-    conditions: Optional[List[Dict[str, Any]]] = None
-    history: Optional[List[Dict[str, Any]]] = None
+    operation_state: Optional[dict] = None
+    conditions: Optional[list] = None
+    history: Optional[list] = None
     reconciled_at: Optional[str] = None
     source_type: Optional[str] = None
-    summary: Optional[Dict[str, Any]] = None
+    summary: Optional[dict] = None
 
 
 class ApplicationModel(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     metadata: ApplicationMetadata
     spec: ApplicationSpec
     status: Optional[ApplicationStatus] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "ApplicationModel":
+        """Build from a trusted application dict without re-running field validation."""
+        spec = data["spec"]
+        sync_policy = spec.get("sync_policy")
+        if sync_policy is not None:
+            automated = sync_policy.get("automated")
+            sync_policy = SyncPolicy.model_construct(**{
+                **sync_policy,
+                "automated": SyncPolicyAutomated.model_construct(**automated) if automated is not None else None,
+                # model_construct skips the field's validator, so map the wire name here
+                "prune_propagation_policy": _parse_prune_policy(
+                    sync_policy.get("prune_propagation_policy", PrunePolicy.FOREGROUND)
+                ),
+            })
+        status = data.get("status")
+        return cls.model_construct(
+            metadata=ApplicationMetadata.model_construct(**{
+                **data["metadata"],
+                "labels": freeze_str_map(data["metadata"].get("labels")),
+                "annotations": freeze_str_map(data["metadata"].get("annotations")),
+            }),
+            spec=ApplicationSpec.model_construct(**{
+                **spec,
+                "source": ApplicationSource.model_construct(**spec["source"]),
+                "destination": ApplicationDestination.model_construct(**spec["destination"]),
+                "sync_policy": sync_policy,
+            }),
+            status=ApplicationStatus.model_construct(**status) if status is not None else None,
+        )
+
 # Create Application
 class CreateApplicationRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application: ApplicationModel
 
 class CreateApplicationResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Application created successfully"
     application: Optional[ApplicationModel] = None
     status_code: int = 201
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "CreateApplicationResponse":
-        return cls(
-            success=False,
-            message=message,
-            application=None,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
+    # Not named success: a classmethod sharing a field's name is dropped by pydantic
     @classmethod
-    def success(cls, application: ApplicationModel, message: str = "Application created successfully") -> "CreateApplicationResponse":
-        return cls(
+    def ok(cls, application: ApplicationModel, message: str = "Application created successfully") -> "CreateApplicationResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             application=application,
@@ -212,36 +232,22 @@ class CreateApplicationResponse(BaseModel):
 
 # Update Application
 class UpdateApplicationRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application: ApplicationModel
 
 class UpdateApplicationResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Application updated successfully"
     application: Optional[ApplicationModel] = None
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "UpdateApplicationResponse":
-        return cls(
-            success=False,
-            message=message,
-            application=None,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, application: ApplicationModel, message: str = "Application updated successfully") -> "UpdateApplicationResponse":
-        return cls(
+    def ok(cls, application: ApplicationModel, message: str = "Application updated successfully") -> "UpdateApplicationResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             application=application,
@@ -251,36 +257,25 @@ class UpdateApplicationResponse(BaseModel):
 
 # Delete Application
 class DeleteApplicationRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     name: str
     namespace: Optional[str] = None
     cascade: Optional[bool] = True
 
 class DeleteApplicationResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    # Frozen so the memoized success responses can be shared safely
+    model_config = _BASE_CFG | ConfigDict(frozen=True)
     success: bool = True
     message: str = "Application deleted successfully"
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "DeleteApplicationResponse":
-        return cls(
-            success=False,
-            message=message,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, message: str = "Application deleted successfully") -> "DeleteApplicationResponse":
-        return cls(
+    @lru_cache(maxsize=32)
+    def ok(cls, message: str = "Application deleted successfully") -> "DeleteApplicationResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             status_code=200,
@@ -289,35 +284,24 @@ class DeleteApplicationResponse(BaseModel):
 
 # Sync Application
 class SyncApplicationRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     name: str
     namespace: Optional[str] = None
 
 class SyncApplicationResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    # Frozen so the memoized success responses can be shared safely
+    model_config = _BASE_CFG | ConfigDict(frozen=True)
     success: bool = True
     message: str = "Application Synced Successfully"
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "SyncApplicationResponse":
-        return cls(
-            success=False,
-            message=message,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, message: str = "Application Synced Successfully") -> "SyncApplicationResponse":
-        return cls(
+    @lru_cache(maxsize=32)
+    def ok(cls, message: str = "Application Synced Successfully") -> "SyncApplicationResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             status_code=200,
@@ -326,36 +310,25 @@ class SyncApplicationResponse(BaseModel):
 
 # Get Application
 class GetApplicationRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     name: str
 
 class GetApplicationResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Application Retrieved Successfully"
+    application: Optional[ApplicationModel] = None
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetApplicationResponse":
-        return cls(
-            success=False,
-            message=message,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, message: str = "Application Retrieved Successfully") -> "GetApplicationResponse":
-        return cls(
+    def ok(cls, application: ApplicationModel, message: str = "Application Retrieved Successfully") -> "GetApplicationResponse":
+        return cls.model_construct(
             success=True,
             message=message,
+            application=application,
             status_code=200,
             resource="application"
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,18 @@
+import orjson
+from pydantic import BaseModel
+
+
+def encode(resp: BaseModel) -> bytes:
+    """
+    Encode a response model as JSON.
+
+    Dumps to Python objects and lets orjson write the bytes, which is faster than
+    model_dump_json for large nested responses such as resource trees.
+
+    Args:
+        resp (BaseModel): The response model to encode
+
+    Returns:
+        bytes: JSON encoding of the model, with unset optional fields omitted
+    """
+    return orjson.dumps(resp.model_dump(exclude_none=True), option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,78 @@
+from pydantic import BaseModel, ConfigDict
+
+from argocd_mcp_server.models import application, resource
+
+# Documentation examples per model, kept out of the model configs so they are
+# only loaded into schemas when a JSON schema is actually exported
+EXAMPLES = {
+    "ApplicationMetadata": {
+        "name": "guestbook",
+        "namespace": "argocd",
+        "project": "default",
+        "labels": {"app": "guestbook"},
+        "annotations": {"description": "Guestbook application"}
+    },
+    "ApplicationSource": {
+        "repo_url": "https://github.com/argoproj/argocd-example-apps",
+        "path": "guestbook",
+        "target_revision": "HEAD"
+    },
+    "ApplicationDestination": {
+        "server": "https://kubernetes.default.svc",
+        "namespace": "default"
+    },
+    "SyncStrategy": {
+        "hook": {
+            "force": True
+        }
+    },
+    "ResourceNode": {
+        "uid": "4e1b6f0c-8a55-4a3c-9d4f-2a7c1e0b9f31",
+        "kind": "Deployment",
+        "name": "guestbook",
+        "namespace": "default",
+        "status": "Synced",
+        "health": {"status": "Healthy"},
+        "parent_uid": None,
+    },
+    "ManagedResource": {
+        "kind": "Deployment",
+        "name": "guestbook",
+        "namespace": "default",
+        "status": "Synced",
+        "health": "Healthy",
+        "group": "apps",
+        "version": "v1"
+    },
+}
+
+_attached = False
+
+
+def attach_openapi_examples() -> None:
+    """
+    Attach the documentation examples to the models before exporting JSON schemas.
+
+    Models in both modules are rebuilt so parents pick up their children's examples.
+    Calling it again is a no-op.
+    """
+    global _attached
+    if _attached:
+        return
+    modules = (application, resource)
+    for module in modules:
+        for name, example in EXAMPLES.items():
+            cls = getattr(module, name, None)
+            if cls is None:
+                continue
+            extra = {"json_schema_extra": {"example": example}}
+            if isinstance(cls, type) and issubclass(cls, BaseModel):
+                # model_config is the shared _BASE_CFG, so replace it rather than mutate it
+                cls.model_config = {**cls.model_config, **extra}
+            else:
+                cls.__pydantic_config__ = ConfigDict(**extra)
+    for module in modules:
+        for cls in vars(module).values():
+            if isinstance(cls, type) and issubclass(cls, BaseModel) and cls.__module__ == module.__name__:
+                cls.model_rebuild(force=True)
+    _attached = True
@@ -1,45 +1,50 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any, Literal
+from argocd_mcp_server.models._response_utils import make_error
+from dataclasses import dataclass
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, model_validator
+from typing import Any, Dict, List, NewType, Optional
+
+# pydantic requires typing_extensions' TypedDict before Python 3.12
+from typing_extensions import NotRequired, TypedDict
+
+
+# Shared by every model so identical configs are not rebuilt per class. Core
+# schemas are built on first validation rather than at import, so models a
+# session never touches cost nothing at startup
+# from_attributes is left off: every model is built from dicts or keyword arguments
+_BASE_CFG = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
 
 # Get Application Resource Tree
 class GetResourceTreeRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application_name: str
     namespace: Optional[str] = None
 
 
 # Get Application Managed Resources
 class GetManagedResourcesRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application_name: str
     namespace: Optional[str] = None
 
 
 # Get Application Workload Logs
 class GetWorkloadLogsRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application_name: str
     resource_name: str
-    resource_kind: str
+    resource_kind: str = "Pod"
     namespace: Optional[str] = None
     tail_lines: Optional[int] = 100
+    container: Optional[str] = None
+    since_seconds: Optional[int] = None
+    since_time: Optional[str] = None
+    follow: Optional[bool] = False
 
 # Get Resource Events
 class GetResourceEventsRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application_name: str
     resource_name: str
     resource_kind: str
@@ -48,21 +53,30 @@ class GetResourceEventsRequest(BaseModel):
 
 # Get Resource Actions
 class GetResourceActionsRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
+    application_name: str
+    resource_name: str
+    resource_kind: str
+    namespace: Optional[str] = None
+
+# Get Resource Overview (events and actions together)
+class GetResourceOverviewRequest(BaseModel):
+    model_config = _BASE_CFG
     application_name: str
     resource_name: str
     resource_kind: str
     namespace: Optional[str] = None
 
+# Get Resource Events for every resource in an application's tree
+class GetResourceEventsBulkRequest(BaseModel):
+    model_config = _BASE_CFG
+    application_name: str
+    resource_kind: Optional[str] = None
+    namespace: Optional[str] = None
+
 # Run Resource Action
 class RunResourceActionRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     application_name: str
     resource_name: str
     resource_kind: str
@@ -70,84 +84,87 @@ class RunResourceActionRequest(BaseModel):
     params: Optional[Dict[str, Any]] = None
     namespace: Optional[str] = None
 
-# Get Application Resource Tree
-class GetResourceTreeRequest(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+# Get Application Manifest
+class GetApplicationManifestRequest(BaseModel):
+    model_config = _BASE_CFG
     application_name: str
-    namespace: Optional[str] = None
+    revision: Optional[str] = None
+
+# Get Application Bundle (tree, managed resources, manifest and parameters together)
+class GetApplicationBundleRequest(BaseModel):
+    model_config = _BASE_CFG
+    application_name: str
+    revision: Optional[str] = None
 
-class ResourceNode(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "kind": "Deployment",
-                "name": "guestbook",
-                "namespace": "default",
-                "status": "Synced",
-                "health": {"status": "Healthy"},
-                "children": [],
-            }
-        }
-    )
+class ResourceNode(TypedDict):
+    uid: str
     kind: str
     name: str
-    namespace: Optional[str] = None
-    status: Optional[str] = None
-    health: Optional[Dict[str, Any]] = None
-    children: Optional[List["ResourceNode"]] = None
+    namespace: NotRequired[Optional[str]]
+    status: NotRequired[Optional[str]]
+    health: NotRequired[Optional[Dict[str, Any]]]
+    parent_uid: NotRequired[Optional[str]]
+
+# Position of a node in GetResourceTreeResponse.nodes; -1 stands for "no parent"
+ResourceNodeRef = NewType("ResourceNodeRef", int)
+
+
+def _parent_index(nodes: List[ResourceNode]) -> List[ResourceNodeRef]:
+    """Position of each node's parent in nodes, or -1 for a root, in one pass."""
+    positions = {node["uid"]: i for i, node in enumerate(nodes)}
+    return [positions.get(node.get("parent_uid"), -1) for node in nodes]
 
 class GetResourceTreeResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Resource tree retrieved successfully"
-    root: Optional[ResourceNode] = None
+    # The tree is stored flat: parent_index[i] is the position of nodes[i]'s parent, or -1 for a root
+    nodes: List[ResourceNode] = []
+    parent_index: List[ResourceNodeRef] = []
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetResourceTreeResponse":
-        return cls(
-            success=False,
-            message=message,
-            root=None,
-            status_code=status_code,
-            resource=resource
-        )
+    @model_validator(mode="after")
+    def _index_parents(self) -> "GetResourceTreeResponse":
+        """Derive parent_index from nodes on validation; ok() skips validation and sets it itself."""
+        self.parent_index = _parent_index(self.nodes)
+        return self
+
+    @cached_property
+    def child_index(self) -> Dict[int, List[int]]:
+        """Positions of each node's children, built in one pass on first use."""
+        children: Dict[int, List[int]] = {}
+        for i, parent in enumerate(self.parent_index):
+            children.setdefault(parent, []).append(i)
+        return children
+
+    def children_of(self, index: int) -> List[int]:
+        """
+        Get the positions of a node's children.
+
+        Args:
+            index (int): Position of the node in nodes, or -1 for the roots
+
+        Returns:
+            List[int]: Positions of the child nodes
+        """
+        return self.child_index.get(index, [])
+
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, root: ResourceNode, message: str = "Resource tree retrieved successfully") -> "GetResourceTreeResponse":
-        return cls(
+    def ok(cls, nodes: List[ResourceNode], message: str = "Resource tree retrieved successfully") -> "GetResourceTreeResponse":
+        return cls.model_construct(
             success=True,
             message=message,
-            root=root,
+            nodes=nodes,
+            parent_index=_parent_index(nodes),
             status_code=200,
             resource="application"
         )
 
-class ManagedResource(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        json_schema_extra={
-            "example": {
-                "kind": "Deployment",
-                "name": "guestbook",
-                "namespace": "default",
-                "status": "Synced",
-                "health": "Healthy",
-                "group": "apps",
-                "version": "v1"
-            }
-        }
-    )
+@dataclass(slots=True, frozen=True)
+class ManagedResource:
     kind: str
     name: str
     namespace: Optional[str] = None
@@ -157,29 +174,18 @@ class ManagedResource(BaseModel):
     version: Optional[str] = None
 
 class GetManagedResourcesResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Managed resources retrieved successfully"
     resources: List[ManagedResource] = []
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetManagedResourcesResponse":
-        return cls(
-            success=False,
-            message=message,
-            resources=[],
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, resources: List[ManagedResource], message: str = "Managed resources retrieved successfully") -> "GetManagedResourcesResponse":
-        return cls(
+    def ok(cls, resources: List[ManagedResource], message: str = "Managed resources retrieved successfully") -> "GetManagedResourcesResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             resources=resources,
@@ -187,39 +193,25 @@ class GetManagedResourcesResponse(BaseModel):
             resource="application"
         )
 
-class WorkloadLogEntry(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+@dataclass(slots=True, frozen=True)
+class WorkloadLogEntry:
     timestamp: str
     message: str
     container: Optional[str] = None
 
 class GetWorkloadLogsResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Workload logs retrieved successfully"
     logs: List[WorkloadLogEntry] = []
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetWorkloadLogsResponse":
-        return cls(
-            success=False,
-            message=message,
-            logs=[],
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, logs: List[WorkloadLogEntry], message: str = "Workload logs retrieved successfully") -> "GetWorkloadLogsResponse":
-        return cls(
+    def ok(cls, logs: List[WorkloadLogEntry], message: str = "Workload logs retrieved successfully") -> "GetWorkloadLogsResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             logs=logs,
@@ -227,11 +219,8 @@ class GetWorkloadLogsResponse(BaseModel):
             resource="application"
         )
 
-class ResourceEvent(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+@dataclass(slots=True, frozen=True)
+class ResourceEvent:
     type: str
     reason: str
     message: str
@@ -240,29 +229,18 @@ class ResourceEvent(BaseModel):
     source: Optional[Dict[str, str]] = None
 
 class GetResourceEventsResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Resource events retrieved successfully"
     events: List[ResourceEvent] = []
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetResourceEventsResponse":
-        return cls(
-            success=False,
-            message=message,
-            events=[],
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, events: List[ResourceEvent], message: str = "Resource events retrieved successfully") -> "GetResourceEventsResponse":
-        return cls(
+    def ok(cls, events: List[ResourceEvent], message: str = "Resource events retrieved successfully") -> "GetResourceEventsResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             events=events,
@@ -270,39 +248,25 @@ class GetResourceEventsResponse(BaseModel):
             resource="application"
         )
 
-class ResourceAction(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+@dataclass(slots=True, frozen=True)
+class ResourceAction:
     name: str
     description: Optional[str] = None
     params: Optional[Dict[str, Any]] = None
 
 class GetResourceActionsResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Resource actions retrieved successfully"
     actions: List[ResourceAction] = []
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "GetResourceActionsResponse":
-        return cls(
-            success=False,
-            message=message,
-            actions=[],
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, actions: List[ResourceAction], message: str = "Resource actions retrieved successfully") -> "GetResourceActionsResponse":
-        return cls(
+    def ok(cls, actions: List[ResourceAction], message: str = "Resource actions retrieved successfully") -> "GetResourceActionsResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             actions=actions,
@@ -313,32 +277,21 @@ class GetResourceActionsResponse(BaseModel):
 
 
 class RunResourceActionResponse(BaseModel):
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True
-    )
+    model_config = _BASE_CFG
     success: bool = True
     message: str = "Resource action executed successfully"
     result: Optional[Dict[str, Any]] = None
     status_code: int = 200
     resource: str = "application"
 
-    @classmethod
-    def error(cls, message: str, status_code: int = 500, resource: str = "application") -> "RunResourceActionResponse":
-        return cls(
-            success=False,
-            message=message,
-            result=None,
-            status_code=status_code,
-            resource=resource
-        )
+    error = classmethod(make_error)
 
     @classmethod
-    def success(cls, result: Dict[str, Any], message: str = "Resource action executed successfully") -> "RunResourceActionResponse":
-        return cls(
+    def ok(cls, result: Dict[str, Any], message: str = "Resource action executed successfully") -> "RunResourceActionResponse":
+        return cls.model_construct(
             success=True,
             message=message,
             result=result,
             status_code=200,
             resource="application"
-        )
\ No newline at end of file
+        )
@@ -1,16 +1,258 @@
 import os
 import sys
-import json
+import orjson
 import logging
+import ssl
+import time
+import base64
+import asyncio
+import aiohttp
 import requests
-from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from argocd_mcp_server.utils.argocd_api_helper import create_pooled_session
+from argocd_mcp_server.utils.cache import ResponseCache
 logger = logging.getLogger(__name__)
 
+# Where issued tokens are cached between runs
+TOKEN_CACHE_PATH = Path(os.getenv('ARGOCD_TOKEN_CACHE', '~/.cache/argocd_mcp/token.json')).expanduser()
+# A cached token is only reused while it has at least this many seconds left
+TOKEN_EXPIRY_MARGIN = 60
+# The sanity check only reads application names, so the listing is trimmed to them server-side
+SANITY_CHECK_FIELDS = 'items.metadata.name,metadata.resourceVersion'
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+# Statuses meaning the token was rejected; listings raise on these instead of returning []
+AUTH_FAILURE_STATUSES = frozenset((401, 403))
+# Seconds a listing or a successful token validation is reused before ArgoCD is asked again
+READ_CACHE_TTL = float(os.getenv('ARGOCD_FETCHER_CACHE_TTL', '10'))
+# Threads fetching sampled applications in parallel; kept below the session's pool_maxsize
+SAMPLE_WORKERS = 16
+# Bytes of a failed response's body included in the error log
+RESPONSE_LOG_LIMIT = 1024
+
+
+@lru_cache(maxsize=2)
+def _shared_ssl_context(verify_tls: bool) -> ssl.SSLContext:
+    """
+    Get the process-wide SSL context for a verification mode.
+    
+    Sharing one context means the CA store is loaded once and every pooled
+    connection uses the same OpenSSL context and its session cache.
+    
+    Args:
+        verify_tls (bool): Whether certificates are verified
+        
+    Returns:
+        ssl.SSLContext: The shared context
+    """
+    ctx = ssl.create_default_context()
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    # Keep session tickets enabled so servers can offer abbreviated handshakes
+    ctx.options &= ~ssl.OP_NO_TICKET
+    if not verify_tls:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class SharedSSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools all use the shared SSL context."""
+
+    def __init__(self, verify_tls: bool = True, **kwargs):
+        self.verify_tls = verify_tls
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _shared_ssl_context(self.verify_tls)
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the exp claim of a JWT without verifying it, or None if absent."""
+    try:
+        payload = token.split('.')[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _log_error_response(e: requests.exceptions.RequestException) -> None:
+    """
+    Log the start of a failed request's response body, if there was a response.
+    
+    The raw bytes are logged so the body is never charset-detected and decoded
+    in full, and only when error logging is enabled.
+    
+    Args:
+        e (requests.exceptions.RequestException): The request error
+    """
+    if e.response is not None and logger.isEnabledFor(logging.ERROR):
+        logger.error("Response: %s", e.response.content[:RESPONSE_LOG_LIMIT])
+
+
+def _paging_params(limit: Optional[int], fields: Optional[str]) -> Dict[str, str]:
+    """
+    Build the query parameters that bound an application listing.
+    
+    Args:
+        limit (int, optional): Maximum number of applications to return
+        fields (str, optional): Comma-separated field selector
+        
+    Returns:
+        Dict[str, str]: Query parameters to merge into the request
+    """
+    params = {}
+    if limit is not None:
+        params['limit'] = str(limit)
+    if fields:
+        params['fields'] = fields
+    return params
+
+
+_metadata_of = itemgetter('metadata')
+
+
+def _app_name(app: Dict[str, Any]) -> Optional[str]:
+    """
+    Get an application's name without allocating fallback dicts.
+    
+    Args:
+        app (Dict[str, Any]): Application as returned by ArgoCD
+        
+    Returns:
+        Optional[str]: The application name, or None if it is missing
+    """
+    try:
+        return _metadata_of(app)['name']
+    except (KeyError, TypeError):
+        return None
+
+
+def _bulk_params(name: str, project: Optional[str]) -> Dict[str, str]:
+    """
+    Build the query parameters of a listing filtered down to one application.
+    
+    ArgoCD's name filter takes a single name, so several applications are never
+    fetched through one listing; that would download every application.
+    
+    Args:
+        name (str): Name of the application
+        project (str, optional): Project the application belongs to
+        
+    Returns:
+        Dict[str, str]: Query parameters for the applications listing
+    """
+    params = {'name': name}
+    if project:
+        params['project'] = project
+    return params
+
+
+def _collate_details(
+    names: List[str], details: List[Union[Dict[str, Any], Exception]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Key per-name application details by name, raising the first error among them.
+    
+    Args:
+        names (List[str]): Names of the applications
+        details (List[Union[Dict[str, Any], Exception]]): Details per name, in order, or the error raised for it
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Application details keyed by name; names not found are absent
+    """
+    found = {}
+    for name, detail in zip(names, details):
+        if isinstance(detail, Exception):
+            raise detail
+        if detail:
+            found[name] = detail
+    return found
+
+
+def _index_by_name(data: Any, names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Pick the requested applications out of a listing response.
+    
+    Args:
+        data (Any): Decoded listing response
+        names (List[str]): Names of the applications to keep
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Application details keyed by name; names not found are absent
+    """
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return {}
+    wanted = set(names)
+    found = {}
+    for item in items:
+        name = _app_name(item)
+        if name in wanted:
+            found[name] = item
+    return found
+
+
+def load_cached_token(server_url: str, username: str) -> Optional[str]:
+    """
+    Get a cached token for a server and user if it is not about to expire.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        username (str): ArgoCD username
+        
+    Returns:
+        Optional[str]: The cached token, or None if there is no usable one
+    """
+    try:
+        cached = orjson.loads(TOKEN_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if cached.get('server_url') != server_url or cached.get('username') != username:
+        return None
+    exp = cached.get('exp')
+    if exp is None or exp - time.time() <= TOKEN_EXPIRY_MARGIN:
+        return None
+    return cached.get('token')
+
+
+def store_cached_token(server_url: str, username: str, token: str) -> None:
+    """
+    Cache a token for later runs, readable only by the current user.
+    
+    Tokens without an exp claim are not cached since their lifetime is unknown.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        username (str): ArgoCD username
+        token (str): Token to cache
+    """
+    exp = _token_expiry(token)
+    if exp is None:
+        return
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps({'server_url': server_url, 'username': username, 'token': token, 'exp': exp}))
+        os.chmod(TOKEN_CACHE_PATH, 0o600)
+    except OSError as e:
+        logger.warning("Failed to cache token: %s", e)
+
+def evict_cached_token() -> None:
+    """Delete the cached token, e.g. after ArgoCD rejected it."""
+    try:
+        TOKEN_CACHE_PATH.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Failed to evict cached token: %s", e)
+
 class ArgoCDTokenFetcher:
     """Helper class to fetch ArgoCD authentication token and perform basic CRUD operations."""
     
@@ -25,16 +267,62 @@ class ArgoCDTokenFetcher:
             verify_tls (bool): Whether to verify TLS certificates (default: True)
         """
         self.server_url = server_url.rstrip('/')
+        # API URLs are fixed once the server is known, so build them here instead of per call
+        self._apps_url = f'{self.server_url}/api/v1/applications'
+        self._session_url = f'{self.server_url}/api/v1/session'
         self.username = username
         self.password = password
         self.verify_tls = verify_tls
         self.session = requests.Session()
+        # All calls go to one host, so keep a few warm keep-alive connections and
+        # retry idempotent requests on transient gateway errors
+        adapter = SharedSSLContextAdapter(
+            verify_tls=verify_tls,
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "PUT", "DELETE"])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.verify = verify_tls
+        self.session.headers.update({'Content-Type': 'application/json'})
         self.token = None
+        # Set when the token came from TOKEN_CACHE_PATH, so a rejection can trigger one re-login
+        self._token_from_cache = False
+        # Back-to-back listings and validations are served from memory for READ_CACHE_TTL
+        self._list_cache = ResponseCache(ttl=READ_CACHE_TTL, max_entries=64)
+        self._validated_token: Optional[str] = None
+        self._validated_until = 0.0
+        # Independent GETs overlap on pooled connections; threads start on first use
+        self._executor = ThreadPoolExecutor(max_workers=SAMPLE_WORKERS)
+
+    def close(self) -> None:
+        """Stop the worker threads and close the pooled session."""
+        self._executor.shutdown()
+        self.session.close()
+
+    def __enter__(self) -> "ArgoCDTokenFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
         
-    def fetch_token(self) -> Optional[str]:
+    def fetch_token(self, use_cache: bool = True) -> Optional[str]:
         """
         Fetch authentication token from ArgoCD server.
         
+        A token cached by an earlier run is reused while it has more than
+        TOKEN_EXPIRY_MARGIN seconds left; freshly issued tokens are cached.
+        
+        Args:
+            use_cache (bool): Whether a cached token may be returned instead of logging in
+        
         Returns:
             Optional[str]: JWT token if successful, None otherwise
             
@@ -42,50 +330,88 @@ class ArgoCDTokenFetcher:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the response is invalid
         """
+        cached = load_cached_token(self.server_url, self.username) if use_cache else None
+        if cached:
+            logger.info("Using cached ArgoCD token")
+            self.token = cached
+            self._token_from_cache = True
+            self.session.headers['Authorization'] = f'Bearer {self.token}'
+            return self.token
+
         try:
-            session_url = urljoin(self.server_url, '/api/v1/session')
+            session_url = self._session_url
             payload = {
                 'username': self.username,
                 'password': self.password
             }
             
-            logger.info(f"Attempting to fetch token from {session_url}")
+            logger.info("Attempting to fetch token from %s", session_url)
             response = self.session.post(
                 session_url,
-                json=payload,
+                data=orjson.dumps(payload),
                 verify=self.verify_tls,
                 timeout=30  # 30 seconds timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             if 'token' not in data:
                 raise ValueError("Token not found in response")
                 
             self.token = data['token']
+            self._token_from_cache = False
+            # Carried by the session on every subsequent request
+            self.session.headers['Authorization'] = f'Bearer {self.token}'
+            store_cached_token(self.server_url, self.username, self.token)
             logger.info("Successfully fetched ArgoCD token")
             return self.token
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch token: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to fetch token: %s", e)
+            _log_error_response(e)
             raise
-        except (KeyError, json.JSONDecodeError) as e:
-            logger.error(f"Invalid response format: {str(e)}")
+        except (KeyError, orjson.JSONDecodeError) as e:
+            logger.error("Invalid response format: %s", e)
             raise ValueError(f"Invalid response format: {str(e)}")
             
+    def _renew_rejected_token(self) -> bool:
+        """
+        Replace a rejected token with a freshly issued one if it came from the cache.
+        
+        Returns:
+            bool: True if a new token was fetched, False if the rejected token was not cached
+        """
+        if not self._token_from_cache:
+            return False
+        logger.info("Cached ArgoCD token was rejected; logging in again")
+        evict_cached_token()
+        self.fetch_token(use_cache=False)
+        return True
+
+    def _list_sanity_check_applications(self) -> List[Dict[str, Any]]:
+        """List application names, retrying once with a new token if a cached one is rejected."""
+        try:
+            return self.list_applications(fields=SANITY_CHECK_FIELDS)
+        except requests.exceptions.HTTPError:
+            if not self._renew_rejected_token():
+                raise
+        return self.list_applications(fields=SANITY_CHECK_FIELDS)
+
     def validate_token(self, token: str) -> bool:
         """
         Validate the fetched token by making a test API call.
         
+        A successful validation is reused for READ_CACHE_TTL seconds.
+        
         Args:
             token (str): JWT token to validate
             
         Returns:
             bool: True if token is valid, False otherwise
         """
+        if token == self._validated_token and time.monotonic() < self._validated_until:
+            return True
         try:
-            test_url = urljoin(self.server_url, '/api/v1/applications')
+            test_url = self._apps_url
             
             headers = {
                 'Authorization': f'Bearer {token}'
@@ -98,56 +424,69 @@ class ArgoCDTokenFetcher:
             )
             
             response.raise_for_status()
+            self._validated_token = token
+            self._validated_until = time.monotonic() + READ_CACHE_TTL
             return True
             
         except requests.exceptions.RequestException:
             return False
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers with authentication token."""
+    def _require_token(self) -> None:
+        """Ensure a token has been fetched; the session sends it with every request."""
         if not self.token:
             raise ValueError("No token available. Please fetch token first.")
-        return {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
 
-    def list_applications(self, project: Optional[str] = None, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_applications(
+        self,
+        project: Optional[str] = None,
+        namespace: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all ArgoCD applications with optional filtering.
         
         Args:
             project (str, optional): Filter by project name
             namespace (str, optional): Filter by namespace
+            limit (int, optional): Maximum number of applications to return
+            fields (str, optional): Comma-separated field selector (e.g. 'items.metadata.name')
+                so the server only sends the parts of each application the caller reads
             
         Returns:
-            List[Dict[str, Any]]: List of applications
+            List[Dict[str, Any]]: List of applications, empty on failure
             
         Raises:
-            requests.exceptions.RequestException: If the request fails
-            ValueError: If no token is available
+            requests.exceptions.HTTPError: If the token is rejected (401/403)
         """
         try:
-            url = urljoin(self.server_url, '/api/v1/applications')
+            self._require_token()
+            url = self._apps_url
             params = {}
             if project:
                 params['project'] = project
             if namespace:
                 params['namespace'] = namespace
+            params.update(_paging_params(limit, fields))
+            cache_key = (self.token, tuple(sorted(params.items())))
+            cached = self._list_cache.get(cache_key)
+            if cached is not None and cached.fresh:
+                return cached.payload
 
             response = self.session.get(
                 url,
-                headers=self._get_headers(),
                 params=params,
                 verify=self.verify_tls,
                 timeout=30
             )
+            if response.status_code == HTTP_NOT_FOUND:
+                return []
             response.raise_for_status()
             
             # Parse response and handle potential None values
-            data = response.json()
+            data = orjson.loads(response.content)
             if not isinstance(data, dict):
-                logger.warning(f"Unexpected response format: {data}")
+                logger.warning("Unexpected response format: %s", data)
                 return []
                 
             items = data.get('items')
@@ -156,21 +495,25 @@ class ArgoCDTokenFetcher:
                 return []
                 
             if not isinstance(items, list):
-                logger.warning(f"Expected list of items, got {type(items)}")
+                logger.warning("Expected list of items, got %s", type(items))
                 return []
                 
+            # Older servers ignore the limit parameter
+            items = items[:limit] if limit is not None else items
+            self._list_cache.put(cache_key, None, items)
             return items
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to list applications: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to list applications: %s", e)
+            _log_error_response(e)
+            if e.response is not None and e.response.status_code in AUTH_FAILURE_STATUSES:
+                raise
             return []
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse response JSON: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse response JSON: %s", e)
             return []
         except Exception as e:
-            logger.error(f"Unexpected error in list_applications: {str(e)}")
+            logger.error("Unexpected error in list_applications: %s", e)
             return []
 
     def get_application(self, name: str) -> Dict[str, Any]:
@@ -181,26 +524,86 @@ class ArgoCDTokenFetcher:
             name (str): Name of the application
             
         Returns:
-            Dict[str, Any]: Application details
+            Dict[str, Any]: Application details, or an empty dict if there is no such application
             
         Raises:
             requests.exceptions.RequestException: If the request fails
             ValueError: If no token is available
         """
         try:
-            url = urljoin(self.server_url, f'/api/v1/applications/{name}')
+            self._require_token()
+            url = f'{self._apps_url}/{name}'
             response = self.session.get(
                 url,
-                headers=self._get_headers(),
+                verify=self.verify_tls,
+                timeout=30
+            )
+            # Checked directly so a missing application, common while exploring, raises nothing
+            if response.status_code == HTTP_OK:
+                return orjson.loads(response.content)
+            if response.status_code == HTTP_NOT_FOUND:
+                return {}
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to get application %s: %s", name, e)
+            _log_error_response(e)
+            raise
+
+    def _get_application_or_error(self, name: str) -> Union[Dict[str, Any], Exception]:
+        """Get an application's details, returning the error instead of raising it."""
+        try:
+            return self.get_application(name)
+        except Exception as e:
+            return e
+
+    def get_applications(self, names: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Get details of several applications in parallel on the worker threads.
+        
+        Args:
+            names (List[str]): Names of the applications
+            
+        Returns:
+            List[Union[Dict[str, Any], Exception]]: Details per name, in order, or the error raised for it
+        """
+        return list(self._executor.map(self._get_application_or_error, names))
+
+    def get_applications_bulk(self, names: List[str], project: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details of several applications keyed by name.
+        
+        A single name is fetched through a filtered listing; several names are fetched
+        one by one in parallel, since ArgoCD cannot filter a listing by more than one name.
+        
+        Args:
+            names (List[str]): Names of the applications
+            project (str, optional): Project of a single requested application, narrowing the listing
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Application details keyed by name; names not found are absent
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If no token is available
+        """
+        if not names:
+            return {}
+        if len(names) > 1:
+            return _collate_details(names, self.get_applications(names))
+        try:
+            self._require_token()
+            response = self.session.get(
+                self._apps_url,
+                params=_bulk_params(names[0], project),
                 verify=self.verify_tls,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
+            return _index_by_name(orjson.loads(response.content), names)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get application {name}: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to get applications %s: %s", names, e)
+            _log_error_response(e)
             raise
 
     def create_application(self, application_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -218,20 +621,20 @@ class ArgoCDTokenFetcher:
             ValueError: If no token is available
         """
         try:
-            url = urljoin(self.server_url, '/api/v1/applications')
+            self._require_token()
+            url = self._apps_url
             response = self.session.post(
                 url,
-                headers=self._get_headers(),
-                json=application_data,
+                data=orjson.dumps(application_data),
                 verify=self.verify_tls,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
+            self._list_cache.clear()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to create application: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to create application: %s", e)
+            _log_error_response(e)
             raise
 
     def update_application(self, name: str, application_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -250,20 +653,20 @@ class ArgoCDTokenFetcher:
             ValueError: If no token is available
         """
         try:
-            url = urljoin(self.server_url, f'/api/v1/applications/{name}')
+            self._require_token()
+            url = f'{self._apps_url}/{name}'
             response = self.session.put(
                 url,
-                headers=self._get_headers(),
-                json=application_data,
+                data=orjson.dumps(application_data),
                 verify=self.verify_tls,
                 timeout=30
             )
             response.raise_for_status()
-            return response.json()
+            self._list_cache.clear()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to update application {name}: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to update application %s: %s", name, e)
+            _log_error_response(e)
             raise
 
     def delete_application(self, name: str, cascade: bool = True) -> bool:
@@ -282,38 +685,43 @@ class ArgoCDTokenFetcher:
             ValueError: If no token is available
         """
         try:
-            url = urljoin(self.server_url, f'/api/v1/applications/{name}')
+            self._require_token()
+            url = f'{self._apps_url}/{name}'
             params = {'cascade': str(cascade).lower()}
             response = self.session.delete(
                 url,
-                headers=self._get_headers(),
                 params=params,
                 verify=self.verify_tls,
                 timeout=30
             )
             response.raise_for_status()
+            self._list_cache.clear()
             return True
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to delete application {name}: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
+            logger.error("Failed to delete application %s: %s", name, e)
+            _log_error_response(e)
             raise
 
-    def perform_sanity_check(self) -> Dict[str, Any]:
+    def perform_sanity_check(self, sample_size: int = 1) -> Dict[str, Any]:
         """
         Perform a sanity check of the ArgoCD connection and token.
         
+        Args:
+            sample_size (int): Number of applications whose details are fetched in parallel
+            
         Returns:
             Dict[str, Any]: Sanity check results including:
                 - token_valid (bool): Whether the token is valid
                 - applications_count (int): Number of applications found
                 - sample_application (Dict[str, Any]): Details of first application if any
+                - sample_applications (List[Dict[str, Any]]): Details of the sampled applications
                 - error (str): Error message if any
         """
         result = {
             'token_valid': False,
             'applications_count': 0,
             'sample_application': None,
+            'sample_applications': [],
             'error': None
         }
 
@@ -322,30 +730,34 @@ class ArgoCDTokenFetcher:
             if not self.token:
                 self.fetch_token()
 
-            # Validate token
-            if not self.validate_token(self.token):
+            # Listing applications doubles as the token check, since a rejected token raises;
+            # only the names are needed to count and sample them
+            try:
+                applications = self._list_sanity_check_applications()
+            except requests.exceptions.HTTPError:
+                result['error'] = "Token validation failed"
+                return result
+            # An empty listing may also mean the request failed, so only then is the token checked on its own
+            if not applications and not self.validate_token(self.token):
                 result['error'] = "Token validation failed"
                 return result
 
             result['token_valid'] = True
-
-            # Try to list applications
-            applications = self.list_applications()
             if applications is None:
                 result['error'] = "Failed to list applications"
                 return result
                 
             result['applications_count'] = len(applications)
 
-            # If we have applications, get details of the first one
-            if applications and len(applications) > 0:
-                first_app = applications[0]
-                app_name = first_app.get('metadata', {}).get('name')
-                if app_name:
-                    try:
-                        result['sample_application'] = self.get_application(app_name)
-                    except Exception as e:
-                        result['error'] = f"Failed to get sample application details: {str(e)}"
+            # Get details of the first applications, overlapping the requests
+            names = [name for name in map(_app_name, applications[:sample_size]) if name]
+            for detail in self.get_applications(names):
+                if isinstance(detail, Exception):
+                    result['error'] = f"Failed to get sample application details: {str(detail)}"
+                else:
+                    result['sample_applications'].append(detail)
+            if result['sample_applications']:
+                result['sample_application'] = result['sample_applications'][0]
 
             return result
 
@@ -353,38 +765,444 @@ class ArgoCDTokenFetcher:
             result['error'] = str(e)
             return result
 
-def main():
-    """Main function to demonstrate token fetching and sanity check."""
-    server_url = os.getenv('ARGOCD_SERVER')
-    username = os.getenv('ARGOCD_USERNAME')
-    password = os.getenv('ARGOCD_PASSWORD')
-    verify_tls = os.getenv('ARGOCD_VERIFY_TLS', 'true').lower() == 'true'
-    
-    if not all([server_url, username, password]):
-        logger.error("Missing required environment variables")
-        logger.error("Please set ARGOCD_SERVER, ARGOCD_USERNAME, and ARGOCD_PASSWORD")
-        sys.exit(1)
-    
-    try:
-        fetcher = ArgoCDTokenFetcher(
-            server_url=server_url,
-            username=username,
-            password=password,
-            verify_tls=verify_tls
+class AsyncArgoCDTokenFetcher:
+    """Async counterpart of ArgoCDTokenFetcher that fans independent reads out concurrently."""
+
+    def __init__(self, server_url: str, username: str, password: str, verify_tls: bool = True):
+        """
+        Initialize the async ArgoCD token fetcher.
+        
+        Args:
+            server_url (str): ArgoCD server URL (e.g., https://argocd.example.com)
+            username (str): ArgoCD username
+            password (str): ArgoCD password
+            verify_tls (bool): Whether to verify TLS certificates (default: True)
+        """
+        self.server_url = server_url.rstrip('/')
+        # API URLs are fixed once the server is known, so build them here instead of per call
+        self._apps_url = f'{self.server_url}/api/v1/applications'
+        self._session_url = f'{self.server_url}/api/v1/session'
+        self.username = username
+        self.password = password
+        self.verify_tls = verify_tls
+        # One pooled session so concurrent calls share warm keep-alive connections;
+        # created lazily because aiohttp sessions must be made on the running loop
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.token = None
+        # Set when the token came from TOKEN_CACHE_PATH, so a rejection can trigger one re-login
+        self._token_from_cache = False
+        # Back-to-back listings and validations are served from memory for READ_CACHE_TTL
+        self._list_cache = ResponseCache(ttl=READ_CACHE_TTL, max_entries=64)
+        self._validated_token: Optional[str] = None
+        self._validated_until = 0.0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = create_pooled_session(bypass_tls=not self.verify_tls)
+        return self.session
+
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self.session is not None:
+            await self.session.close()
+
+    async def __aenter__(self) -> "AsyncArgoCDTokenFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _headers(self) -> Dict[str, str]:
+        """Get headers with authentication token."""
+        if not self.token:
+            raise ValueError("No token available. Please fetch token first.")
+        return {'Authorization': f'Bearer {self.token}'}
+
+    async def fetch_token(self, use_cache: bool = True) -> Optional[str]:
+        """
+        Fetch authentication token from ArgoCD server.
+        
+        A token cached by an earlier run is reused while it has more than
+        TOKEN_EXPIRY_MARGIN seconds left; freshly issued tokens are cached.
+        
+        Args:
+            use_cache (bool): Whether a cached token may be returned instead of logging in
+        
+        Returns:
+            Optional[str]: JWT token if successful, None otherwise
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If the response is invalid
+        """
+        cached = load_cached_token(self.server_url, self.username) if use_cache else None
+        if cached:
+            logger.info("Using cached ArgoCD token")
+            self.token = cached
+            self._token_from_cache = True
+            return self.token
+
+        session_url = self._session_url
+        logger.info("Attempting to fetch token from %s", session_url)
+        async with self._get_session().post(
+            session_url,
+            data=orjson.dumps({'username': self.username, 'password': self.password}),
+            headers={'Content-Type': 'application/json'}
+        ) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        if 'token' not in data:
+            raise ValueError("Token not found in response")
+        self.token = data['token']
+        self._token_from_cache = False
+        store_cached_token(self.server_url, self.username, self.token)
+        logger.info("Successfully fetched ArgoCD token")
+        return self.token
+
+    async def _renew_rejected_token(self) -> bool:
+        """
+        Replace a rejected token with a freshly issued one if it came from the cache.
+        
+        Returns:
+            bool: True if a new token was fetched, False if the rejected token was not cached
+        """
+        if not self._token_from_cache:
+            return False
+        logger.info("Cached ArgoCD token was rejected; logging in again")
+        evict_cached_token()
+        await self.fetch_token(use_cache=False)
+        return True
+
+    async def _list_sanity_check_applications(self) -> List[Dict[str, Any]]:
+        """List application names, retrying once with a new token if a cached one is rejected."""
+        try:
+            return await self.list_applications(fields=SANITY_CHECK_FIELDS)
+        except aiohttp.ClientResponseError:
+            if not await self._renew_rejected_token():
+                raise
+        return await self.list_applications(fields=SANITY_CHECK_FIELDS)
+
+    async def validate_token(self, token: str) -> bool:
+        """
+        Validate a token by making a test API call.
+        
+        A successful validation is reused for READ_CACHE_TTL seconds.
+        
+        Args:
+            token (str): JWT token to validate
+            
+        Returns:
+            bool: True if token is valid, False otherwise
+        """
+        if token == self._validated_token and time.monotonic() < self._validated_until:
+            return True
+        try:
+            async with self._get_session().get(
+                self._apps_url,
+                headers={'Authorization': f'Bearer {token}'}
+            ) as response:
+                if not response.ok:
+                    return False
+        except aiohttp.ClientError:
+            return False
+        self._validated_token = token
+        self._validated_until = time.monotonic() + READ_CACHE_TTL
+        return True
+
+    async def list_applications(
+        self,
+        project: Optional[str] = None,
+        namespace: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List all ArgoCD applications with optional filtering.
+        
+        Args:
+            project (str, optional): Filter by project name
+            namespace (str, optional): Filter by namespace
+            limit (int, optional): Maximum number of applications to return
+            fields (str, optional): Comma-separated field selector, see ArgoCDTokenFetcher.list_applications
+            
+        Returns:
+            List[Dict[str, Any]]: List of applications, empty on failure
+            
+        Raises:
+            aiohttp.ClientResponseError: If the token is rejected (401/403)
+        """
+        params = {}
+        if project:
+            params['project'] = project
+        if namespace:
+            params['namespace'] = namespace
+        params.update(_paging_params(limit, fields))
+        cache_key = (self.token, tuple(sorted(params.items())))
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached.fresh:
+            return cached.payload
+        try:
+            async with self._get_session().get(
+                self._apps_url,
+                headers=self._headers(),
+                params=params
+            ) as response:
+                if response.status == HTTP_NOT_FOUND:
+                    return []
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as e:
+            logger.error("Failed to list applications: %s", e)
+            if e.status in AUTH_FAILURE_STATUSES:
+                raise
+            return []
+        except Exception as e:
+            logger.error("Failed to list applications: %s", e)
+            return []
+        items = data.get('items') if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            return []
+        items = items[:limit] if limit is not None else items
+        self._list_cache.put(cache_key, None, items)
+        return items
+
+    async def get_application(self, name: str) -> Dict[str, Any]:
+        """
+        Get details of a specific ArgoCD application.
+        
+        Args:
+            name (str): Name of the application
+            
+        Returns:
+            Dict[str, Any]: Application details, or an empty dict if there is no such application
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If no token is available
+        """
+        async with self._get_session().get(
+            f'{self._apps_url}/{name}',
+            headers=self._headers()
+        ) as response:
+            if response.status == HTTP_NOT_FOUND:
+                return {}
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+
+    async def get_applications(self, names: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Get details of several applications concurrently.
+        
+        Args:
+            names (List[str]): Names of the applications
+            
+        Returns:
+            List[Union[Dict[str, Any], Exception]]: Details per name, in order, or the error raised for it
+        """
+        return await asyncio.gather(*(self.get_application(name) for name in names), return_exceptions=True)
+
+    async def get_applications_bulk(self, names: List[str], project: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details of several applications keyed by name.
+        
+        A single name is fetched through a filtered listing; several names are fetched
+        concurrently one by one, see ArgoCDTokenFetcher.get_applications_bulk.
+        
+        Args:
+            names (List[str]): Names of the applications
+            project (str, optional): Project of a single requested application, narrowing the listing
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Application details keyed by name; names not found are absent
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If no token is available
+        """
+        if not names:
+            return {}
+        if len(names) > 1:
+            return _collate_details(names, await self.get_applications(names))
+        async with self._get_session().get(
+            self._apps_url,
+            headers=self._headers(),
+            params=_bulk_params(names[0], project)
+        ) as response:
+            response.raise_for_status()
+            return _index_by_name(orjson.loads(await response.read()), names)
+
+    async def create_application(self, application_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new ArgoCD application.
+        
+        Args:
+            application_data (Dict[str, Any]): Application configuration
+            
+        Returns:
+            Dict[str, Any]: Created application details
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If no token is available
+        """
+        async with self._get_session().post(
+            self._apps_url,
+            data=orjson.dumps(application_data),
+            headers={**self._headers(), 'Content-Type': 'application/json'}
+        ) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        self._list_cache.clear()
+        return data
+
+    async def update_application(self, name: str, application_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing ArgoCD application.
+        
+        Args:
+            name (str): Name of the application
+            application_data (Dict[str, Any]): Updated application configuration
+            
+        Returns:
+            Dict[str, Any]: Updated application details
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If no token is available
+        """
+        async with self._get_session().put(
+            f'{self._apps_url}/{name}',
+            data=orjson.dumps(application_data),
+            headers={**self._headers(), 'Content-Type': 'application/json'}
+        ) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        self._list_cache.clear()
+        return data
+
+    async def delete_application(self, name: str, cascade: bool = True) -> bool:
+        """
+        Delete an ArgoCD application.
+        
+        Args:
+            name (str): Name of the application
+            cascade (bool): Whether to cascade delete (default: True)
+            
+        Returns:
+            bool: True if deletion was successful
+            
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If no token is available
+        """
+        async with self._get_session().delete(
+            f'{self._apps_url}/{name}',
+            headers=self._headers(),
+            params={'cascade': str(cascade).lower()}
+        ) as response:
+            response.raise_for_status()
+        self._list_cache.clear()
+        return True
+
+    async def delete_applications(self, names: List[str], cascade: bool = True) -> List[Union[bool, Exception]]:
+        """
+        Delete several applications concurrently.
+        
+        Args:
+            names (List[str]): Names of the applications
+            cascade (bool): Whether to cascade delete (default: True)
+            
+        Returns:
+            List[Union[bool, Exception]]: True per deleted name, in order, or the error raised for it
+        """
+        return await asyncio.gather(
+            *(self.delete_application(name, cascade) for name in names), return_exceptions=True
         )
+
+    async def perform_sanity_check(self, sample_size: int = 1) -> Dict[str, Any]:
+        """
+        Perform a sanity check of the ArgoCD connection and token.
+        
+        Args:
+            sample_size (int): Number of applications whose details are fetched concurrently
+            
+        Returns:
+            Dict[str, Any]: Same fields as ArgoCDTokenFetcher.perform_sanity_check
+        """
+        result = {
+            'token_valid': False,
+            'applications_count': 0,
+            'sample_application': None,
+            'sample_applications': [],
+            'error': None
+        }
+
+        try:
+            if not self.token:
+                await self.fetch_token()
+
+            # Listing applications doubles as the token check, see ArgoCDTokenFetcher.perform_sanity_check
+            try:
+                applications = await self._list_sanity_check_applications()
+            except aiohttp.ClientResponseError:
+                result['error'] = "Token validation failed"
+                return result
+            if not applications and not await self.validate_token(self.token):
+                result['error'] = "Token validation failed"
+                return result
+
+            result['token_valid'] = True
+
+            result['applications_count'] = len(applications)
+
+            names = [name for name in map(_app_name, applications[:sample_size]) if name]
+            for detail in await self.get_applications(names):
+                if isinstance(detail, Exception):
+                    result['error'] = f"Failed to get sample application details: {str(detail)}"
+                else:
+                    result['sample_applications'].append(detail)
+            if result['sample_applications']:
+                result['sample_application'] = result['sample_applications'][0]
+
+            return result
+
+        except Exception as e:
+            result['error'] = str(e)
+            return result
+
+async def run_sanity_check(server_url: str, username: str, password: str, verify_tls: bool) -> int:
+    """
+    Fetch a token, run the sanity check and print the results.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        username (str): ArgoCD username
+        password (str): ArgoCD password
+        verify_tls (bool): Whether to verify TLS certificates
         
+    Returns:
+        int: Process exit code
+    """
+    # Closing the fetcher releases its pooled connections
+    async with AsyncArgoCDTokenFetcher(
+        server_url=server_url,
+        username=username,
+        password=password,
+        verify_tls=verify_tls
+    ) as fetcher:
         # Fetch token
-        token = fetcher.fetch_token()
+        token = await fetcher.fetch_token()
         if not token:
             logger.error("Failed to fetch token")
-            sys.exit(1)
-            
+            return 1
+
         # Print token
         print("\nArgoCD Token:")
         print(f"{token}")
-            
-        # Perform sanity check
-        sanity_check = fetcher.perform_sanity_check()
+
+        # Perform sanity check; sampled application details are fetched concurrently
+        sanity_check = await fetcher.perform_sanity_check()
         print("\nSanity Check Results:")
         print(f"Token Valid: {sanity_check['token_valid']}")
         print(f"Applications Count: {sanity_check['applications_count']}")
@@ -392,13 +1210,33 @@ def main():
             print(f"Error: {sanity_check['error']}")
         if sanity_check['sample_application']:
             print("\nSample Application Details:")
-            print(json.dumps(sanity_check['sample_application'], indent=2))
-            
-        sys.exit(0)
-                
+            print(orjson.dumps(sanity_check['sample_application'], option=orjson.OPT_INDENT_2).decode())
+    return 0
+
+def main():
+    """Main function to demonstrate token fetching and sanity check."""
+    # Logging is configured only when run as a script, never on import as a library
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    server_url = os.getenv('ARGOCD_SERVER')
+    username = os.getenv('ARGOCD_USERNAME')
+    password = os.getenv('ARGOCD_PASSWORD')
+    verify_tls = os.getenv('ARGOCD_VERIFY_TLS', 'true').lower() == 'true'
+    
+    if not all([server_url, username, password]):
+        logger.error("Missing required environment variables")
+        logger.error("Please set ARGOCD_SERVER, ARGOCD_USERNAME, and ARGOCD_PASSWORD")
+        sys.exit(1)
+    
+    try:
+        exit_code = asyncio.run(run_sanity_check(server_url, username, password, verify_tls))
     except Exception as e:
-        logger.error(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         sys.exit(1)
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main()
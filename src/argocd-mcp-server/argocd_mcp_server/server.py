@@ -1,9 +1,15 @@
 """ARGOCD MCP Server implementation for managing application and deployments at kubernetes"""
 import argparse
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from argocd_mcp_server.core.tools.argocd_application_handler import ArgoCDApplicationHandler
 from argocd_mcp_server.core.tools.argocd_resource_handler import ArgoCDResourceHandler
-from argocd_mcp_server.static import ARGOCD_MCP_INSTRUCTIONS, ARGOCD_BEST_PRACTICES, ARGOCD_WORKFLOW
+from argocd_mcp_server.models.examples import attach_openapi_examples
+from argocd_mcp_server.utils.argocd_api_helper import SharedSession, close_sessions
+from argocd_mcp_server.utils.cache import LISTING_CACHE_TTL, ResponseCache
+from argocd_mcp_server import static
 
 mcp = FastMCP(
     'argocd_mcp_server',
@@ -15,12 +21,18 @@ SERVER_DEPENDENCIES = [
     'loguru',
 ]
 
-def create_server():
+def create_server(
+    lifespan: Optional[Callable[[FastMCP], AbstractAsyncContextManager[None]]] = None,
+):
     """Creates and returns a FastMCP server instance for ArgoCD operations."""
+    # The server exports the models' JSON schemas, so they carry their documentation examples;
+    # importing the models alone (scripts, tests) skips that cost
+    attach_openapi_examples()
     return FastMCP(
         'argocd-mcp-server',
-        instructions=f'{ARGOCD_MCP_INSTRUCTIONS}',
+        instructions=static.ARGOCD_MCP_INSTRUCTIONS,
         dependencies=SERVER_DEPENDENCIES,
+        lifespan=lifespan,
     )
 
 def main():
@@ -41,10 +53,34 @@ def main():
     args = parser.parse_args()
     allow_write = args.allow_write
     bypass_tls = args.bypass_tls
-    mcp = create_server()
+    handlers = []
+    # Both handlers talk to the same ArgoCD server, so they share one connection pool
+    shared_session = SharedSession(bypass_tls)
+    # Application writes clear the resource handler's cached reads through this shared cache
+    shared_cache = ResponseCache(ttl=LISTING_CACHE_TTL)
 
-    ArgoCDApplicationHandler(mcp, allow_write=allow_write, bypass_tls=bypass_tls)
-    ArgoCDResourceHandler(mcp, allow_write=allow_write, bypass_tls=bypass_tls)
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        """Open the handlers' pooled HTTP sessions on startup and release them on shutdown."""
+        async with AsyncExitStack() as stack:
+            stack.push_async_callback(close_sessions)
+            stack.push_async_callback(shared_session.close)
+            for handler in handlers:
+                await stack.enter_async_context(handler)
+            yield
+        # Drain log records still queued for the background logging thread
+        await logger.complete()
+
+    mcp = create_server(lifespan=lifespan)
+
+    handlers.append(ArgoCDApplicationHandler(
+        mcp, allow_write=allow_write, bypass_tls=bypass_tls,
+        shared_session=shared_session, shared_cache=shared_cache,
+    ))
+    handlers.append(ArgoCDResourceHandler(
+        mcp, allow_write=allow_write, bypass_tls=bypass_tls,
+        shared_session=shared_session, shared_cache=shared_cache,
+    ))
     
     @mcp.resource(
         name='argocd_best_practices',
@@ -54,7 +90,7 @@ def main():
     )
     async def argocd_best_practices() -> str:
         """Provides ArgoCD Best Practices guidance."""
-        return ARGOCD_BEST_PRACTICES
+        return static.ARGOCD_BEST_PRACTICES
 
     @mcp.resource(
         name='argocd_workflow_guide',
@@ -64,7 +100,7 @@ def main():
     )
     async def argocd_workflow_guide() -> str:
         """Provides the ArgoCD Development Workflow guide."""
-        return ARGOCD_WORKFLOW
+        return static.ARGOCD_WORKFLOW
     
     mcp.run()
 
@@ -1,23 +1,27 @@
+from functools import lru_cache
 from importlib import resources
 
-with (
-    resources.files('argocd_mcp_server.static')
-    .joinpath('ARGOCD_MCP_INSTRUCTIONS.md')
-    .open('r', encoding='utf-8') as f
-):
-    ARGOCD_MCP_INSTRUCTIONS = f.read()
+# Module attributes served from the Markdown files of this package
+_DOCUMENTS = {
+    'ARGOCD_MCP_INSTRUCTIONS': 'ARGOCD_MCP_INSTRUCTIONS.md',
+    'ARGOCD_WORKFLOW': 'ARGOCD_WORKFLOW.md',
+    'ARGOCD_BEST_PRACTICES': 'ARGOCD_BEST_PRACTICES.md',
+}
 
 
-with (
-    resources.files('argocd_mcp_server.static')
-    .joinpath('ARGOCD_WORKFLOW.md')
-    .open('r', encoding='utf-8') as f
-):
-    ARGOCD_WORKFLOW = f.read()
+# Resolved once; each document is then a single read relative to it
+_PACKAGE_DIR = resources.files(__name__)
 
-with (
-    resources.files('argocd_mcp_server.static')
-    .joinpath('ARGOCD_BEST_PRACTICES.md')
-    .open('r', encoding='utf-8') as f
-):
-    ARGOCD_BEST_PRACTICES = f.read()
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def _load(filename: str) -> str:
+    """Read a bundled Markdown document once, on first request."""
+    return _PACKAGE_DIR.joinpath(filename).read_text(encoding='utf-8')
+
+
+def __getattr__(name: str) -> str:
+    # Documents are only read when first accessed, so unused ones are never loaded
+    try:
+        return _load(_DOCUMENTS[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -0,0 +1,70 @@
+import aiohttp
+import asyncio
+import pytest
+from argocd_mcp_server.utils import argocd_api_helper
+from argocd_mcp_server.utils.argocd_api_helper import (
+    argocd_api_get_workload_logs,
+    argocd_api_stream_pod_logs,
+    argocd_api_stream_workload_logs,
+    cached_api_call,
+)
+from unittest.mock import MagicMock, patch
+
+
+HELPER = 'argocd_mcp_server.utils.argocd_api_helper'
+
+async def get_logs(follow):
+    return await argocd_api_get_workload_logs(
+        'https://argocd.example.com', 'test-token', 'guestbook', 'guestbook-ui', 'Deployment',
+        follow=follow,
+    )
+
+@pytest.mark.asyncio
+async def test_follow_logs_stop_at_deadline_and_keep_buffered_lines():
+    async def endless(*args, **kwargs):
+        count = 0
+        while True:
+            yield {'content': f'line {count}'}
+            count += 1
+            await asyncio.sleep(0.01)
+
+    with patch(f'{HELPER}.argocd_api_stream_workload_logs', endless), \
+            patch.object(argocd_api_helper, 'LOG_FOLLOW_DEADLINE', 0.05):
+        result = await asyncio.wait_for(get_logs(follow=True), 1)
+    assert result['logs']
+    assert result['logs'][0] == {'content': 'line 0'}
+
+@pytest.mark.asyncio
+async def test_stalled_read_keeps_buffered_lines():
+    async def stalled(*args, **kwargs):
+        yield {'content': 'line 0'}
+        raise aiohttp.ServerTimeoutError('Timeout on reading data from socket')
+
+    with patch(f'{HELPER}.argocd_api_stream_workload_logs', stalled):
+        result = await get_logs(follow=False)
+    assert result == {'logs': [{'content': 'line 0'}]}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('stream', [
+    lambda session: argocd_api_stream_pod_logs(
+        'https://argocd.example.com', 'test-token', 'guestbook', 'guestbook-ui-0',
+        tail_lines=None, session=session,
+    ),
+    lambda session: argocd_api_stream_workload_logs(
+        'https://argocd.example.com', 'test-token', 'guestbook', 'guestbook-ui', 'Deployment',
+        tail_lines=None, session=session,
+    ),
+])
+async def test_unbounded_tail_omits_tail_lines(stream):
+    session = MagicMock(get=MagicMock(side_effect=aiohttp.ClientConnectionError))
+    with pytest.raises(aiohttp.ClientConnectionError):
+        async for _ in stream(session):
+            pass
+    assert 'tailLines' not in session.get.call_args.args[0].query
+
+@pytest.mark.asyncio
+async def test_cached_call_uses_the_callers_session_and_tls_mode():
+    session = MagicMock(get=MagicMock(side_effect=aiohttp.ClientConnectionError))
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await cached_api_call('https://argocd.example.com/api/v1/applications', (), bypass_tls=True, session=session)
+    assert session.get.call_args.kwargs['ssl'] is False
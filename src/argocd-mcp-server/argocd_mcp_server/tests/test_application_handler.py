@@ -0,0 +1,125 @@
+import aiohttp
+import pytest
+from argocd_mcp_server.core.tools.argocd_application_handler import ArgoCDApplicationHandler
+from argocd_mcp_server.core.tools.argocd_resource_handler import ArgoCDResourceHandler
+from argocd_mcp_server.models.application import (
+    DeleteApplicationResponse,
+    GetApplicationResponse,
+    SyncApplicationResponse,
+)
+from argocd_mcp_server.utils.cache import ResponseCache
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+HANDLER = 'argocd_mcp_server.core.tools.argocd_application_handler'
+
+ARGOCD_APP = {
+    'metadata': {'name': 'guestbook', 'namespace': 'argocd'},
+    'spec': {
+        'project': 'default',
+        'source': {'repoURL': 'https://github.com/argoproj/argocd-example-apps', 'path': 'guestbook'},
+        'destination': {'server': 'https://kubernetes.default.svc', 'namespace': 'default'},
+    },
+    'status': {'sync': {'status': 'Synced'}, 'health': {'status': 'Healthy'}},
+}
+
+@pytest.fixture
+def mock_context():
+    ctx = MagicMock()
+    ctx.request_id = 'test-request-id'
+    ctx.client_id = 'test-user'
+    return ctx
+
+@pytest.fixture
+def handler():
+    return ArgoCDApplicationHandler(
+        MagicMock(), token='test-token', server_url='https://argocd.example.com', allow_write=True
+    )
+
+async def manage(handler, ctx, operation, name='guestbook'):
+    # Tool arguments default to pydantic Field objects, so every one is passed explicitly
+    return await handler.manage_application(
+        operation=operation,
+        name=name,
+        project='default',
+        repo_url='https://github.com/argoproj/argocd-example-apps',
+        path='guestbook',
+        target_revision='HEAD',
+        destination_server='https://kubernetes.default.svc',
+        destination_namespace='default',
+        sync_policy='manual',
+        sync_options=None,
+        prune_propagation_policy=None,
+        finalizer=False,
+        namespace='argocd',
+        ctx=ctx,
+    )
+
+def test_ok_factories_build_success_responses():
+    deleted = DeleteApplicationResponse.ok('gone')
+    assert deleted.success is True
+    assert deleted.message == 'gone'
+    # Memoized per message
+    assert DeleteApplicationResponse.ok('gone') is deleted
+    assert SyncApplicationResponse.ok().status_code == 200
+    assert GetApplicationResponse.ok(application=None).success is True
+
+@pytest.mark.asyncio
+async def test_delete_application_success(handler, mock_context):
+    with patch(f'{HANDLER}.argocd_api_delete', AsyncMock(return_value={})):
+        result = await manage(handler, mock_context, 'delete')
+    await handler.close()
+    assert isinstance(result, DeleteApplicationResponse)
+    assert result.success
+    assert result.message == 'Application deleted successfully.'
+
+@pytest.mark.asyncio
+async def test_sync_application_success(handler, mock_context):
+    with patch(f'{HANDLER}.argocd_api_post_sync', AsyncMock(return_value={})) as mock_sync:
+        result = await manage(handler, mock_context, 'sync')
+    await handler.close()
+    assert isinstance(result, SyncApplicationResponse)
+    assert result.success
+    assert mock_sync.await_args.args[0] == '/api/v1/applications/guestbook/sync'
+
+@pytest.mark.asyncio
+async def test_get_application_returns_mapped_application(handler, mock_context):
+    with patch(f'{HANDLER}.argocd_api_get', AsyncMock(return_value=ARGOCD_APP)):
+        result = await manage(handler, mock_context, 'get')
+    await handler.close()
+    assert isinstance(result, GetApplicationResponse)
+    assert result.success
+    assert result.application.metadata.name == 'guestbook'
+    assert result.application.spec.source.path == 'guestbook'
+
+@pytest.mark.asyncio
+async def test_get_application_not_found(handler, mock_context):
+    with patch(f'{HANDLER}.argocd_api_get', AsyncMock(return_value=None)):
+        result = await manage(handler, mock_context, 'get', name='missing')
+    await handler.close()
+    assert isinstance(result, GetApplicationResponse)
+    assert not result.success
+    assert result.status_code == 404
+
+@pytest.mark.asyncio
+async def test_writes_clear_the_shared_resource_cache(mock_context):
+    cache = ResponseCache(ttl=30)
+    handler = ArgoCDApplicationHandler(
+        MagicMock(), token='test-token', server_url='https://argocd.example.com',
+        allow_write=True, shared_cache=cache,
+    )
+    resources = ArgoCDResourceHandler(
+        MagicMock(), token='test-token', server_url='https://argocd.example.com', shared_cache=cache,
+    )
+    assert resources._cache is cache
+    cache.put('tree', None, {'nodes': []})
+    failure = aiohttp.ClientResponseError(MagicMock(), (), status=403, message='forbidden')
+    with patch(f'{HANDLER}.argocd_api_post_sync', AsyncMock(side_effect=failure)):
+        await manage(handler, mock_context, 'sync')
+    # A rejected write changed nothing, so cached reads stay
+    assert cache.get('tree') is not None
+    with patch(f'{HANDLER}.argocd_api_post_sync', AsyncMock(return_value={})):
+        await manage(handler, mock_context, 'sync')
+    assert cache.get('tree') is None
+    await handler.close()
+    await resources.close()
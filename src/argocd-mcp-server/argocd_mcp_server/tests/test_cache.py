@@ -0,0 +1,50 @@
+from argocd_mcp_server.utils.cache import ResponseCache
+from unittest.mock import patch
+
+
+CLOCK = 'argocd_mcp_server.utils.cache.time.monotonic'
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(ttl=30, max_entries=2)
+    cache.put('a', None, 1)
+    cache.put('b', None, 2)
+    # Reading a makes b the least recently used
+    cache.get('a')
+    cache.put('c', None, 3)
+    assert cache.get('b') is None
+    assert cache.get('a').payload == 1
+    assert cache.get('c').payload == 3
+
+def test_entries_expire_after_ttl_but_are_kept():
+    cache = ResponseCache(ttl=30)
+    with patch(CLOCK, return_value=100.0):
+        cache.put('tree', 'W/"1"', {'nodes': []})
+        cache.put('short', None, 'x', ttl=5)
+    with patch(CLOCK, return_value=110.0):
+        assert cache.get('tree').fresh
+        assert not cache.get('short').fresh
+    with patch(CLOCK, return_value=131.0):
+        entry = cache.get('tree')
+        assert not entry.fresh
+        # Stale entries stay so their ETag can be revalidated
+        assert entry.etag == 'W/"1"'
+
+def test_refresh_keeps_the_etag_and_extends_freshness():
+    cache = ResponseCache(ttl=30)
+    with patch(CLOCK, return_value=100.0):
+        cache.put('tree', 'W/"1"', {'nodes': []})
+    with patch(CLOCK, return_value=200.0):
+        entry = cache.refresh('tree')
+        assert entry.fresh
+        assert entry.etag == 'W/"1"'
+        assert entry.payload == {'nodes': []}
+    assert cache.refresh('missing') is None
+
+def test_invalidate_and_clear():
+    cache = ResponseCache(ttl=30)
+    cache.put('a', None, 1)
+    cache.put('b', None, 2)
+    cache.invalidate('a')
+    assert cache.get('a') is None
+    cache.clear()
+    assert cache.get('b') is None
@@ -0,0 +1,117 @@
+import base64
+import orjson
+import pytest
+import requests
+import time
+from argocd_mcp_server.scripts import fetch_argocd_token
+from argocd_mcp_server.scripts.fetch_argocd_token import (
+    ArgoCDTokenFetcher,
+    AsyncArgoCDTokenFetcher,
+    store_cached_token,
+)
+from unittest.mock import MagicMock, patch
+
+
+SERVER_URL = 'https://argocd.example.com'
+APPS = [{'metadata': {'name': 'guestbook'}}]
+
+def make_token(subject):
+    claims = base64.urlsafe_b64encode(orjson.dumps({'sub': subject, 'exp': time.time() + 3600}))
+    return f"header.{claims.decode().rstrip('=')}.signature"
+
+def auth_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+@pytest.fixture
+def token_cache(tmp_path):
+    with patch.object(fetch_argocd_token, 'TOKEN_CACHE_PATH', tmp_path / 'token.json'):
+        yield tmp_path / 'token.json'
+
+@pytest.fixture
+def fetcher():
+    with ArgoCDTokenFetcher(SERVER_URL, 'admin', 'password') as fetcher:
+        yield fetcher
+
+def test_rejected_cached_token_is_evicted_and_renewed(token_cache, fetcher):
+    stale, fresh = make_token('stale'), make_token('fresh')
+    store_cached_token(SERVER_URL, 'admin', stale)
+    login = MagicMock(status_code=200, content=orjson.dumps({'token': fresh}))
+    with patch.object(fetcher.session, 'post', return_value=login) as mock_post, \
+            patch.object(fetcher, 'list_applications', side_effect=[auth_error(401), APPS]), \
+            patch.object(fetcher, 'get_applications', return_value=[APPS[0]]):
+        result = fetcher.perform_sanity_check()
+    assert result['token_valid']
+    assert mock_post.call_count == 1
+    assert fetcher.token == fresh
+    assert orjson.loads(token_cache.read_bytes())['token'] == fresh
+
+def test_rejected_fresh_token_is_not_retried(token_cache, fetcher):
+    login = MagicMock(status_code=200, content=orjson.dumps({'token': make_token('fresh')}))
+    with patch.object(fetcher.session, 'post', return_value=login) as mock_post, \
+            patch.object(fetcher, 'list_applications', side_effect=auth_error(403)) as mock_list:
+        result = fetcher.perform_sanity_check()
+    assert not result['token_valid']
+    assert result['error'] == 'Token validation failed'
+    assert mock_post.call_count == 1
+    assert mock_list.call_count == 1
+
+def test_bulk_get_of_several_names_fetches_each_instead_of_listing(fetcher):
+    fetcher.token = 'test-token'
+    details = {'guestbook': APPS[0], 'helm-guestbook': {'metadata': {'name': 'helm-guestbook'}}}
+    with patch.object(fetcher, 'get_application', side_effect=lambda name: details.get(name, {})), \
+            patch.object(fetcher.session, 'get') as mock_get:
+        result = fetcher.get_applications_bulk(['guestbook', 'helm-guestbook', 'missing'])
+    mock_get.assert_not_called()
+    assert result == details
+
+def test_bulk_get_of_one_name_filters_the_listing(fetcher):
+    fetcher.token = 'test-token'
+    listing = MagicMock(status_code=200, content=orjson.dumps({'items': APPS}))
+    with patch.object(fetcher.session, 'get', return_value=listing) as mock_get:
+        result = fetcher.get_applications_bulk(['guestbook'], project='default')
+    assert mock_get.call_args.kwargs['params'] == {'name': 'guestbook', 'project': 'default'}
+    assert result == {'guestbook': APPS[0]}
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return orjson.dumps(self.body)
+
+@pytest.mark.asyncio
+async def test_async_writes_clear_the_listing_cache():
+    fetcher = AsyncArgoCDTokenFetcher(SERVER_URL, 'admin', 'password')
+    fetcher.token = make_token('admin')
+    session = MagicMock(post=MagicMock(return_value=FakeResponse(APPS[0])),
+                        delete=MagicMock(return_value=FakeResponse({})))
+    with patch.object(fetcher, '_get_session', return_value=session):
+        fetcher._list_cache.put('apps', None, APPS)
+        assert await fetcher.create_application(APPS[0]) == APPS[0]
+        assert fetcher._list_cache.get('apps') is None
+        fetcher._list_cache.put('apps', None, APPS)
+        assert await fetcher.delete_applications(['guestbook', 'other'], cascade=False) == [True, True]
+        assert fetcher._list_cache.get('apps') is None
+    assert session.delete.call_args.kwargs['params'] == {'cascade': 'false'}
+
+def test_main_runs_the_async_sanity_check(monkeypatch):
+    monkeypatch.setenv('ARGOCD_SERVER', SERVER_URL)
+    monkeypatch.setenv('ARGOCD_USERNAME', 'admin')
+    monkeypatch.setenv('ARGOCD_PASSWORD', 'password')
+    sanity = {'token_valid': True, 'applications_count': 1, 'error': None, 'sample_application': None}
+    with patch.object(AsyncArgoCDTokenFetcher, 'fetch_token', return_value=make_token('admin')), \
+            patch.object(AsyncArgoCDTokenFetcher, 'perform_sanity_check', return_value=sanity), \
+            pytest.raises(SystemExit) as exit_info:
+        fetch_argocd_token.main()
+    assert exit_info.value.code == 0
@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+import time
+from argocd_mcp_server.utils.flow_control import (
+    AdaptiveLimiter,
+    CircuitOpenError,
+    SingleFlight,
+    TokenBucket,
+    get_rate_limiter,
+)
+
+
+def test_limiter_halves_on_error_and_grows_additively():
+    limiter = AdaptiveLimiter(max_limit=8, latency_target=1.0)
+    limiter.on_error()
+    limiter.on_error()
+    assert limiter.limit == 2
+    # Grows by half a slot per healthy response
+    limiter.on_success(0.1)
+    assert limiter.limit == 2
+    limiter.on_success(0.1)
+    assert limiter.limit == 3
+
+def test_limiter_stays_within_bounds():
+    limiter = AdaptiveLimiter(max_limit=4, min_limit=2, failure_threshold=100)
+    for _ in range(5):
+        limiter.on_error()
+    assert limiter.limit == 2
+    for _ in range(10):
+        limiter.on_success(0.1)
+    assert limiter.limit == 4
+
+def test_limiter_does_not_grow_while_latency_is_over_target():
+    limiter = AdaptiveLimiter(max_limit=8, latency_target=1.0)
+    limiter.on_error()
+    limiter.on_success(5.0)
+    limiter.on_success(5.0)
+    assert limiter.limit == 4
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrent_slots():
+    limiter = AdaptiveLimiter(max_limit=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_errors_and_closes_later():
+    limiter = AdaptiveLimiter(max_limit=4, failure_threshold=3, open_seconds=0.05)
+    limiter.on_error()
+    limiter.on_error()
+    # A healthy response in between resets the streak
+    limiter.on_success(0.1)
+    limiter.on_error()
+    limiter.on_error()
+    async with limiter.slot():
+        pass
+    limiter.on_error()
+    with pytest.raises(CircuitOpenError):
+        await limiter.acquire()
+    await asyncio.sleep(0.06)
+    async with limiter.slot():
+        pass
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests_after_the_burst():
+    bucket = TokenBucket(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.04
+    # Two more tokens refill at 20 per second
+    for _ in range(2):
+        async with bucket:
+            pass
+    assert time.monotonic() - started >= 0.09
+
+def test_rate_limiter_is_shared_per_host():
+    first = get_rate_limiter('https://argocd.example.com/api', 20)
+    assert get_rate_limiter('https://argocd.example.com', 5) is first
+    assert get_rate_limiter('https://other.example.com', 20) is not first
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {'items': []}
+
+    results = await asyncio.gather(*(flight.do('key', fetch) for _ in range(3)))
+    assert calls == 1
+    assert results == [{'items': []}] * 3
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_the_error():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    results = await asyncio.gather(flight.do('key', fail), flight.do('key', fail), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+@pytest.mark.asyncio
+async def test_single_flight_follower_reruns_the_call_when_the_leader_is_cancelled():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    leader = asyncio.create_task(flight.do('key', fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do('key', fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == 2
+    assert leader.cancelled()
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_follower_leaves_the_call_running():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return 'done'
+
+    leader = asyncio.create_task(flight.do('key', fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do('key', fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+    assert await leader == 'done'
+    with pytest.raises(asyncio.CancelledError):
+        await follower
@@ -0,0 +1,56 @@
+from argocd_mcp_server.models.application import (
+    ApplicationMetadata,
+    ApplicationModel,
+    ApplicationSpec,
+    PrunePolicy,
+)
+from argocd_mcp_server.models.resource import GetResourceTreeResponse
+from argocd_mcp_server.server import create_server
+
+
+TRUSTED_APP = {
+    'metadata': {'name': 'guestbook', 'namespace': 'argocd', 'project': 'default', 'labels': {'team': 'web'}},
+    'spec': {
+        'source': {'repo_url': 'https://github.com/argoproj/argocd-example-apps', 'path': 'guestbook'},
+        'destination': {'server': 'https://kubernetes.default.svc', 'namespace': 'default'},
+        'project': 'default',
+        'sync_policy': {'automated': {'prune': True}, 'prune_propagation_policy': 'background'},
+    },
+}
+
+def test_from_trusted_maps_the_prune_policy_and_dumps():
+    app = ApplicationModel.from_trusted(TRUSTED_APP)
+    assert app.spec.sync_policy.prune_propagation_policy is PrunePolicy.BACKGROUND
+    dumped = app.model_dump()
+    assert dumped['spec']['sync_policy']['prune_propagation_policy'] == 'background'
+    assert dumped['metadata']['labels'] == {'team': 'web'}
+
+def test_from_trusted_defaults_the_prune_policy():
+    data = {**TRUSTED_APP, 'spec': {**TRUSTED_APP['spec'], 'sync_policy': {'sync_options': ['PruneLast=true']}}}
+    dumped = ApplicationModel.from_trusted(data).model_dump()
+    assert dumped['spec']['sync_policy']['prune_propagation_policy'] == 'foreground'
+
+TREE_NODES = [
+    {'uid': 'd1', 'kind': 'Deployment', 'name': 'guestbook-ui'},
+    {'uid': 'r1', 'kind': 'ReplicaSet', 'name': 'guestbook-ui-5d8', 'parent_uid': 'd1'},
+    {'uid': 'p1', 'kind': 'Pod', 'name': 'guestbook-ui-5d8-abc', 'parent_uid': 'r1'},
+    {'uid': 's1', 'kind': 'Service', 'name': 'guestbook-ui'},
+]
+
+def test_resource_tree_is_indexed_on_every_construction_path():
+    for tree in (
+        GetResourceTreeResponse.ok(TREE_NODES),
+        GetResourceTreeResponse(nodes=TREE_NODES),
+        GetResourceTreeResponse.model_validate({'nodes': TREE_NODES}),
+    ):
+        assert tree.parent_index == [-1, 0, 1, -1]
+        assert tree.children_of(-1) == [0, 3]
+        assert tree.children_of(1) == [2]
+
+def test_server_attaches_schema_examples():
+    create_server()
+    schema = ApplicationMetadata.model_json_schema()
+    assert schema['example']['name'] == 'guestbook'
+    # Parents are rebuilt so nested models carry their examples too
+    spec_schema = ApplicationSpec.model_json_schema()
+    assert spec_schema['$defs']['ApplicationSource']['example']['path'] == 'guestbook'
@@ -0,0 +1,149 @@
+import asyncio
+import dataclasses
+import pytest
+import pytest_asyncio
+from argocd_mcp_server.core.tools import argocd_resource_handler
+from argocd_mcp_server.core.tools.argocd_resource_handler import ArgoCDResourceHandler
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+TREE = {'nodes': [{'uid': 'u1', 'kind': 'Deployment', 'name': 'guestbook-ui'}]}
+
+@pytest.fixture
+def mock_context():
+    ctx = MagicMock()
+    ctx.request_id = 'test-request-id'
+    ctx.client_id = 'test-user'
+    return ctx
+
+@pytest_asyncio.fixture
+async def handler():
+    handler = ArgoCDResourceHandler(
+        MagicMock(), token='test-token', server_url='https://argocd.example.com'
+    )
+    yield handler
+    await handler.close()
+
+def patch_api(method, api):
+    # _API_CALLS holds the helper functions themselves, so patch the registry entry
+    call = argocd_resource_handler._API_CALLS[method]
+    return patch.dict(argocd_resource_handler._API_CALLS, {method: dataclasses.replace(call, api=api)})
+
+async def manage(handler, ctx, operation, **overrides):
+    # Tool arguments default to pydantic Field objects, so every one is passed explicitly
+    args = {
+        'application_name': 'guestbook',
+        'resource_name': None,
+        'resource_kind': None,
+        'namespace': None,
+        'uid': None,
+        'tail_lines': 100,
+        'container': None,
+        'since_seconds': None,
+        'since_time': None,
+        'follow': None,
+        'revision': None,
+        'action_name': None,
+        'action_params': None,
+    }
+    args.update(overrides)
+    return await handler.manage_resource(operation=operation, ctx=ctx, **args)
+
+@pytest.mark.asyncio
+async def test_get_resource_tree_success(handler, mock_context):
+    with patch_api('get_resource_tree', AsyncMock(return_value=TREE)):
+        result = await manage(handler, mock_context, 'get_resource_tree')
+    assert result['success']
+    assert result['data'] == TREE
+
+@pytest.mark.asyncio
+async def test_read_ignores_undeclared_dict_argument(handler, mock_context):
+    # action_params is a dict the tree request doesn't declare; it must not reach the coalescing key
+    with patch_api('get_resource_tree', AsyncMock(return_value=TREE)):
+        result = await manage(
+            handler, mock_context, 'get_resource_tree', uid='u1', action_params={'a': 1}
+        )
+    assert result['success']
+    assert result['data'] == TREE
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_call(handler, mock_context):
+    release = asyncio.Event()
+
+    async def slow_tree(*args, **kwargs):
+        await release.wait()
+        return TREE
+
+    api = AsyncMock(side_effect=slow_tree)
+    with patch_api('get_resource_tree', api):
+        # uid differs but the tree request drops it, so both calls share one key
+        first = asyncio.create_task(manage(handler, mock_context, 'get_resource_tree', uid='a'))
+        second = asyncio.create_task(manage(handler, mock_context, 'get_resource_tree', uid='b'))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+    assert api.await_count == 1
+    assert all(result['success'] for result in results)
+
+@pytest.mark.asyncio
+async def test_write_operation_requires_allow_write(handler, mock_context):
+    result = await manage(
+        handler, mock_context, 'run_resource_action',
+        resource_name='guestbook-ui', resource_kind='Deployment', action_name='restart',
+    )
+    assert not result['success']
+    assert result['status_code'] == 403
+
+@pytest.mark.asyncio
+async def test_overview_admits_each_sub_request(handler, mock_context):
+    events = AsyncMock(return_value={'items': []})
+    actions = AsyncMock(return_value={'actions': []})
+    with patch_api('get_resource_events', events), patch_api('get_resource_actions', actions), \
+            patch.object(handler._limiter, 'slot', wraps=handler._limiter.slot) as slot:
+        result = await manage(
+            handler, mock_context, 'get_resource_overview',
+            resource_name='guestbook-ui', resource_kind='Deployment',
+        )
+    assert result['success']
+    assert result['data']['events']['data'] == {'items': []}
+    assert result['data']['actions']['data'] == {'actions': []}
+    # One slot per ArgoCD request, none held by the overview itself
+    assert slot.call_count == 2
+
+@pytest.mark.asyncio
+async def test_events_bulk_fetches_events_per_matching_resource(handler, mock_context):
+    tree = {'nodes': [
+        {'uid': 'p1', 'kind': 'Pod', 'name': 'guestbook-ui-1', 'namespace': 'default'},
+        {'uid': 'p2', 'kind': 'Pod', 'name': 'guestbook-ui-2', 'namespace': 'default'},
+        {'uid': 's1', 'kind': 'Service', 'name': 'guestbook-ui', 'namespace': 'default'},
+    ]}
+
+    async def events_for(server_url, token, app, name, kind, **kwargs):
+        return {'items': [{'involvedObject': {'name': name}}]}
+
+    events = AsyncMock(side_effect=events_for)
+    with patch_api('get_resource_tree', AsyncMock(return_value=tree)), \
+            patch_api('get_resource_events', events), \
+            patch.object(handler._limiter, 'slot', wraps=handler._limiter.slot) as slot:
+        result = await manage(handler, mock_context, 'get_resource_events_bulk', resource_kind='Pod')
+    assert result['success']
+    assert [entry['name'] for entry in result['data']] == ['guestbook-ui-1', 'guestbook-ui-2']
+    assert result['data'][1]['events']['data'] == {'items': [{'involvedObject': {'name': 'guestbook-ui-2'}}]}
+    assert events.await_count == 2
+    # The tree and both event lookups are each admitted through the limiter
+    assert slot.call_count == 3
+
+@pytest.mark.asyncio
+async def test_application_bundle_admits_each_part(handler, mock_context):
+    manifest = AsyncMock(return_value={'manifests': []})
+    with patch_api('get_resource_tree', AsyncMock(return_value=TREE)), \
+            patch_api('get_managed_resources', AsyncMock(return_value={'items': []})), \
+            patch_api('get_application_manifest', manifest), \
+            patch_api('get_application_parameters', AsyncMock(return_value={'parameters': []})), \
+            patch.object(handler._limiter, 'slot', wraps=handler._limiter.slot) as slot:
+        result = await manage(handler, mock_context, 'get_application_bundle', revision='v2')
+    assert result['success']
+    assert result['data']['tree']['data'] == TREE
+    assert result['data']['params']['data'] == {'parameters': []}
+    assert manifest.await_args.kwargs['revision'] == 'v2'
+    assert slot.call_count == 4
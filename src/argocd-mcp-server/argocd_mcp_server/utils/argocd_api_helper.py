@@ -1,13 +1,21 @@
 import aiohttp
-from typing import Optional, Dict, Any, List, Union, Tuple
-import json
-from loguru import logger
-import urllib3
-from argocd_mcp_server.utils.logger import log_error, log_info
+import asyncio
+import orjson
+import os
+import re
+import ssl
 from aiohttp import ClientResponseError
-
-# Disable SSL verification warnings when bypass_tls is True
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from aiohttp.resolver import AsyncResolver
+from argocd_mcp_server.utils.cache import ResponseCache
+from argocd_mcp_server.utils.flow_control import SingleFlight
+from argocd_mcp_server.utils.logger import log_debug, log_error, log_info, log_warning
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from loguru import logger
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple, TypedDict
+from yarl import URL
 
 
 # Constants
@@ -16,16 +24,30 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_TAIL_LINES = 100
 MAX_RETRIES = 3
 CACHE_TTL = 300  # 5 minutes
+# Full response bodies are only logged when explicitly asked for; they can be megabytes
+LOG_RAW_RESPONSES = os.environ.get("ARGOCD_MCP_LOG_RAW") == "1"
+
+# Connection pool settings for long-lived sessions
+POOL_LIMIT = int(os.environ.get("ARGOCD_POOL_LIMIT", "64"))
+POOL_LIMIT_PER_HOST = int(os.environ.get("ARGOCD_POOL_LIMIT_PER_HOST", "32"))
+KEEPALIVE_TIMEOUT = 75  # seconds an idle connection is kept open for reuse
+CONNECT_TIMEOUT = 5  # seconds to obtain a pooled connection or open a new one
+READ_TIMEOUT = DEFAULT_TIMEOUT  # seconds to wait between bytes of a response
+# Pooled sessions have no total timeout, so followed log streams are cut off here instead
+LOG_FOLLOW_DEADLINE = float(os.environ.get("ARGOCD_LOG_FOLLOW_DEADLINE", "60"))
+DNS_CACHE_TTL = 300  # seconds a resolved ArgoCD host address is reused
 
 # HTTP Status Codes
 HTTP_STATUS = {
     "OK": 200,
     "CREATED": 201,
     "NO_CONTENT": 204,
+    "NOT_MODIFIED": 304,
     "BAD_REQUEST": 400,
     "UNAUTHORIZED": 401,
     "FORBIDDEN": 403,
     "NOT_FOUND": 404,
+    "CONFLICT": 409,
     "SERVER_ERROR": 500
 }
 
@@ -44,8 +66,109 @@ ERROR_MESSAGES = {
     "SERVER_ERROR": "Server error occurred"
 }
 
-# Response cache
-_response_cache = {}
+# Client-facing messages the tool handlers report for well-known ArgoCD API statuses,
+# formatted with the application name as {app}
+STATUS_MESSAGES = {
+    404: "Application {app} not found",
+    403: "Access forbidden: permission denied for application {app}",
+    401: "Authentication failed: invalid token",
+}
+
+# Messages validate_response reports in place of the server's error for these statuses
+_STATUS_ERRMSG = {
+    401: "Authentication failed: invalid or expired token",
+    403: "Access forbidden: permission denied",
+    404: "Resource not found",
+}
+
+# Message templates handle_api_error fills with the resource path and the server's error
+_STATUS_ERROR_TEMPLATES = {
+    400: "Invalid request: {error}",
+    401: "Authentication failed: Invalid or expired token",
+    403: "Access forbidden: You don't have permission to access {resource}",
+    404: "Resource not found: {resource} does not exist",
+}
+
+# Response cache for cached_api_call: entries expire after CACHE_TTL and the
+# least recently used are evicted, so memory stays bounded
+_response_cache = ResponseCache(ttl=CACHE_TTL, max_entries=1024)
+# Concurrent misses for the same key share one fetch
+_response_inflight = SingleFlight()
+
+# Shapes of the hot read endpoints' payloads, so callers see which keys ArgoCD returns.
+# They stay plain dicts at runtime; the parsed models live in argocd_mcp_server.models
+class ResourceTree(TypedDict, total=False):
+    nodes: List[Dict[str, Any]]
+    orphanedNodes: List[Dict[str, Any]]
+
+class ManagedResources(TypedDict, total=False):
+    items: List[Dict[str, Any]]
+
+# Pooled sessions for callers that don't bring their own, one per TLS mode
+_SESSIONS: Dict[bool, aiohttp.ClientSession] = {}
+
+# A full commit SHA pins content that can never change
+_COMMIT_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+
+# Headers sent with every JSON API call, merged with the token once per token
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=16)
+def _bearer_headers(token: str) -> Mapping[str, str]:
+    """Get the read-only headers of an authenticated call, built once per token."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+@lru_cache(maxsize=16)
+def _auth_headers(token: str) -> Mapping[str, str]:
+    """Get the read-only headers of an authenticated JSON API call, built once per token."""
+    return MappingProxyType({**_JSON_HEADERS, **_bearer_headers(token)})
+
+
+def _request_body(data: Optional[Dict[str, Any]], body: Optional[bytes]) -> Dict[str, Any]:
+    """Build the aiohttp body kwargs, preferring an already-encoded payload."""
+    if body is not None:
+        return {"data": body}
+    # Encoded with orjson rather than aiohttp's stdlib-json `json=` path
+    if data is not None:
+        return {"data": orjson.dumps(data)}
+    return {}
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with orjson; an empty body decodes to None."""
+    body = await response.read()
+    return orjson.loads(body) if body.strip() else None
+
+
+async def _error_message(response: aiohttp.ClientResponse) -> str:
+    """
+    Extract the error message of a failed response, reading its body once.
+
+    The body is parsed as JSON straight from bytes and only decoded as UTF-8
+    text when it is not JSON, so no charset detection runs on the error path.
+    """
+    body = await response.read()
+    error_json = None
+    # Only JSON bodies are parsed, so HTML error pages never raise and unwind a decode error
+    if response.content_type == "application/json":
+        try:
+            error_json = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    # The body is only decoded as text when it carries no usable "error" field
+    if isinstance(error_json, dict) and error_json.get("error"):
+        return error_json["error"]
+    return body.decode("utf-8", errors="replace")
+
+
+def _payload_for_log(data: Optional[Dict[str, Any]], body: Optional[bytes]) -> str:
+    """Render a request payload for logging without re-encoding pre-encoded bodies."""
+    if body is not None:
+        return body.decode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
 def validate_request_params(token: str, server_url: str) -> None:
     """
@@ -73,22 +196,18 @@ async def validate_response(response: aiohttp.ClientResponse) -> None:
     """Validate the API response."""
     if not response.ok:
         error_msg = f"HTTP {response.status}: {response.reason}"
-        try:
-            error_data = await response.json()
-            if isinstance(error_data, dict):
-                error_msg = error_data.get("error", error_msg)
-        except:
-            pass
+        if response.content_type == "application/json":
+            try:
+                error_data = await _read_json(response)
+                if isinstance(error_data, dict):
+                    error_msg = error_data.get("error", error_msg)
+            except (orjson.JSONDecodeError, aiohttp.ClientError):
+                pass
         
-        if response.status == 403:
-            error_msg = "Access forbidden: permission denied"
-        elif response.status == 401:
-            error_msg = "Authentication failed: invalid or expired token"
-        elif response.status == 404:
-            error_msg = "Resource not found"
+        error_msg = _STATUS_ERRMSG.get(response.status, error_msg)
         
         log_error(
-            f"API request failed: {error_msg}",
+            "API request failed: {error}",
             tool="argocd_api",
             request_id="unknown",
             user="unknown",
@@ -97,11 +216,174 @@ async def validate_response(response: aiohttp.ClientResponse) -> None:
         )
         raise aiohttp.ClientError(error_msg, status=response.status)
 
+@lru_cache(maxsize=2)
+def _ssl_context(bypass_tls: bool) -> ssl.SSLContext:
+    """
+    Get the process-wide SSL context for a TLS mode.
+    
+    Every connector shares it, so the CA store is loaded once and TLS session
+    tickets issued by the ArgoCD server can be resumed across connections.
+    
+    Args:
+        bypass_tls (bool): Whether to bypass TLS verification
+        
+    Returns:
+        ssl.SSLContext: The shared context
+    """
+    context = ssl.create_default_context()
+    if bypass_tls:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+@lru_cache(maxsize=None)
+def _applications_url(server_url: str) -> URL:
+    """Parse a server's applications endpoint once; callers extend it with path segments."""
+    return URL(server_url) / "api/v1/applications"
+
+def _resolver() -> Optional[AsyncResolver]:
+    """
+    Build a non-blocking c-ares resolver when aiodns is installed.
+    
+    Returns:
+        AsyncResolver: Resolver for a connector, or None to keep aiohttp's threaded default
+    """
+    try:
+        # Uses the system's configured nameservers, so internal ArgoCD hostnames still resolve
+        return AsyncResolver()
+    except RuntimeError:
+        # aiodns is not installed
+        return None
+
 async def create_session(bypass_tls: bool = False) -> aiohttp.ClientSession:
     """Create an aiohttp client session with appropriate SSL settings."""
-    if bypass_tls:
-        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False))
-    return aiohttp.ClientSession()
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            ssl=_ssl_context(bypass_tls), ttl_dns_cache=DNS_CACHE_TTL, resolver=_resolver()
+        )
+    )
+
+def create_pooled_session(
+    bypass_tls: bool = False,
+    trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+) -> aiohttp.ClientSession:
+    """
+    Create a long-lived aiohttp session with connection pooling and keep-alive.
+    
+    Reusing one session across calls keeps TCP/TLS connections to the ArgoCD
+    server warm instead of paying a fresh handshake per request. Connect and
+    read timeouts are bounded separately so a saturated pool or a stalled
+    server fails fast, while long streamed responses are not cut off.
+    
+    Args:
+        bypass_tls (bool): Whether to bypass TLS verification
+        trace_configs (List[aiohttp.TraceConfig], optional): Request hooks, e.g. for backpressure feedback
+        
+    Returns:
+        aiohttp.ClientSession: Pooled session; the caller owns closing it
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            resolver=_resolver(),
+            ssl=_ssl_context(bypass_tls),
+        ),
+        timeout=aiohttp.ClientTimeout(
+            total=None,
+            connect=CONNECT_TIMEOUT,
+            sock_read=READ_TIMEOUT,
+        ),
+        trace_configs=trace_configs,
+        # aiohttp advertises every encoding it can decode (gzip/deflate, plus br when
+        # Brotli is installed) and inflates responses transparently; kept explicit so
+        # large tree and manifest responses always travel compressed
+        auto_decompress=True,
+    )
+
+class SharedSession:
+    """
+    One pooled session shared by every handler talking to the same ArgoCD server.
+
+    The session is created lazily on the running event loop, so handlers can be
+    wired up before the server starts. Handlers register their request hooks
+    up front and all of them reuse the same warm TCP/TLS connections.
+    """
+
+    def __init__(self, bypass_tls: bool = False):
+        """
+        Initialize the shared session holder.
+
+        Args:
+            bypass_tls (bool): Whether to bypass TLS verification
+        """
+        self.bypass_tls = bypass_tls
+        self._trace_configs: List[aiohttp.TraceConfig] = []
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def add_trace_config(self, trace_config: aiohttp.TraceConfig) -> None:
+        """
+        Attach a request hook to the session; must be called before the session is opened.
+
+        Args:
+            trace_config (aiohttp.TraceConfig): Request hooks, e.g. for backpressure feedback
+        """
+        if self._session is not None:
+            raise RuntimeError("Trace configs must be added before the shared session is opened")
+        self._trace_configs.append(trace_config)
+
+    def get(self) -> aiohttp.ClientSession:
+        """Get the pooled session, opening it on first use or after it was closed."""
+        if self._session is None or self._session.closed:
+            self._session = create_pooled_session(self.bypass_tls, trace_configs=self._trace_configs)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+def _get_session(bypass_tls: bool = False) -> aiohttp.ClientSession:
+    """
+    Get the module-level pooled session for a TLS mode, opening it on first use.
+    
+    Args:
+        bypass_tls (bool): Whether to bypass TLS verification
+        
+    Returns:
+        aiohttp.ClientSession: Pooled session shared by every caller without its own
+    """
+    session = _SESSIONS.get(bypass_tls)
+    if session is None or session.closed:
+        session = _SESSIONS[bypass_tls] = create_pooled_session(bypass_tls)
+    return session
+
+async def close_sessions() -> None:
+    """Close the module-level pooled sessions. Called on MCP server shutdown."""
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    for session in sessions:
+        if not session.closed:
+            await session.close()
+
+@asynccontextmanager
+async def session_scope(
+    session: Optional[aiohttp.ClientSession],
+    bypass_tls: bool = False,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Yield the caller's session, or the module-level pooled one for its TLS mode.
+    
+    Neither is closed on exit, so connections stay warm across calls.
+    
+    Args:
+        session: Long-lived session owned by the caller, if any
+        bypass_tls: Whether to bypass TLS verification when the pooled session is used
+    """
+    yield session if session is not None else _get_session(bypass_tls)
 
 async def handle_api_error(e: ClientResponseError, tool: str, resource: str) -> None:
     """
@@ -118,15 +400,11 @@ async def handle_api_error(e: ClientResponseError, tool: str, resource: str) ->
     # Try to get the response body for more detailed error information
     try:
         if hasattr(e, 'response') and e.response:
-            error_text = await e.response.text()
-            try:
-                error_json = await e.response.json()
-                error_msg = error_json.get("error", error_text)
-            except:
-                error_msg = error_text
+            error_msg = await _error_message(e.response)
         else:
             error_msg = message
-    except:
+    except aiohttp.ClientError:
+        # The body could not be read, e.g. the connection was already released
         error_msg = message
     
     # Check if this is a 403 error for a non-existent application
@@ -135,17 +413,11 @@ async def handle_api_error(e: ClientResponseError, tool: str, resource: str) ->
         app_name = resource.split('/')[-1]
         error_msg = f"Application not found: '{app_name}' does not exist"
         status = 404  # Override status to 404
-    elif status == 403:
-        error_msg = f"Access forbidden: You don't have permission to access {resource}"
-    elif status == 404:
-        error_msg = f"Resource not found: {resource} does not exist"
-    elif status == 401:
-        error_msg = "Authentication failed: Invalid or expired token"
-    elif status == 400:
-        error_msg = f"Invalid request: {error_msg}"
+    elif status in _STATUS_ERROR_TEMPLATES:
+        error_msg = _STATUS_ERROR_TEMPLATES[status].format(resource=resource, error=error_msg)
     
     log_error(
-        error_msg,
+        "{error}",
         tool=tool,
         error=error_msg,
         resource=resource,
@@ -159,46 +431,116 @@ async def handle_api_error(e: ClientResponseError, tool: str, resource: str) ->
         headers=e.headers
     )
 
+async def _request(
+    method: str,
+    path: str,
+    token: str,
+    server_url: str,
+    tool: str,
+    data: Optional[Dict[str, Any]] = None,
+    body: Optional[bytes] = None,
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Make an authenticated JSON request to the ArgoCD API.
+    
+    Shared by the write helpers, which differ only in method and payload.
+    
+    Args:
+        method (str): HTTP method
+        path (str): API endpoint path
+        token (str): ArgoCD API token
+        server_url (str): ArgoCD server URL
+        tool (str): Name of the public helper, used when reporting errors
+        data (dict, optional): Request payload, JSON-encoded by the client
+        body (bytes, optional): Pre-encoded JSON payload, sent as-is instead of data
+        bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        
+    Returns:
+        dict: API response data or None if request failed
+    """
+    try:
+        async with session_scope(session, bypass_tls) as session:
+            async with session.request(
+                method,
+                f"{server_url}{path}",
+                headers=_auth_headers(token),
+                **_request_body(data, body),
+            ) as response:
+                response.raise_for_status()
+                return await _read_json(response)
+    except aiohttp.ClientError as e:
+        await handle_api_error(e, tool, path)
+    except Exception as e:
+        log_error(
+            "Unexpected error: {error}",
+            tool=tool,
+            error=str(e),
+            resource=path,
+        )
+
 async def argocd_api_get(
     path: str,
     token: str,
     server_url: str,
     params: Optional[Dict[str, Any]] = None,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    cache_ttl: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Make a GET request to the ArgoCD API.
     
+    When a cache is given, fresh entries are served without a request and stale
+    ones are revalidated with If-None-Match, so an unchanged resource costs a 304.
+    
     Args:
         path (str): API endpoint path
         token (str): ArgoCD API token
         server_url (str): ArgoCD server URL
         params (dict, optional): Query parameters
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        cache (ResponseCache, optional): Cache for conditional requests
+        cache_ttl (float, optional): Freshness override for this response; defaults to the cache TTL
         
     Returns:
         dict: API response data or None if request failed
     """
+    cache_key = (server_url, path, tuple(sorted(params.items())) if params else ())
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None and cached.fresh:
+        logger.debug("Cache hit: {}{}", server_url, path)
+        return cached.payload
+
+    headers = _auth_headers(token)
+    if cached is not None and cached.etag:
+        headers = {**headers, "If-None-Match": cached.etag}
+
     try:
-        session = await create_session(bypass_tls)
-        try:
+        async with session_scope(session, bypass_tls) as session:
             async with session.get(
                 f"{server_url}{path}",
-                headers={"Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
+                headers=headers,
                 params=params,
             ) as response:
+                if response.status == HTTP_STATUS["NOT_MODIFIED"] and cached is not None:
+                    cache.refresh(cache_key, cache_ttl)
+                    logger.debug("Not modified: {}{}", server_url, path)
+                    return cached.payload
+
                 if not response.ok:
-                    error_text = await response.text()
-                    try:
-                        error_json = await response.json()
-                        error_msg = error_json.get("error", error_text)
-                    except:
-                        error_msg = error_text
+                    error_msg = await _error_message(response)
                     
-                    logger.error(f"API request failed: {response.status} - {error_msg}")
-                    logger.error(f"Request URL: {server_url}{path}")
+                    logger.error("API request failed: {} - {}", response.status, error_msg)
+                    logger.error("Request URL: {}{}", server_url, path)
+
+                    # The resource is gone or being replaced; don't revalidate the old copy later
+                    if cache is not None and response.status in (HTTP_STATUS["NOT_FOUND"], HTTP_STATUS["CONFLICT"]):
+                        cache.invalidate(cache_key)
                     
                     raise ClientResponseError(
                         request_info=response.request_info,
@@ -208,17 +550,17 @@ async def argocd_api_get(
                         headers=response.headers
                     )
                 
-                response_data = await response.json()
-                logger.info(f"GET request successful: {server_url}{path}")
-                logger.debug(f"Response data: {json.dumps(response_data, indent=2)}")
+                response_data = await _read_json(response)
+                if cache is not None:
+                    cache.put(cache_key, response.headers.get("ETag"), response_data, cache_ttl)
+                logger.info("GET request successful: {}{}", server_url, path)
+                logger.opt(lazy=True).debug("Response data: {}", lambda: orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
                 return response_data
-        finally:
-            await session.close()
     except aiohttp.ClientError as e:
         await handle_api_error(e, "argocd_api_get", path)
     except Exception as e:
         log_error(
-            f"Unexpected error: {str(e)}",
+            "Unexpected error: {error}",
             tool="argocd_api_get",
             error=str(e),
             resource=path,
@@ -228,8 +570,10 @@ async def argocd_api_post(
     path: str,
     token: str,
     server_url: str,
-    data: Dict[str, Any],
+    data: Optional[Dict[str, Any]] = None,
     bypass_tls: bool = False,
+    body: Optional[bytes] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Make a POST request to the ArgoCD API.
@@ -238,39 +582,32 @@ async def argocd_api_post(
         path (str): API endpoint path
         token (str): ArgoCD API token
         server_url (str): ArgoCD server URL
-        data (dict): Request payload
+        data (dict, optional): Request payload, JSON-encoded by the client
         bypass_tls (bool): Whether to bypass TLS verification
+        body (bytes, optional): Pre-encoded JSON payload, sent as-is instead of data
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: API response data or None if request failed
     """
     try:
         # Log the request details for debugging
-        logger.info(f"Starting POST request to {server_url}{path}")
-        logger.debug(f"Request payload: {json.dumps(data, indent=2)}")
-        logger.debug(f"Bypass TLS: {bypass_tls}")
+        logger.info("Starting POST request to {}{}", server_url, path)
+        logger.opt(lazy=True).debug("Request payload: {}", lambda: _payload_for_log(data, body))
+        logger.debug("Bypass TLS: {}", bypass_tls)
 
-        session = await create_session(bypass_tls)
-        try:
+        async with session_scope(session, bypass_tls) as session:
             async with session.post(
                 f"{server_url}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                json=data,
+                headers=_auth_headers(token),
+                **_request_body(data, body),
             ) as response:
                 if not response.ok:
-                    error_text = await response.text()
-                    try:
-                        error_json = await response.json()
-                        error_msg = error_json.get("error", error_text)
-                    except:
-                        error_msg = error_text
+                    error_msg = await _error_message(response)
                     
-                    logger.error(f"API request failed: {response.status} - {error_msg}")
-                    logger.error(f"Request URL: {server_url}{path}")
-                    logger.error(f"Request payload: {json.dumps(data, indent=2)}")
+                    logger.error("API request failed: {} - {}", response.status, error_msg)
+                    logger.error("Request URL: {}{}", server_url, path)
+                    logger.error("Request payload: {}", _payload_for_log(data, body))
                     
                     raise ClientResponseError(
                         request_info=response.request_info,
@@ -280,23 +617,21 @@ async def argocd_api_post(
                         headers=response.headers
                     )
                 
-                response_data = await response.json()
-                logger.info(f"POST request successful: {server_url}{path}")
-                logger.debug(f"Response data: {json.dumps(response_data, indent=2)}")
+                response_data = await _read_json(response)
+                logger.info("POST request successful: {}{}", server_url, path)
+                logger.opt(lazy=True).debug("Response data: {}", lambda: orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
                 return response_data
-        finally:
-            await session.close()
     except aiohttp.ClientError as e:
-        logger.error(f"Client error in POST request: {str(e)}")
+        logger.error("Client error in POST request: {}", e)
         await handle_api_error(e, "argocd_api_post", path)
     except Exception as e:
-        logger.error(f"Unexpected error in POST request: {str(e)}")
+        logger.error("Unexpected error in POST request: {}", e)
         log_error(
-            f"Unexpected error: {str(e)}",
+            "Unexpected error: {error}",
             tool="argocd_api_post",
             error=str(e),
             resource=path,
-            payload=data
+            payload=data if body is None else body.decode("utf-8")
         )
 
 
@@ -306,6 +641,7 @@ async def argocd_api_post_sync(
     server_url: str,
     data: Dict[str, Any],
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Make a POST request to sync an ArgoCD application.
@@ -316,41 +652,24 @@ async def argocd_api_post_sync(
         server_url (str): ArgoCD server URL
         data (dict): Request payload
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: API response data or None if request failed
     """
-    try:
-        session = await create_session(bypass_tls)
-        try:
-            async with session.post(
-                f"{server_url}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                json=data,
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        finally:
-            await session.close()
-    except aiohttp.ClientError as e:
-        await handle_api_error(e, "argocd_api_post_sync", path)
-    except Exception as e:
-        log_error(
-            f"Unexpected error: {str(e)}",
-            tool="argocd_api_post_sync",
-            error=str(e),
-            resource=path,
-        )
+    return await _request(
+        "POST", path, token, server_url, "argocd_api_post_sync",
+        data=data, bypass_tls=bypass_tls, session=session,
+    )
 
 async def argocd_api_put(
     path: str,
     token: str,
     server_url: str,
-    data: Dict[str, Any],
+    data: Optional[Dict[str, Any]] = None,
     bypass_tls: bool = False,
+    body: Optional[bytes] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Make a PUT request to the ArgoCD API.
@@ -359,42 +678,25 @@ async def argocd_api_put(
         path (str): API endpoint path
         token (str): ArgoCD API token
         server_url (str): ArgoCD server URL
-        data (dict): Request payload
+        data (dict, optional): Request payload, JSON-encoded by the client
         bypass_tls (bool): Whether to bypass TLS verification
+        body (bytes, optional): Pre-encoded JSON payload, sent as-is instead of data
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: API response data or None if request failed
     """
-    try:
-        session = await create_session(bypass_tls)
-        try:
-            async with session.put(
-                f"{server_url}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                json=data,
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        finally:
-            await session.close()
-    except aiohttp.ClientError as e:
-        await handle_api_error(e, "argocd_api_put", path)
-    except Exception as e:
-        log_error(
-            f"Unexpected error: {str(e)}",
-            tool="argocd_api_put",
-            error=str(e),
-            resource=path,
-        )
+    return await _request(
+        "PUT", path, token, server_url, "argocd_api_put",
+        data=data, body=body, bypass_tls=bypass_tls, session=session,
+    )
 
 async def argocd_api_delete(
     path: str,
     token: str,
     server_url: str,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Make a DELETE request to the ArgoCD API.
@@ -404,34 +706,15 @@ async def argocd_api_delete(
         token (str): ArgoCD API token
         server_url (str): ArgoCD server URL
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: API response data or None if request failed
     """
-    try:
-        session = await create_session(bypass_tls)
-        try:
-            async with session.delete(
-                f"{server_url}{path}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        finally:
-            await session.close()
-    except aiohttp.ClientError as e:
-        await handle_api_error(e, "argocd_api_delete", path)
-    except Exception as e:
-        log_error(
-            f"Unexpected error: {str(e)}",
-            tool="argocd_api_delete",
-            error=str(e),
-            resource=path,
-        )
-
+    return await _request(
+        "DELETE", path, token, server_url, "argocd_api_delete",
+        bypass_tls=bypass_tls, session=session,
+    )
 
 async def argocd_api_get_resource_tree(
     server_url: str,
@@ -439,7 +722,9 @@ async def argocd_api_get_resource_tree(
     application_name: str,
     namespace: Optional[str] = None,
     bypass_tls: bool = False,
-) -> Optional[Dict[str, Any]]:
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+) -> Optional[ResourceTree]:
     """
     Get the resource tree for an application.
     
@@ -449,12 +734,14 @@ async def argocd_api_get_resource_tree(
         application_name (str): Name of the application
         namespace (str, optional): Namespace of the application
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        cache (ResponseCache, optional): Cache for conditional requests
         
     Returns:
-        dict: Resource tree data or None if request failed
+        ResourceTree: Resource tree data or None if request failed
     """
     path = f"/api/v1/applications/{application_name}/resource-tree"
-    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls)
+    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls, session=session, cache=cache)
 
 async def argocd_api_get_managed_resources(
     server_url: str,
@@ -462,7 +749,9 @@ async def argocd_api_get_managed_resources(
     application_name: str,
     namespace: Optional[str] = None,
     bypass_tls: bool = False,
-) -> Optional[Dict[str, Any]]:
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+) -> Optional[ManagedResources]:
     """
     Get managed resources for an application.
     
@@ -472,14 +761,33 @@ async def argocd_api_get_managed_resources(
         application_name (str): Name of the application
         namespace (str, optional): Namespace of the application
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        cache (ResponseCache, optional): Cache for conditional requests
         
     Returns:
-        dict: List of managed resources or None if request failed
+        ManagedResources: List of managed resources or None if request failed
     """
     path = f"/api/v1/applications/{application_name}/managed-resources"
-    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls)
+    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls, session=session, cache=cache)
 
-async def argocd_api_get_workload_logs(
+async def _iter_log_entries(response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Any]]:
+    """Decode a JSON Lines log stream one entry at a time, stopping at the end marker."""
+    async for line in response.content:
+        line = line.strip()
+        if not line:
+            continue
+        entry = orjson.loads(line).get("result", {})
+        # The server terminates the stream with an empty marker entry
+        if entry.get("last") and not entry.get("content"):
+            break
+        yield entry
+
+async def _drain(entries: AsyncIterator[Dict[str, Any]], logs: deque) -> None:
+    """Append streamed log entries to a buffer until the stream ends."""
+    async for entry in entries:
+        logs.append(entry)
+
+async def argocd_api_stream_workload_logs(
     server_url: str,
     token: str,
     application_name: str,
@@ -491,101 +799,225 @@ async def argocd_api_get_workload_logs(
     since_seconds: Optional[int] = None,
     since_time: Optional[str] = None,
     follow: Optional[bool] = False,
-    bypass_tls: bool = False
-) -> Dict[str, Any]:
-    """Get workload logs for a specific resource in an ArgoCD application."""
-    try:
-        # Log the parameters being sent
-        log_info(
-            f"Getting workload logs with parameters:",
-            tool="argocd_api_get_workload_logs",
-            params={
-                "application_name": application_name,
-                "resource_name": resource_name,
-                "resource_kind": resource_kind,
-                "namespace": namespace,
-                "tail_lines": tail_lines,
-                "container": container,
-                "since_seconds": since_seconds,
-                "since_time": since_time,
-                "follow": follow
-            }
-        )
-
-        # Prepare query parameters
-        params = {
-            "resourceName": resource_name,
-            "resourceKind": resource_kind,
-            "tailLines": tail_lines,
-            "follow": follow
-        }
-        if namespace:
-            params["namespace"] = namespace
-        if container:
-            params["container"] = container
-        if since_seconds:
-            params["sinceSeconds"] = since_seconds
-        if since_time:
-            params["sinceTime"] = since_time
-
-        # Construct the URL
-        url = f"{server_url}/api/v1/applications/{application_name}/logs"
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream workload log entries as ArgoCD sends them.
+    
+    The logs endpoint answers with one JSON object per line, so entries are
+    decoded as they arrive instead of buffering the whole body.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        token (str): ArgoCD API token
+        application_name (str): Name of the application
+        resource_name (str): Name of the resource
+        resource_kind (str): Kind of the resource
+        namespace (str, optional): Namespace of the resource
+        tail_lines (int, optional): Number of trailing lines to request
+        container (str, optional): Container to read logs from
+        since_seconds (int, optional): Only return logs newer than this many seconds
+        since_time (str, optional): Only return logs newer than this RFC3339 timestamp
+        follow (bool, optional): Keep the stream open for new log lines
+        bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
-        # Log the full request URL
-        log_info(
-            f"Making request to URL: {url}",
-            tool="argocd_api_get_workload_logs",
-            params=params
-        )
+    Yields:
+        dict: Log entry with content, timeStamp and podName
+        
+    Raises:
+        ClientResponseError: If the API responds with an error status
+    """
+    params = {
+        "resourceName": resource_name,
+        "kind": resource_kind,
+        "follow": str(bool(follow)).lower(),
+    }
+    # yarl rejects None query values; leaving tailLines out lets the server return every line
+    if tail_lines is not None:
+        params["tailLines"] = tail_lines
+    if namespace:
+        params["namespace"] = namespace
+    if container:
+        params["container"] = container
+    if since_seconds:
+        params["sinceSeconds"] = since_seconds
+    if since_time:
+        params["sinceTime"] = since_time
 
-        # Make the request
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                params=params,
-                headers={"Authorization": f"Bearer {token}"},
-                ssl=not bypass_tls
-            ) as response:
-                # Log the response status
-                log_info(
-                    f"Response status: {response.status}",
-                    tool="argocd_api_get_workload_logs"
+    # A ready yarl URL skips aiohttp's per-call string parsing and query encoding
+    url = (_applications_url(server_url) / application_name / "logs").with_query(params)
+    log_info(
+        "Streaming workload logs from URL: {url}",
+        tool="argocd_api_stream_workload_logs",
+        url=url,
+        params=params
+    )
+
+    async with session_scope(session, bypass_tls) as session:
+        async with session.get(
+            url,
+            headers=_bearer_headers(token),
+            ssl=not bypass_tls
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                log_error(
+                    "API request failed with status {status_code}: {error}",
+                    tool="argocd_api_stream_workload_logs",
+                    error=error_text,
+                    status_code=response.status
+                )
+                raise ClientResponseError(
+                    request_info=response.request_info,
+                    history=response.history,
+                    status=response.status,
+                    message=error_text,
+                    headers=response.headers
                 )
 
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        # Log the raw response
-                        log_info(
-                            f"Raw API response:",
-                            tool="argocd_api_get_workload_logs",
-                            response=data
-                        )
-                        return data
-                    except Exception as e:
-                        log_error(
-                            f"Failed to parse response as JSON: {str(e)}",
-                            tool="argocd_api_get_workload_logs",
-                            error=str(e)
-                        )
-                        return None
-                else:
-                    error_text = await response.text()
-                    log_error(
-                        f"API request failed with status {response.status}: {error_text}",
-                        tool="argocd_api_get_workload_logs",
-                        error=error_text
-                    )
-                    return None
+            async for entry in _iter_log_entries(response):
+                yield entry
 
+async def argocd_api_get_workload_logs(
+    server_url: str,
+    token: str,
+    application_name: str,
+    resource_name: str,
+    resource_kind: str,
+    namespace: Optional[str] = None,
+    tail_lines: Optional[int] = 100,
+    container: Optional[str] = None,
+    since_seconds: Optional[int] = None,
+    since_time: Optional[str] = None,
+    follow: Optional[bool] = False,
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Get workload logs for a specific resource in an ArgoCD application.
+    
+    Entries are streamed into a deque bounded by tail_lines, so memory stays
+    proportional to the requested tail regardless of how much the server sends.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        token (str): ArgoCD API token
+        application_name (str): Name of the application
+        resource_name (str): Name of the resource
+        resource_kind (str): Kind of the resource
+        namespace (str, optional): Namespace of the resource
+        tail_lines (int, optional): Number of trailing lines to return
+        container (str, optional): Container to read logs from
+        since_seconds (int, optional): Only return logs newer than this many seconds
+        since_time (str, optional): Only return logs newer than this RFC3339 timestamp
+        follow (bool, optional): Keep reading new lines for up to LOG_FOLLOW_DEADLINE seconds
+        bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        
+    Returns:
+        dict: Log entries under "logs", or None if the request failed. Entries received
+            before the follow deadline or a stalled read are still returned
+    """
+    logs = deque(maxlen=tail_lines or DEFAULT_TAIL_LINES)
+    entries = argocd_api_stream_workload_logs(
+        server_url,
+        token,
+        application_name,
+        resource_name,
+        resource_kind,
+        namespace=namespace,
+        tail_lines=tail_lines,
+        container=container,
+        since_seconds=since_seconds,
+        since_time=since_time,
+        follow=follow,
+        bypass_tls=bypass_tls,
+        session=session,
+    )
+    try:
+        # A followed stream never ends on its own; cancelling the read closes the response
+        await asyncio.wait_for(_drain(entries, logs), LOG_FOLLOW_DEADLINE if follow else None)
+    except ClientResponseError:
+        raise
+    except asyncio.TimeoutError as e:
+        # Either the follow deadline passed or the server stopped sending (sock_read timeout)
+        if not logs and not follow:
+            log_error(
+                "Error in {tool}: {error}",
+                tool="argocd_api_get_workload_logs",
+                error=str(e) or type(e).__name__,
+                resource=f"{application_name}/{resource_name}"
+            )
+            return None
+        log_warning(
+            "Stopped reading logs after a timeout; returning {line_count} buffered lines",
+            tool="argocd_api_get_workload_logs",
+            line_count=len(logs),
+            resource=f"{application_name}/{resource_name}"
+        )
     except Exception as e:
         log_error(
-            f"Error in argocd_api_get_workload_logs: {str(e)}",
+            "Error in {tool}: {error}",
             tool="argocd_api_get_workload_logs",
             error=str(e)
         )
         return None
 
+    log_info(
+        "Retrieved {line_count} log lines",
+        tool="argocd_api_get_workload_logs",
+        line_count=len(logs),
+        resource=f"{application_name}/{resource_name}"
+    )
+    return {"logs": list(logs)}
+
+async def argocd_api_stream_pod_logs(
+    server_url: str,
+    token: str,
+    application_name: str,
+    pod_name: str,
+    tail_lines: Optional[int] = 100,
+    follow: bool = False,
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream log entries of a specific pod as ArgoCD sends them.
+    
+    Args:
+        server_url (str): ArgoCD server URL
+        token (str): ArgoCD API token
+        application_name (str): Name of the application
+        pod_name (str): Name of the pod
+        tail_lines (int, optional): Number of trailing lines to request
+        follow (bool): Keep the stream open for new log lines
+        bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        
+    Yields:
+        dict: Log entry with content, timeStamp and podName
+        
+    Raises:
+        ClientResponseError: If the API responds with an error status
+    """
+    params = {"follow": str(follow).lower()}
+    # yarl rejects None query values; leaving tailLines out lets the server return every line
+    if tail_lines is not None:
+        params["tailLines"] = tail_lines
+    url = (_applications_url(server_url) / application_name / "pods" / pod_name / "logs").with_query(params)
+
+    async with session_scope(session, bypass_tls) as session:
+        async with session.get(
+            url,
+            headers=_bearer_headers(token),
+            ssl=not bypass_tls
+        ) as response:
+            response.raise_for_status()
+            async for entry in _iter_log_entries(response):
+                yield entry
+
 async def argocd_api_get_pod_logs(
     server_url: str,
     token: str,
@@ -593,10 +1025,14 @@ async def argocd_api_get_pod_logs(
     pod_name: str,
     tail_lines: Optional[int] = 100,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Get logs for a specific pod in an ArgoCD application.
     
+    The body is one JSON object per line, so entries are streamed into a deque
+    bounded by tail_lines rather than decoded as a single document.
+    
     Args:
         server_url (str): ArgoCD server URL
         token (str): ArgoCD API token
@@ -604,34 +1040,31 @@ async def argocd_api_get_pod_logs(
         pod_name (str): Name of the pod
         tail_lines (int, optional): Number of log lines to retrieve
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
-        Optional[Dict[str, Any]]: The pod logs or None if the request fails
+        Optional[Dict[str, Any]]: Log entries under "logs", or None if the request fails
     """
+    logs = deque(maxlen=tail_lines or DEFAULT_TAIL_LINES)
     try:
-        url = f"{server_url}/api/v1/applications/{application_name}/pods/{pod_name}/logs"
-        params = {
-            "follow": False,
-            "tailLines": tail_lines
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                params=params,
-                headers={"Authorization": f"Bearer {token}"},
-                ssl=not bypass_tls
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+        async for entry in argocd_api_stream_pod_logs(
+            server_url,
+            token,
+            application_name,
+            pod_name,
+            tail_lines=tail_lines,
+            bypass_tls=bypass_tls,
+            session=session,
+        ):
+            logs.append(entry)
     except Exception as e:
         log_error(
-            f"Error in argocd_api_get_pod_logs: {str(e)}",
+            "Error in {tool}: {error}",
             tool="argocd_api_get_pod_logs",
             error=str(e)
         )
         return None
+    return {"logs": list(logs)}
 
 async def argocd_api_get_resource_events(
     server_url: str,
@@ -640,13 +1073,14 @@ async def argocd_api_get_resource_events(
     resource_name: str,
     resource_kind: str,
     namespace: Optional[str] = None,
-    bypass_tls: bool = False
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Dict[str, Any]:
     """Get events for a specific resource in an ArgoCD application."""
     try:
         # Log the parameters being sent
         log_info(
-            f"Getting resource events with parameters:",
+            "Getting resource events with parameters:",
             tool="argocd_api_get_resource_events",
             params={
                 "application_name": application_name,
@@ -665,42 +1099,50 @@ async def argocd_api_get_resource_events(
             params["namespace"] = namespace
 
         # Construct the URL
-        url = f"{server_url}/api/v1/applications/{application_name}/events"
+        url = (_applications_url(server_url) / application_name / "events").with_query(params)
         
         # Log the full request URL
         log_info(
-            f"Making request to URL: {url}",
+            "Making request to URL: {url}",
             tool="argocd_api_get_resource_events",
+            url=url,
             params=params
         )
 
         # Make the request
-        async with aiohttp.ClientSession() as session:
+        async with session_scope(session, bypass_tls) as session:
             async with session.get(
                 url,
-                params=params,
-                headers={"Authorization": f"Bearer {token}"},
+                headers=_bearer_headers(token),
                 ssl=not bypass_tls
             ) as response:
                 # Log the response status
                 log_info(
-                    f"Response status: {response.status}",
-                    tool="argocd_api_get_resource_events"
+                    "Response status: {status_code}",
+                    tool="argocd_api_get_resource_events",
+                    status_code=response.status
                 )
 
                 if response.status == 200:
                     try:
-                        data = await response.json()
-                        # Log the raw response
+                        data = await _read_json(response)
+                        items = data.get("items") if isinstance(data, dict) else None
                         log_info(
-                            f"Raw API response:",
+                            "API response received",
                             tool="argocd_api_get_resource_events",
-                            response=data
+                            resource=application_name,
+                            item_count=len(items) if items is not None else None
                         )
+                        if LOG_RAW_RESPONSES:
+                            log_debug(
+                                "Raw API response:",
+                                tool="argocd_api_get_resource_events",
+                                response=data
+                            )
                         return data
-                    except Exception as e:
+                    except orjson.JSONDecodeError as e:
                         log_error(
-                            f"Failed to parse response as JSON: {str(e)}",
+                            "Failed to parse response as JSON: {error}",
                             tool="argocd_api_get_resource_events",
                             error=str(e)
                         )
@@ -708,15 +1150,16 @@ async def argocd_api_get_resource_events(
                 else:
                     error_text = await response.text()
                     log_error(
-                        f"API request failed with status {response.status}: {error_text}",
+                        "API request failed with status {status_code}: {error}",
                         tool="argocd_api_get_resource_events",
-                        error=error_text
+                        error=error_text,
+                        status_code=response.status
                     )
                     return None
 
     except Exception as e:
         log_error(
-            f"Error in argocd_api_get_resource_events: {str(e)}",
+            "Error in {tool}: {error}",
             tool="argocd_api_get_resource_events",
             error=str(e)
         )
@@ -730,6 +1173,7 @@ async def argocd_api_get_resource_actions(
     resource_kind: str,
     namespace: Optional[str] = None,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Get available actions for a resource.
@@ -742,6 +1186,7 @@ async def argocd_api_get_resource_actions(
         resource_kind (str): Kind of the resource
         namespace (str, optional): Namespace of the resource
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: List of actions or None if request failed
@@ -753,7 +1198,16 @@ async def argocd_api_get_resource_actions(
     }
     if namespace:
         params["namespace"] = namespace
-    return await argocd_api_get(path, token, server_url, params=params, bypass_tls=bypass_tls)
+    return await argocd_api_get(path, token, server_url, params=params, bypass_tls=bypass_tls, session=session)
+
+@lru_cache(maxsize=256)
+def _action_envelope(resource_kind: str, action_name: str, namespace: Optional[str]) -> bytes:
+    """Encode the fields a resource action shares across resources, leaving the object open."""
+    envelope = {"resourceKind": resource_kind, "action": action_name}
+    if namespace:
+        envelope["namespace"] = namespace
+    # Drop the closing brace so the per-resource fields can be appended
+    return orjson.dumps(envelope)[:-1]
 
 async def argocd_api_run_resource_action(
     server_url: str,
@@ -765,6 +1219,7 @@ async def argocd_api_run_resource_action(
     params: Optional[Dict[str, Any]] = None,
     namespace: Optional[str] = None,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Run an action on a resource.
@@ -779,21 +1234,18 @@ async def argocd_api_run_resource_action(
         params (dict, optional): Action parameters
         namespace (str, optional): Namespace of the resource
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
         
     Returns:
         dict: Action result or None if request failed
     """
     path = f"/api/v1/applications/{application_name}/resource/actions"
-    data = {
-        "resourceName": resource_name,
-        "resourceKind": resource_kind,
-        "action": action_name
-    }
+    # Running one action across many resources reuses the encoded envelope
+    body = _action_envelope(resource_kind, action_name, namespace) + b',"resourceName":' + orjson.dumps(resource_name)
     if params:
-        data["params"] = params
-    if namespace:
-        data["namespace"] = namespace
-    return await argocd_api_post(path, token, server_url, data, bypass_tls=bypass_tls)
+        body += b',"params":' + orjson.dumps(params)
+    body += b"}"
+    return await argocd_api_post(path, token, server_url, body=body, bypass_tls=bypass_tls, session=session)
 
 async def argocd_api_get_application_manifest(
     server_url: str,
@@ -801,6 +1253,8 @@ async def argocd_api_get_application_manifest(
     application_name: str,
     revision: Optional[str] = None,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Get the manifest for an application.
@@ -811,6 +1265,8 @@ async def argocd_api_get_application_manifest(
         application_name (str): Name of the application
         revision (str, optional): Revision to get manifest for
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        cache (ResponseCache, optional): Cache for conditional requests
         
     Returns:
         dict: Manifest data or None if request failed
@@ -819,13 +1275,20 @@ async def argocd_api_get_application_manifest(
     params = {}
     if revision:
         params["revision"] = revision
-    return await argocd_api_get(path, token, server_url, params=params, bypass_tls=bypass_tls)
+    # Manifests rendered at a commit SHA are immutable; branches and tags are not
+    cache_ttl = float("inf") if revision and _COMMIT_SHA.match(revision) else None
+    return await argocd_api_get(
+        path, token, server_url, params=params, bypass_tls=bypass_tls,
+        session=session, cache=cache, cache_ttl=cache_ttl,
+    )
 
 async def argocd_api_get_application_parameters(
     server_url: str,
     token: str,
     application_name: str,
     bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Get parameters for an application.
@@ -835,45 +1298,73 @@ async def argocd_api_get_application_parameters(
         token (str): ArgoCD API token
         application_name (str): Name of the application
         bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Pooled session to reuse instead of a per-call one
+        cache (ResponseCache, optional): Cache for conditional requests
         
     Returns:
         dict: Parameters data or None if request failed
     """
     path = f"/api/v1/applications/{application_name}/parameters"
-    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls)
+    return await argocd_api_get(path, token, server_url, bypass_tls=bypass_tls, session=session, cache=cache)
 
 async def cached_api_call(
     url: str,
     headers: Tuple[Tuple[str, str], ...],
-    params: Optional[Tuple[Tuple[str, str], ...]] = None
+    params: Optional[Tuple[Tuple[str, str], ...]] = None,
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> Dict[str, Any]:
     """
     Make a cached API call.
     
+    Expired entries are revalidated with If-None-Match when the server sent an
+    ETag, so an unchanged response costs a 304 instead of the full body.
+    
     Args:
         url (str): API endpoint URL
         headers (Tuple[Tuple[str, str], ...]): Request headers
         params (Optional[Tuple[Tuple[str, str], ...]]): Query parameters
+        bypass_tls (bool): Whether to bypass TLS verification
+        session (aiohttp.ClientSession, optional): Long-lived session to reuse
         
     Returns:
         Dict[str, Any]: Cached response data
     """
-    cache_key = f"{url}:{headers}:{params}"
+    cache_key = (url, headers, params)
     logger.debug("Checking cache for key: {}", cache_key)
     
-    if cache_key in _response_cache:
+    cached = _response_cache.get(cache_key)
+    if cached is not None and cached.fresh:
         logger.debug("Cache hit for key: {}", cache_key)
-        return _response_cache[cache_key]
+        return cached.payload
     
     logger.debug("Cache miss for key: {}", cache_key)
-    async with create_session() as session:
+    return await _response_inflight.do(cache_key, lambda: _fetch_and_cache(cache_key, bypass_tls, session))
+
+async def _fetch_and_cache(
+    cache_key: Tuple[str, Tuple[Tuple[str, str], ...], Optional[Tuple[Tuple[str, str], ...]]],
+    bypass_tls: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, Any]:
+    """Fetch a response for cached_api_call and store it under its key, revalidating a stale copy."""
+    url, headers, params = cache_key
+    request_headers = dict(headers)
+    stale = _response_cache.get(cache_key)
+    if stale is not None and stale.etag:
+        request_headers["If-None-Match"] = stale.etag
+    async with session_scope(session, bypass_tls) as session:
         async with session.get(
             url,
-            headers=dict(headers),
-            params=dict(params) if params else None
+            headers=request_headers,
+            params=dict(params) if params else None,
+            ssl=not bypass_tls
         ) as resp:
+            if resp.status == HTTP_STATUS["NOT_MODIFIED"] and stale is not None:
+                _response_cache.refresh(cache_key)
+                logger.debug("Not modified: {}", cache_key)
+                return stale.payload
             await validate_response(resp)
-            data = await resp.json()
-            _response_cache[cache_key] = data
+            data = await _read_json(resp)
+            _response_cache.put(cache_key, resp.headers.get("ETag"), data)
             logger.debug("Cached response for key: {}", cache_key)
             return data
@@ -0,0 +1,94 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+
+# Seconds the handlers' shared listing cache serves an entry before revalidating it
+LISTING_CACHE_TTL = float(os.environ.get("ARGOCD_CACHE_TTL", "30"))
+
+
+class CacheEntry(NamedTuple):
+    """A cached API response together with its validator."""
+    expires_at: float
+    etag: Optional[str]
+    payload: Any
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the server."""
+        return self.expires_at > time.monotonic()
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of API responses with a per-entry TTL.
+    Stale entries are kept so their ETag can be revalidated with If-None-Match.
+    """
+    def __init__(self, ttl: float, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Default seconds an entry stays fresh
+            max_entries (int): Maximum number of entries before the least recently used is evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry, fresh or stale.
+
+        Args:
+            key (Hashable): Cache key
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if absent
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, etag: Optional[str], payload: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a response.
+
+        Args:
+            key (Hashable): Cache key
+            etag (str, optional): ETag returned by the server
+            payload (Any): Decoded response body
+            ttl (float, optional): Seconds the entry stays fresh; defaults to the cache TTL
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = CacheEntry(expires_at, etag, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, ttl: Optional[float] = None) -> Optional[CacheEntry]:
+        """
+        Extend an entry's freshness after the server confirmed it unchanged (304).
+
+        Args:
+            key (Hashable): Cache key
+            ttl (float, optional): Seconds the entry stays fresh; defaults to the cache TTL
+
+        Returns:
+            Optional[CacheEntry]: The refreshed entry, or None if absent
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.put(key, entry.etag, entry.payload, ttl)
+        return self._entries[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
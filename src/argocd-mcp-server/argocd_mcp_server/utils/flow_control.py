@@ -0,0 +1,278 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional
+from urllib.parse import urlparse
+import aiohttp
+from argocd_mcp_server.utils.logger import log_warning
+
+
+# Responses that signal the ArgoCD API server is overloaded
+THROTTLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker rejects a call without contacting ArgoCD."""
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter with a circuit breaker.
+    Shrinks the concurrency limit multiplicatively when ArgoCD reports overload
+    (429/5xx, connection failures) and grows it additively while latency stays
+    under target, keeping callers within the server's capacity envelope.
+    """
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_target: float = 2.0,
+        window: int = 20,
+        failure_threshold: int = 5,
+        open_seconds: float = 30.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_limit (int): Upper bound (and starting value) for concurrent calls
+            min_limit (int): Lower bound for concurrent calls
+            latency_target (float): Mean latency in seconds under which the limit may grow
+            window (int): Number of recent latencies used for the mean
+            failure_threshold (int): Consecutive overload errors before the circuit opens
+            open_seconds (float): How long the circuit stays open before retrying
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.latency_target = latency_target
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._limit = float(self.max_limit)
+        self._in_flight = 0
+        self._latencies = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._pause_until = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot under the current limit.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+        """
+        if time.monotonic() < self._open_until:
+            raise CircuitOpenError("ArgoCD API circuit is open after repeated overload errors; retry later")
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """Release a slot, first honoring any Retry-After pause requested by the server."""
+        delay = self._pause_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def on_success(self, latency: float) -> None:
+        """
+        Record a healthy response and grow the limit additively.
+
+        Args:
+            latency (float): Request latency in seconds
+        """
+        self._consecutive_failures = 0
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) <= self.latency_target:
+            self._limit = min(float(self.max_limit), self._limit + 0.5)
+
+    def on_error(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record an overload signal and shrink the limit multiplicatively.
+
+        Args:
+            retry_after (float, optional): Seconds the server asked us to back off
+        """
+        self._limit = max(float(self.min_limit), self._limit * 0.5)
+        self._consecutive_failures += 1
+        now = time.monotonic()
+        if retry_after:
+            self._pause_until = max(self._pause_until, now + retry_after)
+        if self._consecutive_failures >= self.failure_threshold:
+            self._open_until = now + self.open_seconds
+            log_warning(
+                "Opening ArgoCD API circuit after repeated overload errors",
+                tool="adaptive_limiter",
+                consecutive_failures=self._consecutive_failures,
+                open_seconds=self.open_seconds,
+            )
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an aiohttp trace config that feeds response outcomes into the limiter.
+
+        Returns:
+            aiohttp.TraceConfig: Trace config to attach to a client session
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params) -> None:
+            ctx.started = time.monotonic()
+
+        async def on_request_end(session, ctx, params) -> None:
+            status = params.response.status
+            if status in THROTTLE_STATUSES:
+                self.on_error(_parse_retry_after(params.response.headers.get("Retry-After")))
+            else:
+                self.on_success(time.monotonic() - ctx.started)
+
+        async def on_request_exception(session, ctx, params) -> None:
+            if isinstance(params.exception, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                self.on_error()
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter capping requests per second.
+    Orthogonal to AdaptiveLimiter: that caps parallelism, this caps request rate.
+    """
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            burst (int, optional): Bucket capacity; defaults to one second worth of tokens
+        """
+        self.rate = max(rate, 0.001)
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so only one reaches the server.
+    Callers arriving while a call for the same key is in flight await its result;
+    if the caller running it is cancelled, one of them runs the call again instead.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn, or join the in-flight call for the same key.
+
+        Args:
+            key (Hashable): Identity of the call
+            fn (Callable[[], Awaitable[Any]]): Coroutine factory performing the call
+
+        Returns:
+            Any: The shared result
+        """
+        while key in self._calls:
+            future = self._calls[key]
+            try:
+                # Shield so a cancelled follower doesn't cancel the shared call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only the leader's cancellation cancels the future; followers then retry
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a call without followers doesn't log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+# One bucket per ArgoCD host so every handler talking to it shares the same budget
+_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(server_url: str, rate: float) -> TokenBucket:
+    """
+    Get the shared token bucket for an ArgoCD server host.
+
+    Args:
+        server_url (str): ArgoCD server URL
+        rate (float): Requests per second allowed against that host
+
+    Returns:
+        TokenBucket: Bucket keyed by the URL's host:port
+    """
+    host = urlparse(server_url).netloc or server_url
+    if host not in _RATE_LIMITERS:
+        _RATE_LIMITERS[host] = TokenBucket(rate)
+    return _RATE_LIMITERS[host]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP-date values are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -1,6 +1,8 @@
+import os
+import socket
 import sys
-import json
-from typing import Any, Dict, Optional
+import orjson
+from typing import Any, Callable, Dict, Optional
 from loguru import logger
 
 # Remove default logger
@@ -23,70 +25,122 @@ def serialize_record(record: Dict[str, Any]) -> str:
         if "extra" in record:
             log_data.update(record["extra"])
             
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str).decode()
     except Exception as e:
-        return json.dumps({
+        return orjson.dumps({
             "error": f"Failed to serialize log record: {str(e)}",
             "message": str(record.get("message", ""))
-        })
+        }).decode()
 
-# Configure logger with JSON format
+# Minimum level emitted by the sink below
+LOG_LEVEL = "INFO"
+
+# Configure logger with JSON format. enqueue=True hands records to a background
+# worker thread, so formatting and stdout writes never block the event loop
 logger.add(
     sys.stdout,
     format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="INFO",
-    serialize=False
+    level=LOG_LEVEL,
+    serialize=False,
+    enqueue=True
 )
 
+# Static context resolved once at import and bound a single time, instead of per record.
+# depth=1 attributes each record to the caller of the helper below, not to this module
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+_base = logger.bind(host=_HOSTNAME, pid=_PID).opt(depth=1)
+
+def is_enabled(level: str) -> bool:
+    """
+    Check whether messages at a level reach the configured sink.
+    
+    Args:
+        level: Loguru level name, e.g. "DEBUG"
+        
+    Returns:
+        bool: True if a message at this level would be emitted
+    """
+    return logger.level(level).no >= logger.level(LOG_LEVEL).no
+
+def _resolve_lazy(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Materialize context values passed as zero-argument callables."""
+    return {key: value() if callable(value) else value for key, value in kwargs.items()}
+
+def preview(value: Any, limit: int = 4096) -> Callable[[], str]:
+    """
+    Defer rendering a large payload for logging, truncated to a fixed size.
+    
+    Args:
+        value: The payload to render
+        limit: Maximum number of encoded bytes kept
+        
+    Returns:
+        Callable[[], str]: Zero-argument callable resolved only if the record is emitted
+    """
+    # Truncating the encoded bytes may split a multi-byte character; drop the partial tail
+    return lambda: orjson.dumps(value, default=str)[:limit].decode(errors="ignore")
+
 def log_tool_execution(message: str, **kwargs) -> None:
     """
     Log a tool execution event.
     
     Args:
-        message: The message to log
-        **kwargs: Additional context to include in the log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
+        **kwargs: Additional context to include in the log; callables are
+            only evaluated when the message is actually emitted
     """
-    logger.bind(event="tool_execution", **kwargs).info(message)
+    if not is_enabled("INFO"):
+        return
+    _base.info(message, event="tool_execution", **_resolve_lazy(kwargs))
 
 def log_success(message: str, **kwargs) -> None:
     """
     Log a success event.
     
     Args:
-        message: The message to log
-        **kwargs: Additional context to include in the log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
+        **kwargs: Additional context to include in the log; callables are
+            only evaluated when the message is actually emitted
     """
-    logger.bind(event="success", status="success", **kwargs).success(message)
+    if not is_enabled("SUCCESS"):
+        return
+    _base.success(message, **{"event": "success", "status": "success", **_resolve_lazy(kwargs)})
 
 def log_api_request(message: str, **kwargs) -> None:
     """
     Log an API request event.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         **kwargs: Additional context to include in the log
     """
-    logger.bind(event="api_request", **kwargs).info(message)
+    _base.info(message, event="api_request", **kwargs)
 
 def log_command_run(message: str, **kwargs) -> None:
     """
     Log a command run event.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         **kwargs: Additional context to include in the log
     """
-    logger.bind(event="command_run", **kwargs).info(message)
+    _base.info(message, event="command_run", **kwargs)
 
 def log_browsing(message: str, **kwargs) -> None:
     """
     Log a browsing event.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         **kwargs: Additional context to include in the log
     """
-    logger.bind(event="browsing", **kwargs).info(message)
+    _base.info(message, event="browsing", **kwargs)
 
 def log_info(
     message: str,
@@ -100,21 +154,25 @@ def log_info(
     Log an info message with additional context.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         tool: The tool being used
         resource: The resource being operated on
         status: The status of the operation
         event: The type of event
-        **kwargs: Additional context to include in the log
+        **kwargs: Additional context to include in the log; callables are
+            only evaluated when the message is actually emitted
     """
+    if not is_enabled("INFO"):
+        return
     extra = {
         "tool": tool,
         "resource": resource,
         "status": status,
         "event": event,
-        **kwargs
+        **_resolve_lazy(kwargs)
     }
-    logger.bind(**extra).info(message)
+    _base.info(message, **extra)
 
 def log_error(
     message: str,
@@ -129,7 +187,8 @@ def log_error(
     Log an error message with additional context.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         tool: The tool being used
         resource: The resource being operated on
         error: The error message or exception
@@ -137,6 +196,8 @@ def log_error(
         event: The type of event
         **kwargs: Additional context to include in the log
     """
+    if not is_enabled("ERROR"):
+        return
     extra = {
         "tool": tool,
         "resource": resource,
@@ -145,7 +206,7 @@ def log_error(
         "event": event,
         **kwargs
     }
-    logger.bind(**extra).error(message)
+    _base.error(message, **extra)
 
 def log_warning(
     message: str,
@@ -159,13 +220,16 @@ def log_warning(
     Log a warning message with additional context.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         tool: The tool being used
         resource: The resource being operated on
         status: The status of the operation
         event: The type of event
         **kwargs: Additional context to include in the log
     """
+    if not is_enabled("WARNING"):
+        return
     extra = {
         "tool": tool,
         "resource": resource,
@@ -173,7 +237,7 @@ def log_warning(
         "event": event,
         **kwargs
     }
-    logger.bind(**extra).warning(message)
+    _base.warning(message, **extra)
 
 def log_debug(
     message: str,
@@ -187,18 +251,22 @@ def log_debug(
     Log a debug message with additional context.
     
     Args:
-        message: The message to log
+        message: Message template; {name} fields are filled from the context
+            below, and only when the record is emitted
         tool: The tool being used
         resource: The resource being operated on
         status: The status of the operation
         event: The type of event
-        **kwargs: Additional context to include in the log
+        **kwargs: Additional context to include in the log; callables are
+            only evaluated when the message is actually emitted
     """
+    if not is_enabled("DEBUG"):
+        return
     extra = {
         "tool": tool,
         "resource": resource,
         "status": status,
         "event": event,
-        **kwargs
+        **_resolve_lazy(kwargs)
     }
-    logger.bind(**extra).debug(message)
+    _base.debug(message, **extra)
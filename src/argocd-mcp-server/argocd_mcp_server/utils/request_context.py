@@ -0,0 +1,39 @@
+from contextvars import ContextVar
+from typing import Dict, Optional
+from mcp.server.fastmcp import Context
+
+# Identity of the MCP request being served by the current asyncio task
+_request_ctx: ContextVar[Optional[Dict[str, str]]] = ContextVar("mcp_request", default=None)
+
+
+def bind_request_context(ctx: Optional[Context]) -> None:
+    """
+    Record the current MCP request's identity for logging.
+
+    FastMCP serves each request in its own task, so the value is isolated per
+    request and needs no explicit reset.
+
+    Args:
+        ctx (Context, optional): Context injected by FastMCP into the tool call
+    """
+    request_id, user = "unknown", "unknown"
+    if ctx is not None:
+        try:
+            request_id = str(ctx.request_id)
+            user = ctx.client_id or "unknown"
+        except ValueError:
+            # Called outside of an MCP request, e.g. directly from Python
+            pass
+    _request_ctx.set({"request_id": request_id, "user": user})
+
+
+def current_request_id() -> str:
+    """Get the ID of the MCP request being served, or 'unknown'."""
+    ctx = _request_ctx.get()
+    return ctx["request_id"] if ctx else "unknown"
+
+
+def current_user() -> str:
+    """Get the client of the MCP request being served, or 'unknown'."""
+    ctx = _request_ctx.get()
+    return ctx["user"] if ctx else "unknown"